@@ -1,8 +1,8 @@
 from importlib.metadata import version
 
-from alchemista.field import fields_from
+from alchemista.field import fields_from, fields_from_table
 from alchemista.main import sqlalchemy_to_pydantic
-from alchemista.model import model_from
+from alchemista.model import model_from, model_from_table
 
 __version__ = version(__package__)
-__all__ = ["fields_from", "model_from", "sqlalchemy_to_pydantic"]
+__all__ = ["fields_from", "fields_from_table", "model_from", "model_from_table", "sqlalchemy_to_pydantic"]
@@ -0,0 +1,32 @@
+"""Command line interface, e.g. `python -m alchemista profile myapp.db:Base`."""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from alchemista import profiling
+
+SORT_KEYS = ("seconds", "fields", "allocated", "peak", "class_size", "name")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m alchemista")
+    commands = parser.add_subparsers(dest="command", required=True)
+    profile = commands.add_parser("profile", help="Measure the generation of a model of each class mapped by a base")
+    profile.add_argument("base", help="Declarative base, e.g. `myapp.db:Base`")
+    profile.add_argument("--json", action="store_true", help="Output JSON instead of a table")
+    profile.add_argument("--sort", choices=SORT_KEYS, default="seconds", help="Sort by (descending, except `name`)")
+    profile.add_argument("--trusted", action="store_true", help="Generate trusted models")
+    profile.add_argument("--zero-copy", action="store_true", help="Generate zero-copy models")
+    args = parser.parse_args(argv)
+
+    base = profiling.import_object(args.base)
+    profiles = profiling.profile(profiling.db_models_of(base), trusted=args.trusted, zero_copy=args.zero_copy)
+    profiles.sort(key=lambda profile: getattr(profile, args.sort), reverse=args.sort != "name")
+    output = profiling.format_json(profiles) if args.json else profiling.format_table(profiles)
+    sys.stdout.write(output + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
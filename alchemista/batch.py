@@ -0,0 +1,186 @@
+"""Column-wise validation of many records at once against the constraints of a generated model."""
+
+import datetime as dt
+import enum
+import re
+from decimal import Decimal
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Type,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel, ValidationError
+from pydantic.fields import FieldInfo
+
+from alchemista import compat
+from alchemista.typing import Literal, is_optional, non_optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+# types whose values can be checked and used as they are, without Pydantic's validation (which could coerce them)
+_EXACT_TYPES = (bool, int, float, str, bytes, Decimal, dt.datetime, dt.date, dt.time, dt.timedelta)
+_MISSING = object()
+
+
+class BatchResult(NamedTuple):
+    instances: List[Optional[BaseModel]]
+    """One instance per record, or `None` if the record is invalid."""
+    errors: Dict[int, ValidationError]
+    """Validation errors by the index of the invalid record."""
+    masks: Dict[str, Any]
+    """Boolean array per field, telling which records failed a column-wise check of that field."""
+
+
+class _FieldCheck:  # pylint: disable=too-many-instance-attributes
+    def __init__(self, name: str, python_type: Any, field: FieldInfo) -> None:
+        constraints = compat.field_constraints(field)
+        self.name = name
+        self.required = compat.is_required(field)
+        # values other than the default of a `const` field are errors, which are left to Pydantic to report
+        self.const = field.default if compat.is_const(field) else _MISSING
+        self.nullable = is_optional(python_type)
+        python_type = non_optional(python_type)
+        self.exact_type: Optional[type] = None
+        self.choices: Optional[FrozenSet[Any]] = None
+        if get_origin(python_type) is Literal:
+            self.choices = frozenset(get_args(python_type))
+        elif python_type in _EXACT_TYPES or compat.lenient_issubclass(python_type, enum.Enum):
+            self.exact_type = python_type
+        self.any_type = python_type is Any
+        self.constraints = constraints
+        self.pattern = re.compile(constraints["regex"]) if "regex" in constraints else None
+
+    def check(self, values: Sequence[Any]) -> Any:
+        """Mask of the values that fail this check or need to go through Pydantic to be coerced."""
+        size = len(values)
+        missing = np.fromiter((value is _MISSING for value in values), dtype=bool, count=size)
+        none = np.fromiter((value is None for value in values), dtype=bool, count=size)
+        mask = missing & self.required
+        if not self.nullable:
+            mask |= none & ~missing
+        if self.any_type:
+            return mask
+        present = ~(missing | none)
+        if self.const is not _MISSING:
+            const = self.const
+            mask |= present & np.fromiter((value != const for value in values), dtype=bool, count=size)
+        if self.choices is not None:
+            choices = self.choices
+            valid = np.fromiter((isinstance(value, Hashable) and value in choices for value in values), dtype=bool)
+            return mask | (present & ~valid)
+        if self.exact_type is None:
+            # e.g. lists or nested models, which can only be validated by Pydantic
+            return mask | present
+        # not a comparison of arrays, since NumPy would treat an Enum class as a sequence of its members
+        exact_type = self.exact_type
+        # exact types, since Pydantic would coerce the values of subclasses (e.g. `bool` for `int`)
+        wrong_types = (type(value) is not exact_type for value in values)  # pylint: disable=unidiomatic-typecheck
+        mask |= present & np.fromiter(wrong_types, dtype=bool, count=size)
+        passed = present & ~mask
+        if not passed.any():
+            return mask
+        return mask | self._constraints_mask(values, passed)
+
+    def _constraints_mask(self, values: Sequence[Any], passed: Any) -> Any:
+        """Mask of the `passed` values (of the exact type) that fail the constraints of the field."""
+        mask = np.zeros(len(values), dtype=bool)
+        if "max_length" in self.constraints or "min_length" in self.constraints:
+            lengths = np.fromiter(
+                (len(value) if is_passed else 0 for value, is_passed in zip(values, passed)), dtype=np.int64
+            )
+            if "max_length" in self.constraints:
+                mask |= passed & (lengths > self.constraints["max_length"])
+            if "min_length" in self.constraints:
+                mask |= passed & (lengths < self.constraints["min_length"])
+        bounds = {
+            key: self.constraints[key] for key in ("ge", "gt", "le", "lt", "multiple_of") if key in self.constraints
+        }
+        if bounds and self.exact_type in (int, float):
+            numbers = np.where(
+                passed, np.array([value if is_passed else 0 for value, is_passed in zip(values, passed)]), 0
+            )
+            mask |= passed & _bounds_mask(numbers, bounds)
+        if self.pattern is not None and self.exact_type is str:
+            match: Callable[[str], Any] = self.pattern.match
+            mask |= passed & ~np.fromiter(
+                (bool(is_passed and match(value)) for value, is_passed in zip(values, passed)), dtype=bool
+            )
+        return mask
+
+
+def _bounds_mask(numbers: Any, bounds: Mapping[str, Any]) -> Any:
+    mask = np.zeros(len(numbers), dtype=bool)
+    if "ge" in bounds:
+        mask |= numbers < bounds["ge"]
+    if "gt" in bounds:
+        mask |= numbers <= bounds["gt"]
+    if "le" in bounds:
+        mask |= numbers > bounds["le"]
+    if "lt" in bounds:
+        mask |= numbers >= bounds["lt"]
+    if "multiple_of" in bounds:
+        mask |= np.mod(numbers, bounds["multiple_of"]) != 0
+    return mask
+
+
+class BatchValidator:
+    """Validates many records (mappings of field names to values) against `model` column by column.
+
+    Each constraint of the model (e.g. `max_length`, `ge` and `regex`) is checked across all values of a field at once,
+    with NumPy. Only the records that fail a check, or whose values would need to be coerced by Pydantic, are validated
+    by Pydantic; the others are constructed without validation. Without NumPy, all records are validated by Pydantic.
+    """
+
+    def __init__(self, model: Type[BaseModel]) -> None:
+        self.model = model
+        self._checks = [
+            _FieldCheck(name, python_type, field) for name, (python_type, field) in compat.model_fields(model).items()
+        ]
+        self._names: Set[str] = {check.name for check in self._checks}
+
+    def check(self, records: Sequence[Mapping[str, Any]]) -> Dict[str, Any]:
+        """Boolean array per field, telling which records fail a column-wise check of that field."""
+        if np is None:
+            raise ImportError("`BatchValidator.check` requires numpy, which is not installed")
+        return {
+            check.name: check.check([record.get(check.name, _MISSING) for record in records]) for check in self._checks
+        }
+
+    def validate(self, records: Sequence[Mapping[str, Any]]) -> BatchResult:
+        masks: Dict[str, Any] = {}
+        if np is None:
+            needs_validation: Any = [True] * len(records)
+        else:
+            masks = self.check(records)
+            needs_validation = np.zeros(len(records), dtype=bool)
+            for mask in masks.values():
+                needs_validation |= mask
+            # unknown keys are either errors or ignored, depending on the model configuration
+            needs_validation |= np.fromiter((not self._names.issuperset(record) for record in records), dtype=bool)
+        instances: List[Optional[BaseModel]] = []
+        errors: Dict[int, ValidationError] = {}
+        for index, (record, validate) in enumerate(zip(records, needs_validation)):
+            if not validate:
+                instances.append(compat.construct(self.model, **record))
+                continue
+            try:
+                instances.append(self.model(**record))
+            except ValidationError as ex:
+                instances.append(None)
+                errors[index] = ex
+        return BatchResult(instances, errors, masks)
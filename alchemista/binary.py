@@ -0,0 +1,246 @@
+"""Binary columns carried without copies (as `memoryview`), deferred columns as lazy handles, and streaming JSON."""
+
+import base64
+import binascii
+import json
+from typing import Any, Callable, ClassVar, Dict, Generator, Iterator, Optional, Set, Tuple, Type
+from weakref import WeakValueDictionary
+
+from pydantic import BaseModel, Field, create_model
+from pydantic.fields import FieldInfo
+from sqlalchemy import inspect
+from sqlalchemy.orm import ColumnProperty
+
+from alchemista import compat
+from alchemista.typing import Annotated, is_optional, non_optional
+
+# a multiple of 3, so that the base64 of each chunk can be concatenated
+BASE64_CHUNK_SIZE = 3 * 64 * 1024
+
+
+def iter_base64(data: Any, chunk_size: int = BASE64_CHUNK_SIZE) -> Iterator[str]:
+    """The base64 of `data` (any buffer, like `bytes` or `memoryview`) in chunks, never copying all of it at once."""
+    if chunk_size % 3:
+        raise ValueError("`chunk_size` must be a multiple of 3")
+    view = memoryview(data).cast("B")
+    for start in range(0, len(view), chunk_size):
+        yield base64.b64encode(view[start : start + chunk_size]).decode("ascii")
+
+
+class Buffer:
+    """Type of binary fields whose values are kept as `memoryview`s of what they are given (e.g. `bytes` read from the
+    database), so that they are never copied. In JSON, they are base64 strings, which are decoded when validated.
+
+    `Buffer.sized(max_length)` is the type of those of at most `max_length` bytes."""
+
+    max_length: ClassVar[Optional[int]] = None
+    _sized: ClassVar["WeakValueDictionary[int, Type[Buffer]]"] = WeakValueDictionary()
+
+    @classmethod
+    def sized(cls, max_length: int) -> Type["Buffer"]:
+        try:
+            return cls._sized[max_length]
+        except KeyError:
+            sized_class = type(f"Buffer[{max_length}]", (cls,), {"max_length": max_length})
+            return cls._sized.setdefault(max_length, sized_class)
+
+    @classmethod
+    def _validate(cls, value: Any) -> memoryview:
+        if isinstance(value, memoryview):
+            view = value
+        elif isinstance(value, (bytes, bytearray)):
+            view = memoryview(value)
+        elif isinstance(value, str):
+            try:
+                view = memoryview(base64.b64decode(value, validate=True))
+            except binascii.Error as error:
+                raise ValueError(f"Invalid base64: {error}") from error
+        else:
+            raise ValueError(f"Expected a buffer (e.g. bytes), got {type(value).__name__}")
+        if cls.max_length is not None and view.nbytes > cls.max_length:
+            raise ValueError(f"ensure this value has at most {cls.max_length} bytes")
+        return view
+
+    # Pydantic v1
+
+    @classmethod
+    def __get_validators__(cls) -> Generator[Callable[[Any], Any], None, None]:
+        yield cls._validate
+
+    @classmethod
+    def __modify_schema__(cls, field_schema: Dict[str, Any]) -> None:
+        field_schema.update(type="string", format="binary")
+
+    # Pydantic v2
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, _source: Any, _handler: Any) -> Any:
+        from pydantic_core import core_schema  # pylint: disable=import-outside-toplevel,import-error
+
+        def serialize(value: memoryview, info: Any) -> Any:
+            return "".join(iter_base64(value)) if info.mode == "json" else value
+
+        return core_schema.no_info_plain_validator_function(
+            cls._validate, serialization=core_schema.plain_serializer_function_ser_schema(serialize, info_arg=True)
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(cls, _core_schema: Any, _handler: Any) -> Any:
+        return {"type": "string", "format": "binary"}
+
+
+_UNLOADED: Any = object()
+
+
+class Deferred:
+    """Handle of a deferred column of a SQLAlchemy instance that was not loaded, which only loads it on `load()`.
+
+    `Deferred[T]` is the type of fields that hold either a handle or a value of type `T`."""
+
+    __slots__ = ("obj", "key", "_value")
+
+    type_: ClassVar[Any]
+    _parametrized: ClassVar["WeakValueDictionary[Any, Type[Deferred]]"] = WeakValueDictionary()
+
+    def __init__(self, obj: Any, key: str) -> None:
+        self.obj = obj
+        self.key = key
+        self._value: Any = _UNLOADED
+
+    def __class_getitem__(cls, type_: Any) -> Type["Deferred"]:
+        try:
+            return cls._parametrized[type_]
+        except KeyError:
+            name = getattr(type_, "__name__", repr(type_))
+            deferred_class = type(f"Deferred[{name}]", (cls,), {"__slots__": (), "type_": type_})
+            return cls._parametrized.setdefault(type_, deferred_class)
+
+    def load(self) -> Any:
+        if self._value is _UNLOADED:
+            self._value = getattr(self.obj, self.key)
+        return self._value
+
+    @property
+    def loaded(self) -> bool:
+        return self._value is not _UNLOADED
+
+    def __repr__(self) -> str:
+        return f"Deferred({type(self.obj).__name__}.{self.key})"
+
+    # Pydantic v1
+
+    @classmethod
+    def __get_validators__(cls) -> Generator[Callable[[Any], Any], None, None]:
+        yield lambda value: value if isinstance(value, Deferred) else compat.parse_as(cls.type_, value)
+
+    @classmethod
+    def __modify_schema__(cls, field_schema: Dict[str, Any]) -> None:
+        # the schema of a field of the inner type (`pydantic.schema_of` is only available since Pydantic 1.9)
+        schema = create_model(cls.__name__, value=(cls.type_, ...)).schema()["properties"]["value"]
+        schema.pop("title", None)
+        field_schema.update(schema)
+
+    # Pydantic v2
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, _source: Any, handler: Any) -> Any:
+        from pydantic_core import core_schema  # pylint: disable=import-outside-toplevel,import-error
+
+        return core_schema.no_info_wrap_validator_function(
+            lambda value, validate: value if isinstance(value, Deferred) else validate(value),
+            handler.generate_schema(cls.type_),
+            serialization=core_schema.wrap_serializer_function_ser_schema(
+                lambda value, serialize: serialize(value.load() if isinstance(value, Deferred) else value)
+            ),
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(cls, core_schema: Any, handler: Any) -> Any:
+        return handler(core_schema)
+
+
+# how v1 serializes these types to JSON (e.g. in `.json()`), as `json_encoders` of the models that use them
+JSON_ENCODERS: Dict[type, Callable[[Any], Any]] = {
+    memoryview: lambda value: "".join(iter_base64(value)),
+    Deferred: lambda value: value.load(),
+}
+
+
+def zero_copy_fields(db_model: type, fields: Dict[str, Tuple[type, FieldInfo]]) -> Set[str]:
+    """Replace (in place) the types of binary `fields` by `Buffer`,
+    and let fields of deferred columns hold `Deferred` handles. Return the names of the latter.
+
+    The constraints of the fields (like the `max_length` of sized columns) move to their new types,
+    which enforce them instead of Pydantic."""
+    mapper = inspect(db_model)
+    deferred = set()
+    for name, (field_type, field) in fields.items():
+        optional = is_optional(field_type)
+        python_type: Any = non_optional(field_type)
+        prop = mapper.attrs.get(name)
+        is_deferred = isinstance(prop, ColumnProperty) and prop.deferred
+        if python_type is not bytes and not is_deferred:
+            continue
+        constraints = compat.field_constraints(field)
+        if constraints:
+            field = compat.without_constraints(field)
+        if python_type is bytes:
+            max_length = constraints.pop("max_length", None)
+            python_type = Buffer if max_length is None else Buffer.sized(max_length)
+        if constraints:
+            constrained = Field(**compat.field_kwargs(constraints))  # type: ignore[pydantic-field]
+            python_type = Annotated[python_type, constrained]
+        if is_deferred:
+            python_type = Deferred[python_type]  # type: ignore[misc]
+            deferred.add(name)
+        fields[name] = (Optional[python_type] if optional else python_type, field)
+    return deferred
+
+
+class _DeferringProxy:
+    """Reads the attributes of a SQLAlchemy instance, except for the unloaded deferred ones, which become handles."""
+
+    __slots__ = ("_obj", "_handles")
+
+    def __init__(self, obj: Any, unloaded: Set[str]) -> None:
+        self._obj = obj
+        self._handles = {key: Deferred(obj, key) for key in unloaded}
+
+    def __getattr__(self, name: str) -> Any:
+        handle = self._handles.get(name)
+        return handle if handle is not None else getattr(self._obj, name)
+
+
+def make_deferring(model: Type[BaseModel], deferred: Set[str]) -> None:
+    """Wrap `model.from_orm` so that the `deferred` attributes that are not loaded yet become `Deferred` handles."""
+    wrapped_from_orm = vars(model).get("from_orm")
+
+    def from_orm(cls: Type[BaseModel], obj: Any) -> BaseModel:
+        unloaded = deferred.intersection(inspect(obj).unloaded)
+        source = _DeferringProxy(obj, unloaded) if unloaded else obj
+        if wrapped_from_orm is not None:
+            return wrapped_from_orm.__func__(cls, source)  # type: ignore[no-any-return]
+        if compat.PYDANTIC_V2:
+            return cls.model_validate(source, from_attributes=True)  # type: ignore[attr-defined,no-any-return]
+        return super(model, cls).from_orm(source)  # type: ignore[misc,no-any-return]
+
+    setattr(model, "from_orm", classmethod(from_orm))
+
+
+def iter_json(instance: BaseModel, chunk_size: int = BASE64_CHUNK_SIZE) -> Iterator[str]:
+    """The JSON of `instance` in chunks, streaming binary values (including those of `Deferred` handles) in base64,
+    so that they are never copied as a whole. The keys are the field names."""
+    default = compat.json_default(type(instance))
+    yield "{"
+    for index, name in enumerate(compat.field_names(type(instance))):
+        value = getattr(instance, name)
+        if isinstance(value, Deferred):
+            value = value.load()
+        yield f'{", " if index else ""}{json.dumps(name)}: '
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            yield '"'
+            yield from iter_base64(value, chunk_size)
+            yield '"'
+        else:
+            yield json.dumps(value, default=default)
+    yield "}"
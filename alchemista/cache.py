@@ -0,0 +1,253 @@
+"""In-process cache of query results as instances of generated models, invalidated when their tables are written."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
+from weakref import WeakKeyDictionary
+
+from pydantic import BaseModel
+from sqlalchemy import Table, event, inspect
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import ClauseElement, Executable
+
+from alchemista import compat
+from alchemista.model import db_model_of
+
+Target = Union[Session, Type[Session], Any]
+"""What to listen to for writes: a `Session`, a `Session` class or a `sessionmaker`."""
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    size: int
+
+
+class _Entry(NamedTuple):
+    value: Union[List[BaseModel], bytes]
+    tables: "frozenset[Table]"
+    expires: float
+
+
+class ResultCache:  # pylint: disable=too-many-instance-attributes
+    """Results of queries (e.g. `select(PersonDB).where(...)`) converted to instances of a model generated by
+    `model_from`, cached by model, compiled statement, parameters and engine, as the instances or as their JSON.
+
+    The `max_size` most recently used results are kept, each for at most `ttl` seconds (if given). Results are
+    invalidated when the tables of the mapper behind their model are flushed to by a session that the cache listens to
+    (see `listen`), and again when that session commits or rolls back, so that results read meanwhile don't outlive
+    its transaction. Results read by that session after the flush aren't cached at all, since they include writes that
+    other sessions can't see. Writes that don't go through the unit of work (e.g. `update()` statements) need a call to
+    `invalidate`."""
+
+    def __init__(
+        self, *, max_size: int = 1024, ttl: Optional[float] = None, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._keys_by_table: Dict[Table, Set[Hashable]] = {}
+        # incremented on each invalidation of a table, so that results loaded meanwhile are not cached
+        self._generations: "WeakKeyDictionary[Table, int]" = WeakKeyDictionary()
+        self._clears = 0
+        self._flushed: "WeakKeyDictionary[Session, Set[Table]]" = WeakKeyDictionary()
+        self._targets: List[Target] = []
+        self._lock = threading.RLock()
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(self.hits, self.misses, len(self._entries))
+
+    @staticmethod
+    def key(
+        model: Type[BaseModel],
+        statement: ClauseElement,
+        params: Optional[Mapping[str, Any]] = None,
+        bind: Optional[Any] = None,
+    ) -> Hashable:
+        """Key of the results of `statement` with `params` as instances of `model`, read through `bind`
+        (e.g. `session.get_bind()`), since the same statement has different results in different databases."""
+        compiled = statement.compile()
+        values = {**compiled.params, **(params or {})}
+        # the engine of connections, which are only used by one session at a time
+        engine = getattr(bind, "engine", bind)
+        # `repr`, since parameters can be unhashable (e.g. lists for `IN`)
+        return model, str(compiled), repr(sorted(values.items())), engine
+
+    def _key_of(
+        self, session: Session, statement: ClauseElement, model: Type[BaseModel], params: Optional[Mapping[str, Any]]
+    ) -> Hashable:
+        return self.key(model, statement, params, session.get_bind(clause=statement))
+
+    def _generations_of(self, tables: Iterable[Table]) -> Tuple[int, ...]:
+        with self._lock:
+            return (self._clears, *(self._generations.get(table, 0) for table in tables))
+
+    def _get(self, key: Hashable) -> Optional[_Entry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires < self.clock():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def _put(  # pylint: disable=too-many-arguments
+        self,
+        key: Hashable,
+        value: Union[List[BaseModel], bytes],
+        tables: "frozenset[Table]",
+        generations: Tuple[int, ...],
+        session: Session,
+    ) -> None:
+        """Cache `value`, unless one of `tables` was invalidated since `generations` (taken before loading it), or has
+        writes of `session` that aren't committed yet."""
+        expires = self.clock() + self.ttl if self.ttl is not None else float("inf")
+        with self._lock:
+            if self._generations_of(tables) != generations or not tables.isdisjoint(self._flushed.get(session, ())):
+                return
+            self._remove(key)
+            self._entries[key] = _Entry(value, tables, expires)
+            for table in tables:
+                self._keys_by_table.setdefault(table, set()).add(key)
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            for table in entry.tables:
+                keys = self._keys_by_table.get(table)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self._keys_by_table[table]
+
+    @staticmethod
+    def _load(
+        session: Session, statement: ClauseElement, model: Type[BaseModel], params: Optional[Mapping[str, Any]]
+    ) -> List[BaseModel]:
+        return [compat.from_orm(model, obj) for obj in session.execute(cast(Executable, statement), params).scalars()]
+
+    @staticmethod
+    def _tables_of(model: Type[BaseModel]) -> "frozenset[Table]":
+        db_model = db_model_of(model)
+        if db_model is None:
+            raise ValueError(f"{model.__name__} was not generated by `model_from`, so its tables are unknown")
+        return frozenset(inspect(db_model).tables)
+
+    def fetch(
+        self,
+        session: Session,
+        statement: ClauseElement,
+        model: Type[BaseModel],
+        params: Optional[Mapping[str, Any]] = None,
+    ) -> List[BaseModel]:
+        """Instances of `model` of the results of `statement` (which selects instances of the mapper of `model`),
+        from the cache or else queried with `session`. The same list is returned on every hit, so it shouldn't be
+        changed (frozen models prevent changing the instances themselves)."""
+        key = self._key_of(session, statement, model, params)
+        entry = self._get(key)
+        if entry is not None:
+            return entry.value  # type: ignore[return-value]
+        tables = self._tables_of(model)
+        generations = self._generations_of(tables)
+        instances = self._load(session, statement, model, params)
+        self._put(key, instances, tables, generations, session)
+        return instances
+
+    def fetch_json(
+        self,
+        session: Session,
+        statement: ClauseElement,
+        model: Type[BaseModel],
+        params: Optional[Mapping[str, Any]] = None,
+    ) -> bytes:
+        """Like `fetch`, but the results are cached and returned as the bytes of a JSON array, e.g. for responses."""
+        key = (self._key_of(session, statement, model, params), "json")
+        entry = self._get(key)
+        if entry is not None:
+            return entry.value  # type: ignore[return-value]
+        tables = self._tables_of(model)
+        generations = self._generations_of(tables)
+        instances = self._load(session, statement, model, params)
+        value = f"[{','.join(compat.to_json(instance) for instance in instances)}]".encode()
+        self._put(key, value, tables, generations, session)
+        return value
+
+    def invalidate(self, *tables_or_db_models: Union[Table, type]) -> None:
+        """Drop the results that depend on any of the given tables, or on the tables of the given mapped classes."""
+        tables: Set[Table] = set()
+        for table_or_db_model in tables_or_db_models:
+            if isinstance(table_or_db_model, Table):
+                tables.add(table_or_db_model)
+            else:
+                tables.update(inspect(table_or_db_model).tables)
+        self._invalidate_tables(tables)
+
+    def _invalidate_tables(self, tables: Iterable[Table]) -> None:
+        with self._lock:
+            for table in tables:
+                self._generations[table] = self._generations.get(table, 0) + 1
+                for key in list(self._keys_by_table.get(table, ())):
+                    self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clears += 1
+            self._entries.clear()
+            self._keys_by_table.clear()
+
+    def _on_after_flush(self, session: Session, _: Any) -> None:
+        tables = {
+            table for obj in (*session.new, *session.dirty, *session.deleted) for table in inspect(obj).mapper.tables
+        }
+        with self._lock:
+            self._flushed.setdefault(session, set()).update(tables)
+        self._invalidate_tables(tables)
+
+    def _on_transaction_end(self, session: Session) -> None:
+        with self._lock:
+            tables = self._flushed.pop(session, set())
+        self._invalidate_tables(tables)
+
+    def _on_soft_rollback(self, session: Session, _: Any) -> None:
+        self._on_transaction_end(session)
+
+    def listen(self, target: Target = Session) -> None:
+        """Invalidate results on writes by `target`, which is all sessions by default."""
+        event.listen(target, "after_flush", self._on_after_flush)
+        event.listen(target, "after_commit", self._on_transaction_end)
+        event.listen(target, "after_soft_rollback", self._on_soft_rollback)
+        self._targets.append(target)
+
+    def close(self) -> None:
+        """Stop listening to all targets."""
+        for target in self._targets:
+            event.remove(target, "after_flush", self._on_after_flush)
+            event.remove(target, "after_commit", self._on_transaction_end)
+            event.remove(target, "after_soft_rollback", self._on_soft_rollback)
+        self._targets.clear()
@@ -0,0 +1,174 @@
+"""Conversion of query results to columns (NumPy arrays or a pyarrow Table), without a Python object per row."""
+
+import datetime as dt
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Sequence
+
+from sqlalchemy import inspect
+from sqlalchemy.engine import Result
+from sqlalchemy.orm import ColumnProperty
+from sqlalchemy.sql import Select
+
+from alchemista.field import infer_python_type
+from alchemista.typing import is_optional, non_optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None
+
+DEFAULT_BATCH_SIZE = 65_536
+
+_NUMPY_DTYPES = {
+    bool: "bool",
+    int: "int64",
+    float: "float64",
+    dt.datetime: "datetime64[us]",
+    dt.date: "datetime64[D]",
+    dt.timedelta: "timedelta64[us]",
+}
+
+
+def types_from(db_model: type) -> Dict[str, type]:
+    """Python type of each column of `db_model`, as inferred by `infer_python_type`."""
+    return {
+        attr.key: infer_python_type(attr.columns[0])
+        for attr in inspect(db_model).attrs
+        if isinstance(attr, ColumnProperty) and attr.columns
+    }
+
+
+def types_of(statement: Select) -> Dict[str, type]:
+    """Python type of each column selected by `statement`, as inferred by `infer_python_type`."""
+    return {column.key: infer_python_type(column) for column in statement.selected_columns}
+
+
+def _batches(result: Result, keys: Sequence[str], batch_size: int) -> Iterable[List[Sequence[Any]]]:
+    # transposing each partition only creates one tuple per column, besides the rows the driver already returns
+    indexes = [list(result.keys()).index(key) for key in keys]
+    for partition in result.partitions(batch_size):
+        columns = list(zip(*partition))
+        yield [columns[index] for index in indexes]
+
+
+def _first_value(values: Sequence[Any]) -> Any:
+    return next((value for value in values if value is not None), None)
+
+
+def _is_aware(values: Sequence[Any]) -> bool:
+    # the values of a column share their timezone (if any), e.g. that of `DateTime(timezone=True)`
+    first = _first_value(values)
+    return isinstance(first, dt.datetime) and first.tzinfo is not None
+
+
+def _numpy_column(values: Sequence[Any], python_type: Any) -> Any:
+    dtype = _NUMPY_DTYPES.get(non_optional(python_type), "object")
+    if dtype == "datetime64[us]" and _is_aware(values):
+        # `np.datetime64` has no timezone, so aware datetimes are converted to UTC (which NumPy would warn about)
+        values = [None if value is None else value.astimezone(dt.timezone.utc).replace(tzinfo=None) for value in values]
+    if not is_optional(python_type) or dtype == "object":
+        return np.array(values, dtype=dtype)
+    objects = np.array(values, dtype="object")
+    mask = np.fromiter((value is None for value in values), dtype=bool, count=len(values))
+    if mask.any():
+        objects[mask] = np.zeros(1, dtype=dtype)[0]
+    return np.ma.MaskedArray(objects.astype(dtype), mask=mask)
+
+
+def to_numpy(
+    result: Result, types: Mapping[str, type], *, batch_size: int = DEFAULT_BATCH_SIZE
+) -> Dict[str, "np.ndarray[Any, Any]"]:
+    """Convert `result` to a dictionary of NumPy arrays, one per key of `types` (e.g. from `types_from`).
+
+    Columns of `Optional` types become masked arrays (`np.ma.MaskedArray`), masking `None` values.
+    Types without a corresponding NumPy type (e.g. `str` and `Decimal`) become arrays of objects.
+    Aware datetimes are converted to UTC, since `np.datetime64` has no timezone."""
+    if np is None:
+        raise ImportError("`to_numpy` requires numpy, which is not installed")
+    keys = list(types)
+    batches: Dict[str, List[Any]] = {key: [] for key in keys}
+    for columns in _batches(result, keys, batch_size):
+        for key, values in zip(keys, columns):
+            batches[key].append(_numpy_column(values, types[key]))
+    arrays = {}
+    for key in keys:
+        python_type = types[key]
+        if not batches[key]:
+            array = np.array([], dtype=_NUMPY_DTYPES.get(non_optional(python_type), "object"))
+            arrays[key] = np.ma.MaskedArray(array) if is_optional(python_type) else array
+        elif isinstance(batches[key][0], np.ma.MaskedArray):
+            arrays[key] = np.ma.concatenate(batches[key])  # type: ignore[no-untyped-call,unused-ignore]
+        else:
+            arrays[key] = np.concatenate(batches[key])
+    return arrays
+
+
+def _arrow_type(python_type: Any) -> Any:
+    arrow_types = {
+        bool: pa.bool_(),
+        int: pa.int64(),
+        float: pa.float64(),
+        str: pa.string(),
+        bytes: pa.binary(),
+        dt.datetime: pa.timestamp("us"),
+        dt.date: pa.date32(),
+        dt.timedelta: pa.duration("us"),
+    }
+    # `None` lets pyarrow infer the type from the values
+    return arrow_types.get(non_optional(python_type))
+
+
+def arrow_batches(
+    result: Result, types: Mapping[str, type], *, batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator["pa.RecordBatch"]:
+    """Convert `result` to pyarrow RecordBatches of up to `batch_size` rows, with a column for each key of `types`.
+
+    Unlike `to_arrow`, only one batch is held in memory at a time.
+    Aware datetimes become timestamps with the timezone of the first of them."""
+    if pa is None:
+        raise ImportError("`arrow_batches` requires pyarrow, which is not installed")
+    keys = list(types)
+    arrow_types = {key: _arrow_type(python_type) for key, python_type in types.items()}
+    # whether datetimes are aware is only known from their values, so from the first batch that has some
+    datetimes = {key for key, python_type in types.items() if non_optional(python_type) is dt.datetime}
+    for columns in _batches(result, keys, batch_size):
+        for key, values in zip(keys, columns):
+            if key in datetimes and _first_value(values) is not None:
+                datetimes.discard(key)
+                if _is_aware(values):
+                    arrow_types[key] = pa.scalar(_first_value(values)).type
+        arrays = [pa.array(values, type=arrow_types[key]) for key, values in zip(keys, columns)]
+        for key, array in zip(keys, arrays):
+            # the types inferred from the first batch are kept, so that all batches have the same schema
+            if arrow_types[key] is None and array.type != pa.null():
+                arrow_types[key] = array.type
+        yield pa.RecordBatch.from_arrays(arrays, names=keys)
+
+
+def arrow_schema(types: Mapping[str, type], batches: Sequence["pa.RecordBatch"]) -> "pa.Schema":
+    """Common schema of `batches` (from `arrow_batches`), taking inferred types from the first batch that has them."""
+    fields = []
+    for key, python_type in types.items():
+        arrow_type = _arrow_type(python_type)
+        if arrow_type is None:
+            inferred = (batch.schema.field(key).type for batch in batches)
+            arrow_type = next((inferred_type for inferred_type in inferred if inferred_type != pa.null()), pa.null())
+        elif non_optional(python_type) is dt.datetime:
+            # with the timezone of aware datetimes, see `arrow_batches`
+            batch_types = (batch.schema.field(key).type for batch in batches)
+            arrow_type = next((batch_type for batch_type in batch_types if batch_type.tz is not None), arrow_type)
+        fields.append(pa.field(key, arrow_type, is_optional(python_type)))
+    return pa.schema(fields)
+
+
+def to_arrow(result: Result, types: Mapping[str, type], *, batch_size: int = DEFAULT_BATCH_SIZE) -> "pa.Table":
+    """Convert `result` to a pyarrow Table with a column for each key of `types` (e.g. from `types_from`)."""
+    if pa is None:
+        raise ImportError("`to_arrow` requires pyarrow, which is not installed")
+    record_batches = list(arrow_batches(result, types, batch_size=batch_size))
+    schema = arrow_schema(types, record_batches)
+    return pa.Table.from_batches([batch.cast(schema) for batch in record_batches], schema=schema)
@@ -0,0 +1,270 @@
+"""Differences between Pydantic v1 and v2, so that the rest of the package works with both."""
+
+import copy
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type
+
+from pydantic import VERSION, BaseModel
+from pydantic.fields import FieldInfo
+
+PYDANTIC_V2 = VERSION.startswith("2.")
+
+# `Info` keys that are keyword arguments of `Field` in v1, but were renamed in v2
+_RENAMED_IN_V2 = {"max_items": "max_length", "min_items": "min_length", "regex": "pattern"}
+_CONSTRAINTS = ("ge", "gt", "le", "lt", "max_items", "max_length", "min_items", "min_length", "multiple_of", "regex")
+_V2_CONSTRAINTS = ("ge", "gt", "le", "lt", "max_length", "min_length", "multiple_of", "pattern")
+
+
+def field_kwargs(info: Dict[str, Any]) -> Dict[str, Any]:
+    """Translate the (v1-style) `Info` of a column to keyword arguments of `pydantic.Field`."""
+    if not PYDANTIC_V2:
+        return info
+    kwargs = {_RENAMED_IN_V2.get(key, key): value for key, value in info.items() if key not in ("const", "example")}
+    if "allow_mutation" in kwargs:
+        kwargs["frozen"] = not kwargs.pop("allow_mutation")
+    if "example" in info:
+        kwargs["examples"] = [info["example"]]
+    return kwargs
+
+
+class _ConstValidator:
+    def __init__(self, const: Any) -> None:
+        self.const = const
+
+    def __call__(self, value: Any) -> Any:
+        if value != self.const:
+            raise ValueError(f"unexpected value; permitted: {self.const!r}")
+        return value
+
+
+def set_const(field: FieldInfo, const: Any) -> None:
+    """Set `const` of `field`, which is an attribute of `FieldInfo` in v1 and emulated with a validator in v2.
+    If `const` is truthy, the value of the field must be equal to its default."""
+    if not PYDANTIC_V2:
+        field.const = const
+        return
+    from pydantic.functional_validators import (  # type: ignore[import,unused-ignore]  # pylint: disable=import-outside-toplevel,import-error,no-name-in-module
+        AfterValidator,
+    )
+
+    metadata: List[Any] = field.metadata  # type: ignore[attr-defined,unused-ignore]
+    metadata[:] = [item for item in metadata if not isinstance(getattr(item, "func", None), _ConstValidator)]
+    schema_extra = field.json_schema_extra  # type: ignore[attr-defined,unused-ignore]
+    extra = dict(schema_extra) if isinstance(schema_extra, dict) else {}
+    extra.pop("const", None)
+    if const:
+        metadata.append(AfterValidator(_ConstValidator(field.default)))
+        extra["const"] = field.default
+    field.json_schema_extra = extra or None  # type: ignore[attr-defined,unused-ignore]
+
+
+def is_const(field: FieldInfo) -> bool:
+    """Whether the value of `field` must be equal to its default, see `set_const`."""
+    if not PYDANTIC_V2:
+        return bool(field.const)
+    metadata: List[Any] = field.metadata  # type: ignore[attr-defined,unused-ignore]
+    return any(isinstance(getattr(item, "func", None), _ConstValidator) for item in metadata)
+
+
+def set_default(field: FieldInfo, default: Any) -> None:
+    """Set `default` of `field`, unsetting `default_factory`."""
+    field.default = default
+    field.default_factory = None
+    if PYDANTIC_V2:
+        # v2 only keeps the attributes explicitly set when the field is used to create a model
+        attributes: Dict[str, Any] = field._attributes_set  # type: ignore[attr-defined,unused-ignore]  # pylint: disable=protected-access
+        attributes["default"] = default
+        attributes.pop("default_factory", None)
+
+
+def field_constraints(field: FieldInfo) -> Dict[str, Any]:
+    """Constraints of `field` that are set, with their v1 `Info` names (e.g. `regex` instead of `pattern`)."""
+    if not PYDANTIC_V2:
+        return {key: getattr(field, key) for key in _CONSTRAINTS if getattr(field, key, None) is not None}
+    constraints = {}
+    for item in field.metadata:  # type: ignore[attr-defined,unused-ignore]
+        for key in _V2_CONSTRAINTS:
+            value = getattr(item, key, None)
+            if value is not None:
+                constraints["regex" if key == "pattern" else key] = value
+    return constraints
+
+
+def without_constraints(field: FieldInfo) -> FieldInfo:
+    """A copy of `field` without the constraints of `field_constraints`, e.g. to enforce them some other way."""
+    copied = copy.copy(field)
+    if not PYDANTIC_V2:
+        for key in _CONSTRAINTS:
+            setattr(copied, key, None)
+        return copied
+    metadata: List[Any] = field.metadata  # type: ignore[attr-defined,unused-ignore]
+    copied.metadata = [  # type: ignore[attr-defined,unused-ignore]
+        item for item in metadata if all(getattr(item, key, None) is None for key in _V2_CONSTRAINTS)
+    ]
+    # v2 only keeps the attributes explicitly set when the field is used to create a model
+    attributes: Dict[str, Any] = field._attributes_set  # type: ignore[attr-defined,unused-ignore]  # pylint: disable=protected-access
+    copied._attributes_set = {  # type: ignore[attr-defined,unused-ignore]  # pylint: disable=protected-access
+        key: value for key, value in attributes.items() if key not in _V2_CONSTRAINTS
+    }
+    return copied
+
+
+def _unconstrained(python_type: Any) -> Any:
+    # v1 replaces types with constraints by subclasses like `ConstrainedIntValue`
+    if isinstance(python_type, type):
+        constrained = False
+        for base in python_type.__mro__:
+            if base.__module__ == "pydantic.types":
+                constrained = True
+            elif constrained:
+                return base
+    return python_type
+
+
+def model_fields(model: Type[BaseModel]) -> Dict[str, Tuple[Any, FieldInfo]]:
+    """Type and `FieldInfo` of each field of `model`, like the output of `fields_from`."""
+    if PYDANTIC_V2:
+        v2_fields: Dict[str, Any] = model.model_fields  # type: ignore[attr-defined,unused-ignore]
+        return {name: (field.annotation, field) for name, field in v2_fields.items()}
+    fields = {}
+    for name, field in model.__fields__.items():
+        python_type = _unconstrained(field.outer_type_)
+        fields[name] = (Optional[python_type] if field.allow_none else python_type, field.field_info)
+    return fields
+
+
+def model_config(model: Type[BaseModel]) -> Any:
+    if PYDANTIC_V2:
+        return model.model_config  # type: ignore[attr-defined,unused-ignore]
+    return model.__config__
+
+
+def field_names(model: Type[BaseModel]) -> List[str]:
+    return list(model.model_fields if PYDANTIC_V2 else model.__fields__)  # type: ignore[attr-defined,unused-ignore]
+
+
+def is_required(field: FieldInfo) -> bool:
+    if PYDANTIC_V2:
+        return bool(field.is_required())  # type: ignore[attr-defined,unused-ignore]
+    from pydantic.fields import (  # type: ignore[attr-defined,unused-ignore]  # pylint: disable=import-outside-toplevel
+        Undefined,
+    )
+
+    return field.default in (Ellipsis, Undefined) and field.default_factory is None
+
+
+def from_orm(model: Type[BaseModel], obj: Any) -> BaseModel:
+    # `from_orm` is deprecated in v2, but it is still how models overriding it (e.g. trusted models) are called
+    if PYDANTIC_V2 and "from_orm" not in vars(model):
+        return model.model_validate(obj, from_attributes=True)  # type: ignore[attr-defined,no-any-return,unused-ignore]
+    return model.from_orm(obj)
+
+
+def construct(model: Type[BaseModel], **values: Any) -> BaseModel:
+    if PYDANTIC_V2:
+        return model.model_construct(**values)  # type: ignore[attr-defined,no-any-return,unused-ignore]
+    return model.construct(**values)
+
+
+def construct_all(model: Type[BaseModel], values: Dict[str, Any]) -> BaseModel:
+    """Faster `construct` for when `values` has all the fields of `model`, so that no default has to be set."""
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    if PYDANTIC_V2:
+        object.__setattr__(instance, "__pydantic_fields_set__", set(values))
+        object.__setattr__(instance, "__pydantic_extra__", None)
+        object.__setattr__(instance, "__pydantic_private__", None)
+    else:
+        object.__setattr__(instance, "__fields_set__", set(values))
+        instance._init_private_attributes()  # pylint: disable=protected-access
+    return instance
+
+
+def fields_set(instance: BaseModel) -> Set[str]:
+    """Names of the fields of `instance` that were given values, i.e. that were not left to their defaults."""
+    if PYDANTIC_V2:
+        return instance.model_fields_set  # type: ignore[attr-defined,no-any-return]
+    return instance.__fields_set__
+
+
+def to_dict(instance: BaseModel, **kwargs: Any) -> Dict[str, Any]:
+    if PYDANTIC_V2:
+        return instance.model_dump(**kwargs)  # type: ignore[attr-defined,no-any-return,unused-ignore]
+    return instance.dict(**kwargs)
+
+
+def to_json(instance: BaseModel, **kwargs: Any) -> str:
+    if PYDANTIC_V2:
+        return instance.model_dump_json(**kwargs)  # type: ignore[attr-defined,no-any-return,unused-ignore]
+    return instance.json(**kwargs)
+
+
+def with_json_encoders(config: Any, encoders: Dict[type, Callable[[Any], Any]]) -> Any:
+    """`config` with `encoders` of types for `.json()` (those of `config` take precedence) in v1,
+    and `config` itself in v2, where types serialize themselves."""
+    # any class can be the configuration of a model, not only subclasses of `BaseConfig`
+    own_encoders = getattr(config, "json_encoders", {})
+    if PYDANTIC_V2 or set(encoders).issubset(own_encoders):
+        return config
+    return type(config.__name__, (config,), {"json_encoders": {**encoders, **own_encoders}})
+
+
+def to_jsonable(value: Any) -> Any:
+    """JSON-compatible representation of a value, including those `json` can't serialize (e.g. `datetime`)."""
+    if PYDANTIC_V2:
+        from pydantic_core import to_jsonable_python  # pylint: disable=import-outside-toplevel,import-error
+
+        return to_jsonable_python(value)
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    from pydantic.json import pydantic_encoder  # pylint: disable=import-outside-toplevel
+
+    return pydantic_encoder(value)
+
+
+def json_default(model: Type[BaseModel]) -> Callable[[Any], Any]:
+    """The `default` of `json.dumps` for the values of the fields of `model`, which uses its `json_encoders` in v1."""
+    if PYDANTIC_V2:
+        return to_jsonable
+    return model.__json_encoder__
+
+
+def parse_as(python_type: Any, value: Any) -> Any:
+    """Validate `value` as `python_type`, e.g. to parse the output of `to_jsonable` back."""
+    if PYDANTIC_V2:
+        from pydantic import (  # type: ignore[attr-defined,unused-ignore]  # pylint: disable=import-outside-toplevel,no-name-in-module
+            TypeAdapter,
+        )
+
+        return TypeAdapter(python_type).validate_python(value)
+    from pydantic import parse_obj_as  # pylint: disable=import-outside-toplevel
+
+    return parse_obj_as(python_type, value)
+
+
+def json_schema(model: Type[BaseModel], *, by_alias: bool, ref_template: str) -> Dict[str, Any]:
+    if PYDANTIC_V2:
+        schema = model.model_json_schema  # type: ignore[attr-defined,unused-ignore]
+        return schema(by_alias=by_alias, ref_template=ref_template)  # type: ignore[no-any-return,unused-ignore]
+    return model.schema(by_alias=by_alias, ref_template=ref_template)
+
+
+def json_schema_definitions(models: List[Type[BaseModel]], *, by_alias: bool, ref_prefix: str) -> Dict[str, Any]:
+    if PYDANTIC_V2:
+        from pydantic.json_schema import (  # type: ignore[import,unused-ignore]  # pylint: disable=import-outside-toplevel,import-error,no-name-in-module
+            models_json_schema,
+        )
+
+        _, top_level = models_json_schema(
+            [(model, "validation") for model in models], by_alias=by_alias, ref_template=ref_prefix + "{model}"
+        )
+        return top_level.get("$defs", {})  # type: ignore[no-any-return]
+    from pydantic.schema import schema  # pylint: disable=import-outside-toplevel
+
+    return schema(models, by_alias=by_alias, ref_prefix=ref_prefix)["definitions"]  # type: ignore[no-any-return]
+
+
+DEFAULT_REF_TEMPLATE = "#/$defs/{model}" if PYDANTIC_V2 else "#/definitions/{model}"
+
+
+def lenient_issubclass(cls: Any, class_or_tuple: Any) -> bool:
+    return isinstance(cls, type) and issubclass(cls, class_or_tuple)
@@ -1,5 +1,24 @@
-from pydantic import BaseConfig
+from typing import Any, Type
 
+from alchemista.compat import PYDANTIC_V2
 
-class OrmConfig(BaseConfig):
-    orm_mode = True
+if PYDANTIC_V2:
+    from types import MappingProxyType
+
+    from pydantic import ConfigDict  # type: ignore[attr-defined,unused-ignore]  # pylint: disable=no-name-in-module
+
+    # the type of model configuration, i.e. the `__config__` argument of `create_model`
+    Config: Any = ConfigDict
+    # read-only, since they are the defaults of arguments
+    OrmConfig: Any = MappingProxyType({"from_attributes": True})
+    ForbidExtraConfig: Any = MappingProxyType({"extra": "forbid"})
+else:
+    from pydantic import BaseConfig, Extra
+
+    Config = Type[BaseConfig]
+
+    class OrmConfig(BaseConfig):  # type: ignore[no-redef]
+        orm_mode = True
+
+    class ForbidExtraConfig(BaseConfig):  # type: ignore[no-redef]
+        extra = Extra.forbid
@@ -1,12 +1,18 @@
-from typing import Any, Callable, Container, Dict, List, Optional, Tuple, TypedDict, cast
+import inspect as pyinspect
+from typing import Any, Callable, Container, Dict, List, Mapping, Optional, Tuple, TypedDict, cast, get_type_hints
 
-from pydantic import Field
+from pydantic import Field, create_model
 from pydantic.fields import FieldInfo
-from sqlalchemy import Column, Enum, inspect
-from sqlalchemy.orm import ColumnProperty
-from sqlalchemy.types import TypeEngine
+from sqlalchemy import Column, Enum, PrimaryKeyConstraint, Table, UniqueConstraint, inspect
+from sqlalchemy.ext.hybrid import HYBRID_PROPERTY, hybrid_property
+from sqlalchemy.orm import ColumnProperty, CompositeProperty
+from sqlalchemy.sql import ColumnElement
+from sqlalchemy.types import NullType, TypeEngine
 
-from alchemista import func
+from alchemista import compat, func
+from alchemista.config import OrmConfig
+from alchemista.lazy import LazyJson
+from alchemista.typing import Literal, is_optional
 
 
 class Info(TypedDict, total=False):
@@ -30,7 +36,23 @@ class Info(TypedDict, total=False):
     title: str
 
 
+# `Literal` types of the string-backed `Enum` types, by their values, so that each is only created once
+_LITERALS: Dict[Tuple[str, ...], Any] = {}
+
+
+def _literal_of(values: Tuple[str, ...]) -> Any:
+    try:
+        return _LITERALS[values]
+    except KeyError:
+        return _LITERALS.setdefault(values, Literal[values])  # type: ignore[valid-type,unused-ignore]
+
+
 def _extract_python_type(type_engine: TypeEngine) -> type:  # type: ignore[type-arg]
+    if isinstance(type_engine, Enum):
+        enum_class, values = type_engine.enum_class, type_engine.enums  # type: ignore[attr-defined,unused-ignore]
+        if enum_class is None and values:
+            # validating against the values (which Pydantic does with a set) catches invalid ones before the database
+            return cast(type, _literal_of(tuple(values)))
     try:
         # the `python_type` seems to always be a @property-decorated method,
         # so only checking its existence is not enough
@@ -39,7 +61,13 @@ def _extract_python_type(type_engine: TypeEngine) -> type:  # type: ignore[type-
         return cast(type, type_engine.impl.python_type)  # type: ignore[attr-defined]
 
 
-def infer_python_type(column: Column) -> type:  # type: ignore[type-arg]
+def infer_python_type(column: ColumnElement) -> type:  # type: ignore[type-arg]
+    if not isinstance(column, Column) and isinstance(column.type, NullType):
+        # SQL expressions, e.g. from `column_property`, may be untyped (like unknown SQL functions)
+        return cast(type, Any)
+
+    # SQL expressions have no nullability information, so they are assumed to be nullable
+    nullable = getattr(column, "nullable", True)
     try:
         python_type = _extract_python_type(column.type)
     except (AttributeError, NotImplementedError) as ex:
@@ -50,11 +78,54 @@ def infer_python_type(column: Column) -> type:  # type: ignore[type-arg]
 
     if python_type is list and hasattr(column.type, "item_type"):
         item_type = _extract_python_type(column.type.item_type)
-        if column.nullable:
+        if nullable:
             return Optional[List[item_type]]  # type: ignore[valid-type, return-value]
         return List[item_type]  # type: ignore[valid-type]
 
-    return python_type if not column.nullable else Optional[python_type]  # type: ignore[return-value]
+    return python_type if not nullable else Optional[python_type]  # type: ignore[return-value]
+
+
+def is_indexed(column: ColumnElement) -> bool:  # type: ignore[type-arg]
+    """Whether `column` is the first column of the primary key, of an index or of a unique constraint,
+    i.e. whether the database can use an index to look it up."""
+    table = getattr(column, "table", None)
+    if not isinstance(column, Column) or table is None:
+        return False
+    if column.index or column.unique:
+        return True
+    # not `ForeignKeyConstraint`s, which most databases don't index
+    constraints = [
+        constraint
+        for constraint in table.constraints
+        if isinstance(constraint, (PrimaryKeyConstraint, UniqueConstraint))
+    ]
+    leading = [indexed.columns[0] for indexed in [*table.indexes, *constraints] if indexed.columns]
+    return any(indexed is column for indexed in leading)
+
+
+def is_server_generated(column: Column) -> bool:  # type: ignore[type-arg]
+    """Whether the value of `column` can be generated by the database, i.e. it has a `server_default`,
+    is `Computed`, is an `Identity` or is the autoincrementing primary key of its table (e.g. a lone `Integer` one)."""
+    if column.server_default is not None or column.computed is not None or column.identity is not None:
+        return True
+    # SQLAlchemy only exposes the column it renders as e.g. `SERIAL` or `AUTOINCREMENT` privately
+    return getattr(getattr(column, "table", None), "_autoincrement_column", None) is column
+
+
+def _left_to_database(column: Column, for_create: bool) -> bool:  # type: ignore[type-arg]
+    # when creating, values that the database can generate are left unset (i.e. `None`), unless `info` has a default
+    return (
+        for_create
+        and is_server_generated(column)
+        and "default" not in column.info
+        and "default_factory" not in column.info
+    )
+
+
+def is_read_only(column: Column) -> bool:  # type: ignore[type-arg]
+    """Whether the value of `column` can only be generated by the database, i.e. it is `Computed`
+    or an `Identity` that is `GENERATED ALWAYS`."""
+    return column.computed is not None or (column.identity is not None and bool(column.identity.always))
 
 
 def _get_default_scalar(column: Column) -> Any:  # type: ignore[type-arg]
@@ -74,12 +145,26 @@ def _maybe_set_max_length_from_column(field_kwargs: Info, column: Column) -> Non
             field_kwargs["max_length"] = sa_type_length
 
 
-def make_field(column: Column) -> FieldInfo:  # type: ignore[type-arg]
+def _info_from(mapping: Mapping[str, Any]) -> Info:
     info = Info()
-    if column.info:
+    if mapping:
         for key in Info.__annotations__.keys():  # pylint: disable=no-member
-            if key in column.info:
-                info[key] = column.info[key]  # type: ignore[misc]
+            if key in mapping:
+                info[key] = mapping[key]  # type: ignore[misc]
+    return info
+
+
+def _make_field_info(info: Info) -> FieldInfo:
+    field = cast(FieldInfo, Field(**compat.field_kwargs(info)))  # type: ignore[arg-type]
+    if compat.PYDANTIC_V2 and "const" in info:
+        compat.set_const(field, info["const"])
+    return field
+
+
+def make_field(column: Column, *, for_create: bool = False) -> FieldInfo:  # type: ignore[type-arg]
+    """`FieldInfo` of `column`. If `for_create`, values that the database can generate (see `is_server_generated`)
+    are not required, and neither are they generated in Python by a callable `default` of the column."""
+    info = _info_from(column.info)
 
     if "max_length" not in info:
         _maybe_set_max_length_from_column(info, column)
@@ -93,15 +178,67 @@ def make_field(column: Column) -> FieldInfo:  # type: ignore[type-arg]
             " These two attributes are mutually-exclusive"
         )
 
-    if "default" not in info and "default_factory" not in info and column.default and column.default.is_callable:
-        return cast(FieldInfo, Field(**info, default_factory=column.default.arg.__wrapped__))  # type: ignore[misc]
+    if "default" not in info and "default_factory" not in info:
+        if _left_to_database(column, for_create):
+            info["default"] = None
+        elif column.default and column.default.is_callable:
+            info["default_factory"] = column.default.arg.__wrapped__
+        else:
+            info["default"] = _get_default_scalar(column)
+    return _make_field_info(info)
+
+
+def _make_property_field(info: Info, doc: Optional[str], default: Any = None) -> FieldInfo:
+    # values computed by the database (or by Python, for hybrids) are never required by default
+    if "description" not in info and doc:
+        info["description"] = doc
+    if "default" not in info and "default_factory" not in info:
+        info["default"] = default
+    return _make_field_info(info)
 
-    if "default_factory" in info:
-        return cast(FieldInfo, Field(**info))
 
-    # pop `default` because it is not a keyword argument of `Field`
-    default = info.pop("default") if "default" in info else _get_default_scalar(column)
-    return cast(FieldInfo, Field(default, **info))  # type: ignore[misc]
+def _make_composite_model(prop: CompositeProperty) -> Tuple[type, FieldInfo]:  # type: ignore[type-arg]
+    composite_class = prop.composite_class
+    # the composite attributes are expected to be named like the parameters of its constructor,
+    # which receives the column values in order
+    names = list(pyinspect.signature(composite_class).parameters)
+    if len(names) != len(prop.columns):
+        names = [column_prop.key for column_prop in prop.props]
+    nested_fields = {name: (infer_python_type(column), make_field(column)) for name, column in zip(names, prop.columns)}
+    model = create_model(composite_class.__name__, __config__=OrmConfig, **nested_fields)  # type: ignore[call-overload]
+    if any(column.nullable for column in prop.columns):
+        return Optional[model], _make_property_field(_info_from(prop.info), prop.doc)  # type: ignore[return-value]
+    return model, _make_property_field(_info_from(prop.info), prop.doc, default=...)
+
+
+def _hybrid_return_type(hybrid: hybrid_property) -> Optional[type]:
+    try:
+        return cast(type, get_type_hints(hybrid.fget)["return"])
+    except (KeyError, NameError, TypeError):
+        return cast(Optional[type], getattr(hybrid.fget, "__annotations__", {}).get("return"))
+
+
+def _with_json_model(column: Column, python_type: type) -> type:  # type: ignore[type-arg]
+    # JSON columns can declare the model of their documents, which are then validated lazily
+    json_model = column.info.get("json_model")
+    if json_model is None:
+        return python_type
+    lazy_type: Any = LazyJson[json_model]  # type: ignore[misc]
+    return Optional[lazy_type] if is_optional(python_type) else lazy_type  # type: ignore[no-any-return]
+
+
+def _candidates(exclude: Optional[Container[str]], include: Optional[Container[str]]) -> Callable[[str], bool]:
+    if exclude and include:
+        raise ValueError("`exclude` and `include` are mutually-exclusive")
+
+    def is_candidate(key: str) -> bool:
+        if exclude:
+            return key not in exclude
+        if include:
+            return key in include
+        return True
+
+    return is_candidate
 
 
 def fields_from(
@@ -110,21 +247,59 @@ def fields_from(
     exclude: Optional[Container[str]] = None,
     include: Optional[Container[str]] = None,
     transform: Callable[[str, type, FieldInfo], Tuple[type, FieldInfo]] = func.unchanged,
+    for_create: bool = False,
 ) -> Dict[str, Tuple[type, FieldInfo]]:
-    if exclude and include:
-        raise ValueError("`exclude` and `include` are mutually-exclusive")
+    is_candidate = _candidates(exclude, include)
     mapper = inspect(db_model)
-    candidate_attrs = mapper.attrs
-    if exclude:
-        candidate_attrs = (attr for attr in mapper.attrs if attr.key not in exclude)
-    elif include:
-        candidate_attrs = (attr for attr in mapper.attrs if attr.key in include)
     fields = {}
-    for attr in candidate_attrs:
+    for attr in mapper.attrs:
+        if not is_candidate(attr.key):
+            continue
+        name = attr.key
         if isinstance(attr, ColumnProperty) and attr.columns:
-            name = attr.key
             column = attr.columns[0]
+            if for_create and (not isinstance(column, Column) or is_read_only(column)):
+                # values that can't be written, like those of SQL expressions and computed columns
+                continue
             python_type = infer_python_type(column)
-            field = make_field(column)
+            if isinstance(column, Column):
+                python_type = _with_json_model(column, python_type)
+                if _left_to_database(column, for_create):
+                    python_type = Optional[python_type]  # type: ignore[assignment]
+                field = make_field(column, for_create=for_create)
+            else:
+                field = _make_property_field(_info_from(attr.info), attr.doc)
             fields[name] = transform(name, python_type, field)
+        elif isinstance(attr, CompositeProperty):
+            fields[name] = transform(name, *_make_composite_model(attr))
+
+    for name, descriptor in mapper.all_orm_descriptors.items():
+        if descriptor.extension_type is HYBRID_PROPERTY and name not in fields and is_candidate(name):
+            if for_create and descriptor.fset is None:
+                continue
+            return_type = _hybrid_return_type(descriptor)
+            if return_type is not None:
+                fields[name] = transform(name, return_type, _make_property_field(Info(), descriptor.__doc__))
+    return fields
+
+
+def fields_from_table(
+    table: Table,
+    *,
+    exclude: Optional[Container[str]] = None,
+    include: Optional[Container[str]] = None,
+    transform: Callable[[str, type, FieldInfo], Tuple[type, FieldInfo]] = func.unchanged,
+    for_create: bool = False,
+) -> Dict[str, Tuple[type, FieldInfo]]:
+    """Like `fields_from`, but from the columns of a Core `Table` (e.g. a reflected one), named by their keys."""
+    is_candidate = _candidates(exclude, include)
+    fields = {}
+    for column in table.columns:
+        # the key is a `quoted_name`, which Pydantic 1.8 rejects as a field name
+        name = str(column.key)
+        if is_candidate(name) and not (for_create and is_read_only(column)):
+            python_type = _with_json_model(column, infer_python_type(column))
+            if _left_to_database(column, for_create):
+                python_type = Optional[python_type]  # type: ignore[assignment]
+            fields[name] = transform(name, python_type, make_field(column, for_create=for_create))
     return fields
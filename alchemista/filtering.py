@@ -0,0 +1,137 @@
+"""Filter models (e.g. for query parameters) of SQLAlchemy models, aware of which columns are indexed."""
+
+import enum
+import warnings
+from typing import Any, Callable, Container, Dict, List, NamedTuple, Optional, Type, Union, cast, get_origin
+from weakref import WeakKeyDictionary
+
+from pydantic import BaseModel, Field, create_model
+from sqlalchemy import and_, inspect, true
+from sqlalchemy.orm import ColumnProperty
+from sqlalchemy.sql import ColumnElement
+
+from alchemista import compat
+from alchemista.config import Config, ForbidExtraConfig
+from alchemista.field import _candidates, infer_python_type, is_indexed
+from alchemista.typing import Literal, non_optional
+
+UNINDEXED_POLICIES = ("allow", "warn", "forbid")
+
+# how each operator compares a column to a value, by the suffix of the filters that use it
+_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    "": lambda column, value: column == value,
+    "in": lambda column, value: column.in_(value),
+    "gt": lambda column, value: column > value,
+    "lt": lambda column, value: column < value,
+    "like": lambda column, value: column.like(value),
+}
+
+
+class UnindexedFilterWarning(UserWarning):
+    pass
+
+
+class _Filter(NamedTuple):
+    attribute: str
+    operator: str
+    indexed: bool
+
+
+class _FilterSpec(NamedTuple):
+    db_model: type
+    filters: Dict[str, _Filter]
+    unindexed: str
+
+
+_SPECS: "WeakKeyDictionary[Type[BaseModel], _FilterSpec]" = WeakKeyDictionary()
+
+
+def _operators(python_type: Any) -> Dict[str, Any]:
+    """Type of the value of each operator of the filters on a column of `python_type`."""
+    operators = {"": python_type, "in": List[python_type]}
+    # only equality makes sense for a set of choices
+    choices = get_origin(python_type) is Literal or compat.lenient_issubclass(python_type, enum.Enum)
+    if python_type is not bool and not choices:
+        operators.update(gt=python_type, lt=python_type)
+    if python_type is str:
+        operators["like"] = str
+    return operators
+
+
+def filter_model_from(
+    db_model: type,
+    *,
+    exclude: Optional[Container[str]] = None,
+    include: Optional[Container[str]] = None,
+    unindexed: str = "allow",
+    __config__: Config = ForbidExtraConfig,
+) -> Type[BaseModel]:
+    """Model of the filters on the columns of `db_model`, all optional, to be compiled with `where_from`.
+
+    Each column `name` gets the filters `name` (equality), `name__in`, `name__gt` and `name__lt`
+    (except for booleans and enums), plus `name__like` for strings, typed like the column.
+    Filters on columns that are not indexed (see `field.is_indexed`) are generated if `unindexed` is `"allow"`,
+    also generated but warned about when used if it is `"warn"`, and not generated if it is `"forbid"`."""
+    if unindexed not in UNINDEXED_POLICIES:
+        raise ValueError(
+            f"Unsupported `unindexed` policy `{unindexed}`. Expected one of {', '.join(UNINDEXED_POLICIES)}"
+        )
+    is_candidate = _candidates(exclude, include)
+    fields: Dict[str, Any] = {}
+    filters: Dict[str, _Filter] = {}
+    for attr in inspect(db_model).attrs:
+        if not isinstance(attr, ColumnProperty) or len(attr.columns) != 1:
+            continue
+        if not is_candidate(attr.key):
+            continue
+        column = attr.columns[0]
+        indexed = is_indexed(column)
+        if not indexed and unindexed == "forbid":
+            continue
+        for operator, filter_type in _operators(non_optional(infer_python_type(column))).items():
+            name = f"{attr.key}__{operator}" if operator else attr.key
+            fields[name] = (Optional[filter_type], Field(None, description=attr.doc))
+            filters[name] = _Filter(attr.key, operator, indexed)
+    model = cast(
+        Type[BaseModel],
+        create_model(  # type: ignore[call-overload,unused-ignore]
+            f"{db_model.__name__}Filter", __config__=__config__, **fields
+        ),
+    )
+    _SPECS[model] = _FilterSpec(db_model, filters, unindexed)
+    return model
+
+
+def _spec_of(model: Type[BaseModel]) -> _FilterSpec:
+    try:
+        return _SPECS[model]
+    except KeyError:
+        raise ValueError(f"{model.__name__} was not generated by `filter_model_from`") from None
+
+
+def where_from(filters: BaseModel) -> ColumnElement:  # type: ignore[type-arg]
+    """WHERE clause of the filters set (i.e. not `None`) in `filters`,
+    an instance of a model from `filter_model_from`."""
+    spec = _spec_of(type(filters))
+    conditions = []
+    for name, value in compat.to_dict(filters, exclude_none=True).items():
+        filter_ = spec.filters[name]
+        if not filter_.indexed and spec.unindexed == "warn":
+            warnings.warn(f"Filter `{name}` is on a column that is not indexed", UnindexedFilterWarning, stacklevel=2)
+        conditions.append(_OPERATORS[filter_.operator](getattr(spec.db_model, filter_.attribute), value))
+    return and_(true(), *conditions)
+
+
+def index_report(filters: Union[Type[BaseModel], BaseModel]) -> Dict[str, bool]:
+    """Whether each filter can use an index, for a model from `filter_model_from`
+    or only for the filters set in an instance.
+
+    `like` filters whose pattern starts with a wildcard can't use an index."""
+    if isinstance(filters, BaseModel):
+        spec = _spec_of(type(filters))
+        report = {}
+        for name, value in compat.to_dict(filters, exclude_none=True).items():
+            filter_ = spec.filters[name]
+            report[name] = filter_.indexed and not (filter_.operator == "like" and value[:1] in ("%", "_"))
+        return report
+    return {name: filter_.indexed for name, filter_ in _spec_of(filters).filters.items()}
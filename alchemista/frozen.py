@@ -0,0 +1,67 @@
+"""Immutable models that are hashable by their primary key, e.g. to be used as dictionary keys or in sets."""
+
+from operator import attrgetter
+from typing import Any, Callable, Collection, Tuple, Type
+
+from pydantic import BaseModel
+from sqlalchemy import inspect
+
+from alchemista import compat
+from alchemista.config import Config
+
+
+def key_of(db_model: type, names: Collection[str]) -> Tuple[str, ...]:
+    """Names of the fields that identify instances of a model of `db_model` with fields `names`: those of the primary
+    key of the mapper, or all of `names` if some column of the primary key is not a field."""
+    mapper = inspect(db_model)
+    key = tuple(mapper.get_property_by_column(column).key for column in mapper.primary_key)
+    return key if set(key).issubset(names) else tuple(names)
+
+
+def _hash_of(key: Any) -> int:
+    try:
+        return hash(key)
+    except TypeError:
+        # e.g. lists of JSON columns in the fallback to all fields: equal instances still have equal hashable values
+        values = key if isinstance(key, tuple) else (key,)
+        return hash(tuple(value for value in values if _is_hashable(value)))
+
+
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def frozen_base(name: str, key: Tuple[str, ...], config: Config) -> Type[BaseModel]:
+    """Base of an immutable model with `config`, whose instances hash the values of the `key` fields (computing it only
+    once per instance) and compare the hash before comparing all fields. Unhashable values (e.g. lists) are left out of
+    the hash.
+
+    `create_model` doesn't take both a base and a configuration, so the base is the one to carry `config`."""
+    get_key: Callable[[BaseModel], Any] = lambda _: ()
+    if key:
+        get_key = attrgetter(*key)
+
+    def __hash__(self: BaseModel) -> int:
+        try:
+            return self._hash  # type: ignore[attr-defined,no-any-return]  # pylint: disable=protected-access
+        except AttributeError:
+            object.__setattr__(self, "_hash", _hash_of(get_key(self)))
+            return self._hash  # type: ignore[attr-defined,no-any-return]  # pylint: disable=protected-access
+
+    def __eq__(self: BaseModel, other: Any) -> bool:
+        if self is other:
+            return True
+        if type(other) is not type(self):
+            return NotImplemented
+        return hash(self) == hash(other) and self.__dict__ == other.__dict__
+
+    namespace = {"__slots__": ("_hash",), "__hash__": __hash__, "__eq__": __eq__, "__module__": __name__}
+    if compat.PYDANTIC_V2:
+        namespace["model_config"] = {**config, "frozen": True}
+    else:
+        namespace["Config"] = type("Config", (config,), {"frozen": True})
+    return type(f"Frozen{name}", (BaseModel,), namespace)
@@ -0,0 +1,84 @@
+from typing import Any, Callable, Container, Dict, Iterable, List, Optional, Tuple, Type, cast
+
+from pydantic import BaseModel, create_model
+from pydantic.fields import FieldInfo
+from sqlalchemy import inspect
+from sqlalchemy.orm import ColumnProperty
+from sqlalchemy.orm.exc import UnmappedColumnError
+
+from alchemista import compat, func
+from alchemista.config import Config, OrmConfig
+from alchemista.field import fields_from
+from alchemista.model import model_from, register_model
+
+
+class Hierarchy:
+    """Models generated for a SQLAlchemy inheritance hierarchy, one per mapper.
+
+    The model of each subclass inherits from the model of its parent and only declares the fields its mapper adds.
+    `from_orm` picks the model of each instance via its `polymorphic_identity`."""
+
+    def __init__(self, db_model: type, models: Dict[type, Type[BaseModel]]) -> None:
+        self.db_model = db_model
+        self.models = models
+        mapper = inspect(db_model)
+        self._by_class = dict(models)
+        self._by_identity = {
+            descendant.polymorphic_identity: models[descendant.class_]
+            for descendant in mapper.self_and_descendants
+            if descendant.polymorphic_identity is not None
+        }
+        self._discriminator: Optional[str] = None
+        if mapper.polymorphic_on is not None:
+            try:
+                prop = mapper.get_property_by_column(mapper.polymorphic_on)
+            except UnmappedColumnError:
+                # the discriminator may be a SQL expression that isn't mapped to any attribute
+                prop = None
+            if isinstance(prop, ColumnProperty):
+                self._discriminator = prop.key
+
+    def __getitem__(self, db_model: type) -> Type[BaseModel]:
+        return self.models[db_model]
+
+    def model_for(self, obj: Any) -> Type[BaseModel]:
+        if self._discriminator is not None:
+            model = self._by_identity.get(getattr(obj, self._discriminator))
+            if model is not None:
+                return model
+        return self._by_class.get(type(obj), self.models[self.db_model])
+
+    def from_orm(self, obj: Any) -> BaseModel:
+        return compat.from_orm(self.model_for(obj), obj)
+
+    def from_orm_all(self, objs: Iterable[Any]) -> List[BaseModel]:
+        return [compat.from_orm(self.model_for(obj), obj) for obj in objs]
+
+
+def hierarchy_from(
+    db_model: type,
+    *,
+    exclude: Optional[Container[str]] = None,
+    include: Optional[Container[str]] = None,
+    transform: Callable[[str, type, FieldInfo], Tuple[type, FieldInfo]] = func.unchanged,
+    __config__: Config = OrmConfig,
+) -> Hierarchy:
+    """Generate models for `db_model` and all of its mapped subclasses, mirroring the mapper hierarchy."""
+    mapper = inspect(db_model)
+    models = {
+        db_model: model_from(db_model, exclude=exclude, include=include, transform=transform, __config__=__config__)
+    }
+    for descendant in mapper.self_and_descendants:
+        if descendant is mapper:
+            continue
+        base = models[descendant.inherits.class_]
+        base_fields = compat.field_names(base)
+        fields = fields_from(descendant.class_, exclude=exclude, include=include, transform=transform)
+        own_fields = {name: field for name, field in fields.items() if name not in base_fields}
+        model = cast(
+            Type[BaseModel],
+            create_model(descendant.class_.__name__, __base__=base, **own_fields),  # type: ignore[call-overload]
+        )
+        register_model(model, descendant.class_)
+        models[descendant.class_] = model
+    return Hierarchy(db_model, models)
@@ -0,0 +1,101 @@
+"""Values that are only validated when accessed, like JSON documents of columns with a `json_model` in `info`."""
+
+import json
+from typing import Any, Callable, ClassVar, Dict, Generator, Type
+from weakref import WeakValueDictionary
+
+from pydantic import BaseModel
+
+from alchemista import compat
+
+_UNSET: Any = object()
+
+
+class LazyJson:
+    """A JSON document (a string, or what the database driver already decoded) to be validated as `LazyJson[Model]`
+    only when `value` (or `validate()`) is first accessed.
+
+    Serializing the model that holds it (e.g. with `.json()`) outputs the document as it is, without validating it."""
+
+    __slots__ = ("raw", "_value")
+
+    model: ClassVar[Type[BaseModel]]
+    # the classes are freed along with the fields that use them
+    _parametrized: ClassVar["WeakValueDictionary[Type[BaseModel], Type[LazyJson]]"] = WeakValueDictionary()
+
+    def __init__(self, raw: Any) -> None:
+        self.raw = raw
+        self._value: Any = _UNSET
+
+    def __class_getitem__(cls, model: Type[BaseModel]) -> Type["LazyJson"]:
+        # one class per model, shared by all fields (and models) that use it
+        try:
+            return cls._parametrized[model]
+        except KeyError:
+            lazy_class = type(f"LazyJson[{model.__name__}]", (cls,), {"__slots__": (), "model": model})
+            return cls._parametrized.setdefault(model, lazy_class)
+
+    @property
+    def data(self) -> Any:
+        """The document as Python objects (e.g. `dict`), decoding it if it is a string, but without validating it."""
+        if isinstance(self.raw, (str, bytes, bytearray)):
+            return json.loads(self.raw)
+        if isinstance(self.raw, BaseModel):
+            return compat.to_dict(self.raw)
+        return self.raw
+
+    @property
+    def value(self) -> Any:
+        """The document validated as `model`, which is only done on the first access."""
+        if self._value is _UNSET:
+            self._value = self.raw if isinstance(self.raw, self.model) else compat.parse_as(self.model, self.data)
+        return self._value
+
+    def validate(self) -> Any:
+        return self.value
+
+    @property
+    def is_validated(self) -> bool:
+        return self._value is not _UNSET
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, LazyJson) and type(self) is type(other) and self.data == other.data
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.raw!r})"
+
+    @classmethod
+    def _wrap(cls, value: Any) -> "LazyJson":
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, LazyJson):
+            return cls(value.raw)
+        return cls(value)
+
+    # Pydantic v1
+
+    @classmethod
+    def __get_validators__(cls) -> Generator[Callable[[Any], Any], None, None]:
+        yield cls._wrap
+
+    @classmethod
+    def __modify_schema__(cls, field_schema: Dict[str, Any]) -> None:
+        field_schema.update(compat.json_schema(cls.model, by_alias=True, ref_template=compat.DEFAULT_REF_TEMPLATE))
+
+    # Pydantic v2
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, _source: Any, _handler: Any) -> Any:
+        from pydantic_core import core_schema  # pylint: disable=import-outside-toplevel,import-error
+
+        return core_schema.no_info_plain_validator_function(
+            cls._wrap, serialization=core_schema.plain_serializer_function_ser_schema(lambda value: value.data)
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(cls, _core_schema: Any, handler: Any) -> Any:
+        return handler(cls.model.__pydantic_core_schema__)  # type: ignore[attr-defined]
+
+
+# how v1 serializes `LazyJson` to JSON (e.g. in `.json()`), as `json_encoders` of the models that use it
+JSON_ENCODERS: Dict[type, Callable[[Any], Any]] = {LazyJson: lambda value: value.data}
@@ -1,9 +1,9 @@
 from typing import Container, Optional, Type
 
 from deprecated import deprecated
-from pydantic import BaseConfig, BaseModel
+from pydantic import BaseModel
 
-from alchemista.config import OrmConfig
+from alchemista.config import Config, OrmConfig
 from alchemista.model import model_from
 
 
@@ -11,7 +11,7 @@ from alchemista.model import model_from
 def sqlalchemy_to_pydantic(
     db_model: type,
     *,
-    config: Type[BaseConfig] = OrmConfig,
+    config: Config = OrmConfig,
     exclude: Optional[Container[str]] = None,
 ) -> Type[BaseModel]:
     return model_from(db_model, __config__=config, exclude=exclude)
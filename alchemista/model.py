@@ -1,11 +1,79 @@
-from typing import Callable, Container, Optional, Tuple, Type, cast
+from typing import (
+    Any,
+    Callable,
+    Container,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+    cast,
+    get_args,
+)
+from weakref import WeakKeyDictionary, WeakSet
 
-from pydantic import BaseConfig, BaseModel, create_model
+from pydantic import BaseModel, create_model
 from pydantic.fields import FieldInfo
+from sqlalchemy import Table, inspect
 
-from alchemista import func
-from alchemista.config import OrmConfig
-from alchemista.field import fields_from
+from alchemista import binary, compat, func, lazy
+from alchemista.binary import make_deferring, zero_copy_fields
+from alchemista.config import Config, OrmConfig
+from alchemista.field import fields_from, fields_from_table
+from alchemista.frozen import frozen_base, key_of
+from alchemista.schema import schema_of
+from alchemista.trusted import make_trusted
+
+# neither the models nor their mappers are kept alive by these, so models of disposed mappers can be freed
+_DB_MODELS: "WeakKeyDictionary[Type[BaseModel], type]" = WeakKeyDictionary()
+# the models generated from each mapper
+_MODELS: "WeakKeyDictionary[Any, WeakSet[Type[BaseModel]]]" = WeakKeyDictionary()
+
+
+class _Options(NamedTuple):
+    trusted: bool = False
+    frozen: bool = False
+    deferred: FrozenSet[str] = frozenset()
+
+
+# the options of `model_from` that change the behaviour of generated models, so that derived models keep them
+_OPTIONS: "WeakKeyDictionary[Type[BaseModel], _Options]" = WeakKeyDictionary()
+
+
+def _types_in(python_type: Any) -> Iterator[Any]:
+    yield python_type
+    for arg in get_args(python_type):
+        yield from _types_in(arg)
+
+
+def _json_encoders(fields: Dict[str, Tuple[Any, FieldInfo]]) -> Dict[type, Callable[[Any], Any]]:
+    """The `json_encoders` needed by the lazy and zero-copy types of `fields`, if any."""
+    encoders: Dict[type, Callable[[Any], Any]] = {}
+    for python_type, _ in fields.values():
+        for inner_type in _types_in(python_type):
+            if compat.lenient_issubclass(inner_type, lazy.LazyJson):
+                encoders.update(lazy.JSON_ENCODERS)
+            elif compat.lenient_issubclass(inner_type, (binary.Buffer, binary.Deferred)):
+                encoders.update(binary.JSON_ENCODERS)
+    return encoders
+
+
+def _create(
+    name: str, db_model: Optional[type], fields: Dict[str, Tuple[Any, FieldInfo]], config: Config, options: _Options
+) -> Type[BaseModel]:
+    base = frozen_base(name, key_of(db_model, fields), config) if options.frozen and db_model else None
+    model = cast(
+        Type[BaseModel],
+        create_model(name, __config__=None if base else config, __base__=base, **fields),  # type: ignore[call-overload]
+    )
+    if options.trusted and db_model:
+        make_trusted(model, db_model)
+    if options.deferred:
+        make_deferring(model, set(options.deferred))
+    return model
 
 
 def model_from(
@@ -14,10 +82,72 @@ def model_from(
     exclude: Optional[Container[str]] = None,
     include: Optional[Container[str]] = None,
     transform: Callable[[str, type, FieldInfo], Tuple[type, FieldInfo]] = func.unchanged,
-    __config__: Type[BaseConfig] = OrmConfig,
+    precompute_schema: bool = False,
+    trusted: bool = False,
+    zero_copy: bool = False,
+    for_create: bool = False,
+    frozen: bool = False,
+    __config__: Config = OrmConfig,
 ) -> Type[BaseModel]:
-    fields = fields_from(db_model, exclude=exclude, include=include, transform=transform)
-    return cast(
-        Type[BaseModel],
-        create_model(db_model.__name__, __config__=__config__, **fields),  # type: ignore[arg-type]
-    )
+    fields = fields_from(db_model, exclude=exclude, include=include, transform=transform, for_create=for_create)
+    deferred = zero_copy_fields(db_model, fields) if zero_copy else set()
+    encoders = _json_encoders(fields)
+    if encoders:
+        __config__ = compat.with_json_encoders(__config__, encoders)
+    options = _Options(trusted, frozen, frozenset(deferred))
+    model = _create(db_model.__name__, db_model, fields, __config__, options)
+    register_model(model, db_model)
+    _OPTIONS[model] = options
+    if precompute_schema:
+        schema_of(model)
+    return model
+
+
+def register_model(model: Type[BaseModel], db_model: type) -> None:
+    """Record that `model` was generated from `db_model` (e.g. by `hierarchy_from`),
+    for `db_model_of` and `generated_models`."""
+    _DB_MODELS[model] = db_model
+    _MODELS.setdefault(inspect(db_model), WeakSet()).add(model)
+
+
+def db_model_of(model: Type[BaseModel]) -> Optional[type]:
+    """The SQLAlchemy model that `model` was generated from by `model_from` (or `hierarchy_from`), if any."""
+    return _DB_MODELS.get(model)
+
+
+def derive_model(model: Type[BaseModel], fields: Dict[str, Tuple[Any, FieldInfo]]) -> Type[BaseModel]:
+    """A model with the name and configuration of `model`, but with `fields` (e.g. some of those of `model`).
+    If `model` was generated by `model_from`, the derived model is also trusted, frozen or zero-copy like it."""
+    options = _OPTIONS.get(model, _Options())
+    options = options._replace(deferred=options.deferred.intersection(fields))
+    derived = _create(model.__name__, _DB_MODELS.get(model), fields, compat.model_config(model), options)
+    derived.__doc__ = model.__doc__
+    return derived
+
+
+def generated_models(db_model: Optional[type] = None) -> List[Type[BaseModel]]:
+    """The models generated by `model_from` or `hierarchy_from` (from `db_model`, if given) that are still alive,
+    in no particular order."""
+    if db_model is None:
+        return [model for models in list(_MODELS.values()) for model in models]
+    return list(_MODELS.get(inspect(db_model), ()))
+
+
+def model_from_table(
+    table: Table,
+    *,
+    name: Optional[str] = None,
+    exclude: Optional[Container[str]] = None,
+    include: Optional[Container[str]] = None,
+    transform: Callable[[str, type, FieldInfo], Tuple[type, FieldInfo]] = func.unchanged,
+    for_create: bool = False,
+    __config__: Config = OrmConfig,
+) -> Type[BaseModel]:
+    """Like `model_from`, but from a Core `Table` (e.g. a reflected one).
+    The model is named `name`, or the name of the table in CamelCase by default."""
+    fields = fields_from_table(table, exclude=exclude, include=include, transform=transform, for_create=for_create)
+    name = name or "".join(part.capitalize() for part in table.name.split("_"))
+    encoders = _json_encoders(fields)
+    if encoders:
+        __config__ = compat.with_json_encoders(__config__, encoders)
+    return cast(Type[BaseModel], create_model(name, __config__=__config__, **fields))  # type: ignore[call-overload]
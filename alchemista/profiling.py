@@ -0,0 +1,175 @@
+"""Profiling of the generation of models with `model_from`, e.g. of all the models of an application."""
+
+import importlib
+import json
+import sys
+import time
+import tracemalloc
+from contextlib import ExitStack, contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Sequence, Type
+
+from pydantic import BaseModel
+from sqlalchemy.orm import configure_mappers
+
+from alchemista import compat, field, model
+
+# functions whose time is reported separately, by the modules that call them
+STAGES = {
+    "infer_python_type": (field,),
+    "make_field": (field,),
+    "create_model": (field, model),
+}
+
+
+class ModelProfile(NamedTuple):
+    name: str
+    fields: int
+    seconds: float
+    """Wall time of `model_from`, including the time of each stage."""
+    stages: Dict[str, float]
+    """Seconds spent in each of `STAGES`."""
+    allocated: int
+    """Bytes allocated by `model_from` that were still allocated after it returned."""
+    peak: int
+    """Peak of the bytes allocated while `model_from` ran."""
+    class_size: int
+    """Shallow size in bytes of the model class, its namespace and its fields."""
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(zip(ModelProfile._fields, self))
+
+
+def import_object(path: str) -> Any:
+    """The object at `path`, e.g. `package.module:Base` or `package.module:Namespace.Base`."""
+    module_name, _, attributes = path.partition(":")
+    if not module_name or not attributes:
+        raise ValueError(f"Expected `module:attribute`, got {path!r}")
+    obj: Any = importlib.import_module(module_name)
+    for attribute in attributes.split("."):
+        obj = getattr(obj, attribute)
+    return obj
+
+
+def db_models_of(base: Any) -> List[type]:
+    """The classes mapped by the registry of the declarative `base`, sorted by name."""
+    return sorted((mapper.class_ for mapper in base.registry.mappers), key=lambda db_model: db_model.__name__)
+
+
+def class_size(model_class: Type[BaseModel]) -> int:
+    fields = compat.model_fields(model_class)
+    return (
+        sys.getsizeof(model_class)
+        + sys.getsizeof(vars(model_class))
+        + sum(sys.getsizeof(field_info) for _, field_info in fields.values())
+    )
+
+
+@contextmanager
+def _timed(stages: Dict[str, float]) -> Iterator[None]:
+    # replaces the functions of each stage in the modules that call them, so this is not thread-safe
+    def wrap(name: str, function: Callable[..., Any]) -> Callable[..., Any]:
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                stages[name] += time.perf_counter() - start
+
+        return timed
+
+    with ExitStack() as stack:
+        for name, modules in STAGES.items():
+            for module in modules:
+                function = getattr(module, name)
+                setattr(module, name, wrap(name, function))
+                stack.callback(setattr, module, name, function)
+        yield
+
+
+def profile(db_models: Iterable[type], **kwargs: Any) -> List[ModelProfile]:
+    """Generate a model of each of `db_models` with `model_from(db_model, **kwargs)`, measuring each generation.
+
+    Mappers are configured beforehand, so that their configuration is not measured as part of the first model.
+    Memory is measured with `tracemalloc`, which is started (and then stopped) if it is not tracing already."""
+    configure_mappers()
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    profiles = []
+    try:
+        for db_model in db_models:
+            stages = dict.fromkeys(STAGES, 0.0)
+            # `reset_peak` is only available since Python 3.9
+            if hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()  # pylint: disable=no-member
+            before = tracemalloc.get_traced_memory()[0]
+            with _timed(stages):
+                start = time.perf_counter()
+                model_class = model.model_from(db_model, **kwargs)
+                seconds = time.perf_counter() - start
+            current, peak = tracemalloc.get_traced_memory()
+            profiles.append(
+                ModelProfile(
+                    db_model.__name__,
+                    len(compat.field_names(model_class)),
+                    seconds,
+                    stages,
+                    current - before,
+                    max(peak - before, 0),
+                    class_size(model_class),
+                )
+            )
+    finally:
+        if started:
+            tracemalloc.stop()
+    return profiles
+
+
+def _size(size: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def format_table(profiles: Sequence[ModelProfile]) -> str:
+    """The profiles as a plain text table, in the order given, followed by a row of totals."""
+    header = ["model", "fields", "ms", *(f"{stage} ms" for stage in STAGES), "allocated", "peak", "class size"]
+
+    def row(model_profile: ModelProfile) -> List[str]:
+        return [
+            model_profile.name,
+            str(model_profile.fields),
+            f"{model_profile.seconds * 1000:.2f}",
+            *(f"{model_profile.stages[stage] * 1000:.2f}" for stage in STAGES),
+            _size(model_profile.allocated),
+            _size(model_profile.peak),
+            _size(model_profile.class_size),
+        ]
+
+    total = ModelProfile(
+        "total",
+        sum(profile.fields for profile in profiles),
+        sum(profile.seconds for profile in profiles),
+        {stage: sum(profile.stages[stage] for profile in profiles) for stage in STAGES},
+        sum(profile.allocated for profile in profiles),
+        max((profile.peak for profile in profiles), default=0),
+        sum(profile.class_size for profile in profiles),
+    )
+    rows = [header, *(row(profile) for profile in profiles), row(total)]
+    widths = [max(len(cells[index]) for cells in rows) for index in range(len(header))]
+    lines = [
+        "  ".join(
+            cell.ljust(width) if index == 0 else cell.rjust(width)
+            for index, (cell, width) in enumerate(zip(cells, widths))
+        )
+        for cells in rows
+    ]
+    lines.insert(1, "  ".join("-" * width for width in widths))
+    lines.insert(-1, lines[1])
+    return "\n".join(lines)
+
+
+def format_json(profiles: Sequence[ModelProfile]) -> str:
+    return json.dumps([profile.to_dict() for profile in profiles], indent=2)
@@ -0,0 +1,54 @@
+"""Reflection of tables from databases, cached on disk so that it doesn't need a round-trip on every start."""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Optional, Union
+
+from sqlalchemy import MetaData, Table
+from sqlalchemy.engine import Engine
+
+DEFAULT_DIRECTORY = Path(
+    os.environ.get("ALCHEMISTA_REFLECTION_CACHE", Path.home() / ".cache" / "alchemista" / "reflection")
+)
+
+
+class ReflectionCache:
+    """Tables reflected from databases, pickled to files in `directory`, keyed by database URL and table name.
+
+    The URL is rendered without its password, which is not stored. Cached tables are not updated when the database
+    changes, so they must be invalidated, e.g. after migrations. Only load files written by a trusted process,
+    since unpickling can run arbitrary code."""
+
+    def __init__(self, directory: Union[str, Path] = DEFAULT_DIRECTORY) -> None:
+        self.directory = Path(directory)
+
+    def _path(self, engine: Engine, name: str, schema: Optional[str]) -> Path:
+        key = "\0".join((engine.url.render_as_string(hide_password=True), schema or "", name))
+        return self.directory / f"{hashlib.sha256(key.encode()).hexdigest()}.pickle"
+
+    def table(self, engine: Engine, name: str, *, schema: Optional[str] = None) -> Table:
+        """Table `name` of the database of `engine`, reflected from it only if not cached yet."""
+        path = self._path(engine, name, schema)
+        try:
+            with open(path, "rb") as file:
+                return pickle.load(file)  # type: ignore[no-any-return]
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            # e.g. a file pickled by a version of SQLAlchemy that no longer has the classes of the table
+            pass
+        table = Table(name, MetaData(), schema=schema, autoload_with=engine)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # written to a temporary file first, so that concurrent jobs never read a partial file
+        temporary = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temporary, "wb") as file:
+            pickle.dump(table, file)
+        os.replace(temporary, path)
+        return table
+
+    def invalidate(self, engine: Engine, name: str, *, schema: Optional[str] = None) -> None:
+        self._path(engine, name, schema).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*.pickle"):
+            path.unlink()
@@ -0,0 +1,104 @@
+from typing import Any, Dict, Iterable, List, Optional, Type
+
+from pydantic import BaseModel
+from sqlalchemy import Column, Table, event, inspect
+from sqlalchemy.orm import Mapper
+
+from alchemista.model import model_from
+
+
+class TrackedModel:
+    """A model generated by `model_from` that is rebuilt on access after its source mapper changes."""
+
+    def __init__(self, db_model: type, kwargs: Dict[str, Any]) -> None:
+        self.db_model = db_model
+        self.kwargs = kwargs
+        self.dependents: List["TrackedModel"] = []
+        self._model: Optional[Type[BaseModel]] = None
+
+    @property
+    def model(self) -> Type[BaseModel]:
+        if self._model is None:
+            self._model = model_from(self.db_model, **self.kwargs)
+        return self._model
+
+    @property
+    def stale(self) -> bool:
+        return self._model is None
+
+    def invalidate(self) -> None:
+        stack = [self]
+        seen = set()
+        while stack:
+            tracked = stack.pop()
+            if id(tracked) not in seen:
+                seen.add(id(tracked))
+                tracked._model = None  # pylint: disable=protected-access
+                stack.extend(tracked.dependents)
+
+
+class Registry:
+    """Keeps track of generated models by their source mapper and invalidates them when the mapper changes.
+
+    Listens to `mapper_configured`, for (re)configured mappers, and `after_parent_attach`, for columns appended to a
+    mapped table. Changes that SQLAlchemy emits no event for (e.g. `Mapper.add_property`) need a call to `invalidate`.
+    Models of mappers that are disposed (e.g. by `registry.dispose()` or `clear_mappers()`) are no longer tracked,
+    so that they can be freed.
+    """
+
+    def __init__(self, *, listen: bool = True) -> None:
+        self._tracked: Dict[Mapper, List[TrackedModel]] = {}
+        self.listening = False
+        if listen:
+            self.listen()
+
+    def track(self, db_model: type, *, depends_on: Iterable[TrackedModel] = (), **kwargs: Any) -> TrackedModel:
+        """Register a model generated by `model_from(db_model, **kwargs)`.
+        The model is built on first access to `TrackedModel.model`."""
+        tracked = TrackedModel(db_model, kwargs)
+        for dependency in depends_on:
+            dependency.dependents.append(tracked)
+        self._tracked.setdefault(inspect(db_model), []).append(tracked)
+        return tracked
+
+    def tracked(self, db_model: Optional[type] = None) -> List[TrackedModel]:
+        if db_model is None:
+            return [tracked for tracked_models in self._tracked.values() for tracked in tracked_models]
+        return list(self._tracked.get(inspect(db_model), []))
+
+    def invalidate(self, db_model: type) -> None:
+        """Invalidate the models of `db_model`, of its subclasses (in an inheritance hierarchy) and their dependents."""
+        self._invalidate_mapper(inspect(db_model))
+
+    def _invalidate_mapper(self, mapper: Mapper) -> None:
+        for descendant in mapper.self_and_descendants:
+            for tracked in self._tracked.get(descendant, ()):
+                tracked.invalidate()
+
+    def _on_mapper_configured(self, mapper: Mapper, _: type) -> None:
+        self._invalidate_mapper(mapper)
+
+    def _on_column_attached(self, _: Column, parent: Any) -> None:  # type: ignore[type-arg]
+        if isinstance(parent, Table):
+            for mapper in list(self._tracked):
+                if parent in mapper.tables:
+                    self._invalidate_mapper(mapper)
+
+    def _on_class_uninstrument(self, cls: type) -> None:
+        for mapper in [mapper for mapper in self._tracked if mapper.class_ is cls]:
+            del self._tracked[mapper]
+
+    def listen(self) -> None:
+        if not self.listening:
+            event.listen(Mapper, "mapper_configured", self._on_mapper_configured)
+            event.listen(Column, "after_parent_attach", self._on_column_attached)
+            event.listen(object, "class_uninstrument", self._on_class_uninstrument, propagate=True)
+            self.listening = True
+
+    def close(self) -> None:
+        """Stop listening to SQLAlchemy events."""
+        if self.listening:
+            event.remove(Mapper, "mapper_configured", self._on_mapper_configured)
+            event.remove(Column, "after_parent_attach", self._on_column_attached)
+            event.remove(object, "class_uninstrument", self._on_class_uninstrument)
+            self.listening = False
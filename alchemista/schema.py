@@ -0,0 +1,98 @@
+import enum
+import hashlib
+import inspect
+from typing import Any, Dict, Sequence, Tuple, Type, get_args, get_origin
+from weakref import WeakKeyDictionary, finalize
+
+from pydantic import BaseModel
+
+from alchemista import compat
+
+_FINGERPRINTS: "WeakKeyDictionary[Type[BaseModel], str]" = WeakKeyDictionary()
+_SCHEMAS: Dict[Tuple[str, bool, str], Dict[str, Any]] = {}
+_DEFINITIONS: Dict[Tuple[Tuple[str, ...], bool, str], Dict[str, Any]] = {}
+# number of live models by fingerprint, whose cached schemas are dropped once the last of them is freed
+_REFERENCES: Dict[str, int] = {}
+
+
+def _describe(python_type: Any) -> str:
+    origin = get_origin(python_type)
+    if origin is not None:
+        args = ", ".join(_describe(arg) for arg in get_args(python_type))
+        return f"{_describe(origin)}[{args}]"
+    if isinstance(python_type, type):
+        if issubclass(python_type, BaseModel):
+            return fingerprint(python_type)
+        name = f"{python_type.__module__}.{python_type.__qualname__}"
+        if issubclass(python_type, enum.Enum):
+            return f"{name}{[member.value for member in python_type]}"
+        return name
+    return repr(python_type)
+
+
+def fingerprint(model: Type[BaseModel]) -> str:
+    """Digest of everything that affects the JSON schema of `model`,
+    so that structurally identical models (e.g. from repeated `model_from` calls) share it."""
+    try:
+        return _FINGERPRINTS[model]
+    except KeyError:
+        pass
+    digest = hashlib.sha256(model.__name__.encode())
+    config = compat.model_config(model)
+    if compat.PYDANTIC_V2:
+        digest.update(repr((sorted(config.items(), key=repr), model.__doc__)).encode())
+    else:
+        # all the settings (e.g. `extra` and `alias_generator`), but not the methods of `BaseConfig`
+        settings = {
+            name: getattr(config, name)
+            for name in dir(config)
+            if not name.startswith("_") and not inspect.ismethod(getattr(config, name))
+        }
+        digest.update(repr((sorted(settings.items()), model.__doc__)).encode())
+    for name, (python_type, field) in compat.model_fields(model).items():
+        digest.update(repr((name, _describe(python_type), field)).encode())
+    model_fingerprint = _FINGERPRINTS[model] = digest.hexdigest()
+    _REFERENCES[model_fingerprint] = _REFERENCES.get(model_fingerprint, 0) + 1
+    finalize(model, _release, model_fingerprint)
+    return model_fingerprint
+
+
+def _release(model_fingerprint: str) -> None:
+    _REFERENCES[model_fingerprint] -= 1
+    if _REFERENCES[model_fingerprint]:
+        return
+    del _REFERENCES[model_fingerprint]
+    for key in [key for key in _SCHEMAS if key[0] == model_fingerprint]:
+        del _SCHEMAS[key]
+    for definitions_key in [key for key in _DEFINITIONS if model_fingerprint in key[0]]:
+        del _DEFINITIONS[definitions_key]
+
+
+def schema_of(
+    model: Type[BaseModel], *, by_alias: bool = True, ref_template: str = compat.DEFAULT_REF_TEMPLATE
+) -> Dict[str, Any]:
+    """Same as `model.schema()` (`model.model_json_schema()` in Pydantic v2), but cached by `fingerprint(model)`
+    for as long as some model with that fingerprint is alive.
+    In v1, the cached schema is also stored in the model itself, so later `model.schema()` calls don't recompute it."""
+    key = (fingerprint(model), by_alias, ref_template)
+    if key not in _SCHEMAS:
+        _SCHEMAS[key] = compat.json_schema(model, by_alias=by_alias, ref_template=ref_template)
+    if not compat.PYDANTIC_V2:
+        model.__schema_cache__[(by_alias, ref_template)] = _SCHEMAS[key]
+    return _SCHEMAS[key]
+
+
+def definitions_of(
+    models: Sequence[Type[BaseModel]], *, by_alias: bool = True, ref_prefix: str = "#/components/schemas/"
+) -> Dict[str, Any]:
+    """JSON schema definitions of all `models` together, suitable for the `components/schemas` section of OpenAPI.
+    Types shared by the models (e.g. enums and nested models) are defined only once and referenced via `$ref`."""
+    key = (tuple(fingerprint(model) for model in models), by_alias, ref_prefix)
+    if key not in _DEFINITIONS:
+        _DEFINITIONS[key] = compat.json_schema_definitions(list(models), by_alias=by_alias, ref_prefix=ref_prefix)
+    return _DEFINITIONS[key]
+
+
+def clear_cache() -> None:
+    _SCHEMAS.clear()
+    _DEFINITIONS.clear()
@@ -0,0 +1,73 @@
+"""Models with a subset of the fields of a generated model (i.e. sparse fieldsets), with the options to load them."""
+
+from collections import OrderedDict
+from typing import Any, Iterable, NamedTuple, Optional, Tuple, Type
+from weakref import WeakKeyDictionary
+
+from pydantic import BaseModel
+from sqlalchemy import inspect
+from sqlalchemy.orm import ColumnProperty, CompositeProperty, load_only
+
+from alchemista import compat
+from alchemista.model import db_model_of, derive_model
+
+CACHE_SIZE = 256
+"""Number of subsets cached per model."""
+
+
+class Subset(NamedTuple):
+    model: Type[BaseModel]
+    options: Tuple[Any, ...]
+    """Loader options (e.g. for `Select.options`) that only load the columns of the fields of `model`,
+    or none if some field is not mapped to columns (e.g. a hybrid property, whose columns are unknown)."""
+
+
+def _load_only(db_model: type, names: Iterable[str]) -> Tuple[Any, ...]:
+    mapper = inspect(db_model)
+    attributes = []
+    for name in names:
+        prop = mapper.attrs.get(name)
+        if isinstance(prop, ColumnProperty):
+            attributes.append(getattr(db_model, name))
+        elif isinstance(prop, CompositeProperty):
+            attributes.extend(getattr(db_model, column_prop.key) for column_prop in prop.props)
+        else:
+            return ()
+    return (load_only(*attributes),)
+
+
+# by model, so that subsets are freed along with the model they were taken from
+_SUBSETS: "WeakKeyDictionary[Type[BaseModel], OrderedDict[frozenset[str], Subset]]" = WeakKeyDictionary()
+
+
+def _subset(model: Type[BaseModel], db_model: Optional[type], names: "frozenset[str]") -> Subset:
+    fields = {name: field for name, field in compat.model_fields(model).items() if name in names}
+    sub_model = derive_model(model, fields)
+    options = _load_only(db_model, fields) if db_model is not None else ()
+    return Subset(sub_model, options)
+
+
+def subset(model: Type[BaseModel], fields: Iterable[str]) -> Subset:
+    """Model with only `fields` of `model` (e.g. from `?fields=id,name`), without inspecting the mapper again,
+    and the options to load only their columns, if `model` was generated by `model_from`.
+
+    Subsets are cached by `model` and set of field names, keeping the `CACHE_SIZE` most recently used of each model
+    for as long as `model` is alive."""
+    names = frozenset(fields)
+    cache = _SUBSETS.setdefault(model, OrderedDict())
+    try:
+        cache.move_to_end(names)
+        return cache[names]
+    except KeyError:
+        pass
+    unknown = names.difference(compat.field_names(model))
+    if unknown:
+        raise ValueError(f"Unknown fields of {model.__name__}: {', '.join(sorted(unknown))}")
+    cache[names] = _subset(model, db_model_of(model), names)
+    if len(cache) > CACHE_SIZE:
+        cache.popitem(last=False)
+    return cache[names]
+
+
+def clear_cache() -> None:
+    _SUBSETS.clear()
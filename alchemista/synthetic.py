@@ -0,0 +1,231 @@
+"""Generation of synthetic records (valid or not) of SQLAlchemy models, e.g. for load testing."""
+
+import datetime as dt
+import enum
+from decimal import Decimal
+from functools import cached_property
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, Type, cast, get_args, get_origin
+
+from pydantic import BaseModel
+from sqlalchemy import Column, insert, inspect
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import ColumnProperty
+
+from alchemista import compat
+from alchemista.field import fields_from
+from alchemista.model import model_from
+from alchemista.typing import Literal, is_optional, non_optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+# bounds of generated values, unless the constraints of a field say otherwise
+MAX_INT = 1_000_000
+MAX_STR_LENGTH = 32
+EPOCH = dt.datetime(2020, 1, 1)
+SECONDS = 5 * 365 * 24 * 60 * 60
+
+Generate = Callable[["np.random.Generator", int], Sequence[Any]]
+
+
+class _Spec(NamedTuple):
+    name: str
+    column: str
+    """Key of the column of the field, which can differ from the name of the attribute."""
+    python_type: Any
+    nullable: bool
+    unique: bool
+    constraints: Dict[str, Any]
+    default: Any
+    """Scalar default of the field, or `None` if it has none."""
+
+
+def _bounds(constraints: Dict[str, Any], low: float, high: float, step: float) -> Tuple[float, float]:
+    if "ge" in constraints:
+        low = constraints["ge"]
+    if "gt" in constraints:
+        low = constraints["gt"] + step
+    if "le" in constraints:
+        high = constraints["le"]
+    if "lt" in constraints:
+        high = constraints["lt"] - step
+    if "ge" in constraints or "gt" in constraints:
+        high = max(high, low)
+    return low, high
+
+
+def _strings(rng: "np.random.Generator", size: int, min_length: int, max_length: int) -> List[str]:
+    # one random block of lowercase letters, viewed as fixed-width byte strings and cut to random lengths
+    chars = rng.integers(ord("a"), ord("z") + 1, size=(size, max(max_length, 1)), dtype=np.uint8)
+    lengths = rng.integers(min_length, max_length + 1, size=size)
+    blocks = chars.view(f"S{max(max_length, 1)}").ravel()
+    return [block[:length].decode() for block, length in zip(blocks.tolist(), lengths.tolist())]
+
+
+def _texts(rng: "np.random.Generator", spec: "_Spec", size: int, start: int) -> List[Any]:
+    constraints = spec.constraints
+    max_length = min(constraints.get("max_length", MAX_STR_LENGTH), MAX_STR_LENGTH)
+    if spec.python_type is bytes:
+        return [value.encode() for value in _strings(rng, size, 0, max_length)]
+    min_length = min(constraints.get("min_length", 1), max_length)
+    if not spec.unique:
+        return _strings(rng, size, min_length, max_length)
+    # a unique suffix (the number of the record) replaces the end of each string
+    suffixes = [format(start + index, "x") for index in range(size)]
+    prefixes = _strings(rng, size, 0, max(max_length - len(suffixes[-1]), 0))
+    return [prefix + suffix for prefix, suffix in zip(prefixes, suffixes)]
+
+
+def _times(rng: "np.random.Generator", python_type: Any, size: int) -> List[Any]:
+    seconds = rng.integers(0, SECONDS, size=size).tolist()
+    if python_type is dt.timedelta:
+        return [dt.timedelta(seconds=second) for second in seconds]
+    datetimes = [EPOCH + dt.timedelta(seconds=second) for second in seconds]
+    if python_type is dt.date:
+        return [value.date() for value in datetimes]
+    if python_type is dt.time:
+        return [value.time() for value in datetimes]
+    return datetimes
+
+
+def _wrong_type(python_type: Any) -> Any:
+    """A value that is not of `python_type`, and that Pydantic doesn't coerce to it either."""
+    # strings are coerced to most types, while lists are coerced to none of the scalar ones
+    return [] if python_type in (str, bytes) else "not a value"
+
+
+class Synthesizer:
+    """Generates records of `db_model` with a seeded random number generator, a column at a time, with NumPy.
+
+    Values are derived from what `fields_from` extracts: the Python type, nullability, `max_length`,
+    `ge`/`gt`/`le`/`lt`, scalar defaults and Enum (or `Literal`) choices. Fields whose values can't be derived
+    (e.g. with a `regex`) need a function in `overrides`, which gets the random number generator and the number of
+    values and returns them.
+    Only fields mapped to columns are generated, i.e. not hybrid properties nor composites.
+    """
+
+    def __init__(
+        self,
+        db_model: type,
+        *,
+        seed: int = 0,
+        null_fraction: float = 0.1,
+        default_fraction: float = 0.1,
+        overrides: Optional[Dict[str, Generate]] = None,
+    ) -> None:
+        if np is None:
+            raise ImportError("`Synthesizer` requires numpy, which is not installed")
+        self.db_model = db_model
+        self.rng = np.random.default_rng(seed)
+        self.null_fraction = null_fraction
+        self.default_fraction = default_fraction
+        self.overrides = overrides or {}
+        self._generated = 0
+        mapper = inspect(db_model)
+        self._specs: List[_Spec] = []
+        for name, (python_type, field) in fields_from(db_model).items():
+            prop = mapper.attrs[name]
+            if not isinstance(prop, ColumnProperty) or not isinstance(prop.columns[0], Column):
+                continue
+            column = prop.columns[0]
+            default = None if compat.is_required(field) or field.default_factory is not None else field.default
+            spec = _Spec(
+                name,
+                cast(str, column.key),
+                non_optional(python_type),
+                is_optional(python_type),
+                bool(column.primary_key or column.unique),
+                compat.field_constraints(field),
+                default,
+            )
+            if "regex" in spec.constraints and name not in self.overrides:
+                raise ValueError(f"Cannot generate values matching the `regex` of `{name}`. Pass it in `overrides`")
+            self._specs.append(spec)
+
+    @cached_property
+    def model(self) -> Type[BaseModel]:
+        """Model of the generated fields, which validates the records."""
+        return model_from(self.db_model, include={spec.name for spec in self._specs})
+
+    def _values(self, spec: _Spec, size: int, start: int) -> List[Any]:
+        # pylint: disable=too-many-return-statements
+        rng = self.rng
+        python_type = spec.python_type
+        constraints = spec.constraints
+        if spec.name in self.overrides:
+            return list(self.overrides[spec.name](rng, size))
+        if spec.unique and python_type is int:
+            low, _ = _bounds(constraints, 1, MAX_INT, 1)
+            return list(range(int(low) + start, int(low) + start + size))
+        if compat.lenient_issubclass(python_type, enum.Enum) or get_origin(python_type) is Literal:
+            members = list(python_type) if get_origin(python_type) is not Literal else list(get_args(python_type))
+            return [members[index] for index in rng.integers(0, len(members), size=size).tolist()]
+        if python_type is bool:
+            return (rng.random(size) < 0.5).tolist()  # type: ignore[no-any-return]
+        if python_type is int:
+            low, high = _bounds(constraints, 0, MAX_INT, 1)
+            return rng.integers(int(low), int(high) + 1, size=size).tolist()  # type: ignore[no-any-return]
+        if python_type in (float, Decimal):
+            low, high = _bounds(constraints, 0, MAX_INT, 0.01)
+            values: List[Any] = np.round(rng.uniform(low, high, size=size), 2).clip(low, high).tolist()
+            return values if python_type is float else [Decimal(str(value)) for value in values]
+        if python_type in (str, bytes):
+            return _texts(rng, spec, size, start)
+        if python_type in (dt.datetime, dt.date, dt.time, dt.timedelta):
+            return _times(rng, python_type, size)
+        raise ValueError(f"Cannot generate values of type {python_type} for `{spec.name}`. Pass it in `overrides`")
+
+    def columns(self, size: int) -> Dict[str, List[Any]]:
+        """`size` values of each field, by field name."""
+        columns = {}
+        for spec in self._specs:
+            values = self._values(spec, size, self._generated)
+            if spec.default is not None and not spec.unique:
+                for index in np.flatnonzero(self.rng.random(size) < self.default_fraction).tolist():
+                    values[index] = spec.default
+            if spec.nullable and not spec.unique:
+                for index in np.flatnonzero(self.rng.random(size) < self.null_fraction).tolist():
+                    values[index] = None
+            columns[spec.name] = values
+        self._generated += size
+        return columns
+
+    def records(self, size: int) -> List[Dict[str, Any]]:
+        """`size` records, i.e. dictionaries of field names to values, which are valid for `model`."""
+        columns = self.columns(size)
+        return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+    def instances(self, size: int) -> List[BaseModel]:
+        return [self.model(**record) for record in self.records(size)]
+
+    def invalid_records(self, size: int) -> List[Dict[str, Any]]:
+        """`size` records which are invalid for `model`, each because of one field (chosen at random) that has a value
+        that violates a constraint, or else of the wrong type."""
+        records = self.records(size)
+        # values of any type are valid for fields of type `Any`
+        specs = [spec for spec in self._specs if spec.name not in self.overrides and spec.python_type is not Any]
+        for record, index in zip(records, self.rng.integers(0, len(specs), size=size).tolist()):
+            spec = specs[index]
+            constraints = spec.constraints
+            if "max_length" in constraints:
+                record[spec.name] = "x" * (constraints["max_length"] + 1)
+            elif "le" in constraints or "lt" in constraints:
+                record[spec.name] = constraints.get("le", constraints.get("lt")) + 1
+            elif "ge" in constraints or "gt" in constraints:
+                record[spec.name] = constraints.get("ge", constraints.get("gt")) - 1
+            else:
+                record[spec.name] = _wrong_type(spec.python_type)
+        return records
+
+    def insert(self, engine: Engine, size: int, *, batch_size: int = 10_000) -> int:
+        """Insert `size` records into the table of `db_model` with `executemany`, in batches of `batch_size`."""
+        statement = insert(inspect(self.db_model).local_table)
+        keys = {spec.name: spec.column for spec in self._specs}
+        with engine.begin() as connection:
+            for offset in range(0, size, batch_size):
+                columns = self.columns(min(batch_size, size - offset))
+                rows = [dict(zip(keys.values(), values)) for values in zip(*(columns[name] for name in keys))]
+                connection.execute(statement, rows)
+        return size
@@ -0,0 +1,146 @@
+"""Lightweight alternatives to Pydantic models, generated from the same fields as `fields_from`."""
+
+import dataclasses
+import sys
+from typing import Any, Callable, Container, List, NamedTuple, Optional, Tuple, Type
+from weakref import WeakKeyDictionary
+
+from pydantic.fields import FieldInfo
+
+from alchemista import compat, func
+from alchemista.field import fields_from
+from alchemista.typing import Annotated, is_optional, non_optional
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None  # type: ignore[assignment]
+
+_FIELD_NAMES: "WeakKeyDictionary[type, Tuple[str, ...]]" = WeakKeyDictionary()
+
+Transform = Callable[[str, type, FieldInfo], Tuple[type, FieldInfo]]
+
+_MSGSPEC_CONSTRAINTS = {
+    "ge": "ge",
+    "gt": "gt",
+    "le": "le",
+    "lt": "lt",
+    "max_length": "max_length",
+    "min_length": "min_length",
+    "max_items": "max_length",
+    "min_items": "min_length",
+    "multiple_of": "multiple_of",
+    "regex": "pattern",
+}
+
+
+def _ordered_fields(
+    db_model: type,
+    exclude: Optional[Container[str]],
+    include: Optional[Container[str]],
+    transform: Transform,
+) -> List[Tuple[str, type, FieldInfo]]:
+    # unlike Pydantic models, these targets require fields without default values to come first
+    fields = fields_from(db_model, exclude=exclude, include=include, transform=transform)
+    ordered = [(name, python_type, field) for name, (python_type, field) in fields.items()]
+    return sorted(ordered, key=lambda item: not compat.is_required(item[2]))
+
+
+def dataclass_from(
+    db_model: type,
+    *,
+    exclude: Optional[Container[str]] = None,
+    include: Optional[Container[str]] = None,
+    transform: Transform = func.unchanged,
+    frozen: bool = True,
+    slots: bool = True,
+) -> type:
+    """Generate a dataclass with the fields of `db_model`. `slots` is ignored before Python 3.10."""
+    dataclass_fields: List[Any] = []
+    for name, python_type, field in _ordered_fields(db_model, exclude, include, transform):
+        if field.default_factory is not None:
+            dataclass_fields.append((name, python_type, dataclasses.field(default_factory=field.default_factory)))
+        elif compat.is_required(field):
+            dataclass_fields.append((name, python_type))
+        else:
+            dataclass_fields.append((name, python_type, dataclasses.field(default=field.default)))
+    if sys.version_info >= (3, 10):
+        # pylint infers the signature of the running Python, which before 3.10 has no `slots`
+        return dataclasses.make_dataclass(  # pylint: disable=unexpected-keyword-arg
+            db_model.__name__, dataclass_fields, frozen=frozen, slots=slots
+        )
+    return dataclasses.make_dataclass(db_model.__name__, dataclass_fields, frozen=frozen)
+
+
+def namedtuple_from(
+    db_model: type,
+    *,
+    exclude: Optional[Container[str]] = None,
+    include: Optional[Container[str]] = None,
+    transform: Transform = func.unchanged,
+) -> Type[Tuple[Any, ...]]:
+    """Generate a `typing.NamedTuple` with the fields of `db_model`.
+    Since named tuples have no default factories, fields with a `default_factory` are required."""
+
+    def has_default(field: FieldInfo) -> bool:
+        return field.default_factory is None and not compat.is_required(field)
+
+    ordered = sorted(_ordered_fields(db_model, exclude, include, transform), key=lambda item: has_default(item[2]))
+    fields = [(name, python_type) for name, python_type, _ in ordered]
+    namedtuple = NamedTuple(db_model.__name__, fields)  # type: ignore
+    namedtuple.__new__.__defaults__ = tuple(field.default for _, _, field in ordered if has_default(field))
+    return namedtuple
+
+
+def struct_from(
+    db_model: type,
+    *,
+    exclude: Optional[Container[str]] = None,
+    include: Optional[Container[str]] = None,
+    transform: Transform = func.unchanged,
+    frozen: bool = True,
+) -> type:
+    """Generate a `msgspec.Struct` with the fields of `db_model`, whose constraints are validated on decoding."""
+    if msgspec is None:
+        raise ImportError("`struct_from` requires msgspec, which is not installed")
+    struct_fields: List[Any] = []
+    for name, python_type, field in _ordered_fields(db_model, exclude, include, transform):
+        constraints = {
+            _MSGSPEC_CONSTRAINTS[key]: value
+            for key, value in compat.field_constraints(field).items()
+            if key in _MSGSPEC_CONSTRAINTS
+        }
+        if constraints or field.description:
+            meta = msgspec.Meta(description=field.description, **constraints)
+            if is_optional(python_type):
+                # msgspec constraints apply to the non-None type
+                python_type = Optional[Annotated[non_optional(python_type), meta]]  # type: ignore[assignment]
+            else:
+                python_type = Annotated[python_type, meta]  # type: ignore[assignment]
+        if field.default_factory is not None:
+            struct_fields.append((name, python_type, msgspec.field(default_factory=field.default_factory)))
+        elif compat.is_required(field):
+            struct_fields.append((name, python_type))
+        else:
+            struct_fields.append((name, python_type, field.default))
+    return msgspec.defstruct(db_model.__name__, struct_fields, frozen=frozen)
+
+
+def from_orm(target: type, obj: Any) -> Any:
+    """Create an instance of `target`, generated by one of the functions of this module, from the ORM object `obj`."""
+    return target(**{name: getattr(obj, name) for name in field_names(target)})
+
+
+def field_names(target: type) -> Tuple[str, ...]:
+    try:
+        return _FIELD_NAMES[target]
+    except KeyError:
+        pass
+    if dataclasses.is_dataclass(target):
+        names = tuple(field.name for field in dataclasses.fields(target))
+    elif hasattr(target, "__struct_fields__"):
+        names = target.__struct_fields__
+    else:
+        names = target._fields  # type: ignore[attr-defined]
+    _FIELD_NAMES[target] = names
+    return names
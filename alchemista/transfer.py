@@ -0,0 +1,412 @@
+"""Export of tables to files (and import of files to tables) through the fields of generated models."""
+
+import csv
+import itertools
+import json
+import mmap
+import os
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Type, Union
+
+from pydantic import BaseModel
+from sqlalchemy import Column, func, insert, inspect, select, tuple_
+from sqlalchemy.engine import Engine, Result
+from sqlalchemy.orm import Session
+
+from alchemista import compat
+from alchemista.batch import BatchValidator
+from alchemista.columnar import arrow_batches, arrow_schema, types_from
+from alchemista.model import model_from
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pq = None
+
+FORMATS = ("csv", "ndjson", "parquet")
+MANIFEST = "manifest.json"
+MMAP_THRESHOLD = 64 * 1024 * 1024
+"""Files of at least this size (in bytes) are read through `mmap`."""
+
+
+class Partition(NamedTuple):
+    number: int
+    """Position of the partition, from 0, which numbers its file."""
+    lower: Optional[Tuple[Any, ...]]
+    """Primary key where the partition starts (inclusive), or `None` for the first one."""
+    upper: Optional[Tuple[Any, ...]]
+    """Primary key where the partition ends (exclusive), or `None` for the last one."""
+
+
+def _exported_types(db_model: type, model: Type[BaseModel]) -> Dict[str, type]:
+    # only fields mapped to columns are exported,
+    # i.e. not hybrids nor composites (whose columns are exported themselves)
+    types = types_from(db_model)
+    return {name: types[name] for name in compat.field_names(model) if name in types}
+
+
+def _key_predicate(primary_key: Sequence[Any], key: Tuple[Any, ...], lower: bool) -> Any:
+    if len(primary_key) == 1:
+        return primary_key[0] >= key[0] if lower else primary_key[0] < key[0]
+    return tuple_(*primary_key) >= tuple_(*key) if lower else tuple_(*primary_key) < tuple_(*key)
+
+
+def partitions_of(db_model: type, engine: Engine, count: int) -> List[Partition]:
+    """Split the table of `db_model` in up to `count` ranges of its primary key with about the same number of rows."""
+    primary_key = inspect(db_model).primary_key
+    with engine.connect() as connection:
+        total = connection.execute(select(func.count()).select_from(inspect(db_model).local_table)).scalar_one()
+        boundaries: List[Tuple[Any, ...]] = []
+        for index in range(1, count):
+            offset = index * total // count
+            boundary = connection.execute(select(*primary_key).order_by(*primary_key).offset(offset).limit(1)).first()
+            if boundary is not None and (not boundaries or tuple(boundary) != boundaries[-1]):
+                boundaries.append(tuple(boundary))
+    bounds: List[Optional[Tuple[Any, ...]]] = [None, *boundaries, None]
+    return [Partition(number, bounds[number], bounds[number + 1]) for number in range(len(bounds) - 1)]
+
+
+def _json_default(value: Any) -> Any:
+    return compat.to_jsonable(value)
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (str, int, float)):
+        return value
+    return compat.to_jsonable(value)
+
+
+def _write_ndjson(result: Result, names: List[str], path: Path, batch_size: int) -> int:
+    rows = 0
+    with open(path, "w", encoding="utf-8") as file:
+        for partition in result.partitions(batch_size):
+            file.writelines(json.dumps(dict(zip(names, row)), default=_json_default) + "\n" for row in partition)
+            rows += len(partition)
+    return rows
+
+
+def _write_csv(result: Result, names: List[str], path: Path, batch_size: int) -> int:
+    rows = 0
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(names)
+        for partition in result.partitions(batch_size):
+            writer.writerows([_csv_value(value) for value in row] for row in partition)
+            rows += len(partition)
+    return rows
+
+
+def _write_parquet(result: Result, types: Dict[str, type], path: Path, batch_size: int) -> int:
+    rows = 0
+    writer = None
+    try:
+        for batch in arrow_batches(result, types, batch_size=batch_size):
+            if writer is None:
+                writer = pq.ParquetWriter(path, arrow_schema(types, [batch]))
+            writer.write_batch(batch.cast(writer.schema))
+            rows += batch.num_rows
+        if writer is None:
+            # an empty partition still gets a file, with the schema
+            writer = pq.ParquetWriter(path, arrow_schema(types, []))
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def _export_partition(  # pylint: disable=too-many-arguments
+    db_model: type,
+    engine: Engine,
+    types: Dict[str, type],
+    partition: Partition,
+    path: Path,
+    file_format: str,
+    batch_size: int,
+) -> Dict[str, Any]:
+    primary_key = inspect(db_model).primary_key
+    statement = select(*[getattr(db_model, name).label(name) for name in types]).order_by(*primary_key)
+    if partition.lower is not None:
+        statement = statement.where(_key_predicate(primary_key, partition.lower, lower=True))
+    if partition.upper is not None:
+        statement = statement.where(_key_predicate(primary_key, partition.upper, lower=False))
+    file_path = path / f"part-{partition.number:05d}.{file_format}"
+    # each worker reads its range over its own connection, streaming it in batches so that its memory stays bounded
+    with engine.connect() as connection:
+        result = connection.execution_options(stream_results=True).execute(statement)
+        if file_format == "parquet":
+            rows = _write_parquet(result, types, file_path, batch_size)
+        elif file_format == "csv":
+            rows = _write_csv(result, list(types), file_path, batch_size)
+        else:
+            rows = _write_ndjson(result, list(types), file_path, batch_size)
+    return {
+        "file": file_path.name,
+        "rows": rows,
+        "lower": None if partition.lower is None else list(partition.lower),
+        "upper": None if partition.upper is None else list(partition.upper),
+    }
+
+
+def export(
+    db_model: type,
+    path: Union[str, Path],
+    *,
+    engine: Engine,
+    format: str = "ndjson",  # pylint: disable=redefined-builtin
+    workers: int = 4,
+    batch_size: int = 10_000,
+    model: Optional[Type[BaseModel]] = None,
+) -> Dict[str, Any]:
+    """Export the table of `db_model` to `path` (a directory), with one file per partition and a manifest.
+
+    The table is split in `workers` ranges of its primary key,
+    which are read concurrently, each over its own connection.
+    The exported columns are the fields of `model` (by default, `model_from(db_model)`) that are mapped to columns."""
+    if format not in FORMATS:
+        raise ValueError(f"Unsupported format `{format}`. Expected one of {', '.join(FORMATS)}")
+    if format == "parquet" and pq is None:
+        raise ImportError("Exporting to parquet requires pyarrow, which is not installed")
+    directory = Path(path)
+    directory.mkdir(parents=True, exist_ok=True)
+    model = model or model_from(db_model)
+    types = _exported_types(db_model, model)
+    partitions = partitions_of(db_model, engine, workers)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        files = list(
+            executor.map(
+                lambda partition: _export_partition(db_model, engine, types, partition, directory, format, batch_size),
+                partitions,
+            )
+        )
+    manifest = {
+        "table": inspect(db_model).local_table.name,
+        "model": model.__name__,
+        "format": format,
+        "fields": list(types),
+        "primary_key": [column.key for column in inspect(db_model).primary_key],
+        "rows": sum(file["rows"] for file in files),
+        "files": files,
+    }
+    (directory / MANIFEST).write_text(json.dumps(manifest, default=_json_default, indent=2), encoding="utf-8")
+    return manifest
+
+
+class StageStats:
+    """Rows handled by a stage of `import_file`, the time spent on them and, if `tracemalloc` is tracing,
+    the peak memory allocated while handling a chunk."""
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.seconds = 0.0
+        self.peak_memory: Optional[int] = None
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    @contextmanager
+    def measure(self) -> Iterator[None]:
+        # `reset_peak` is only available since Python 3.9
+        tracing = tracemalloc.is_tracing() and hasattr(tracemalloc, "reset_peak")
+        if tracing:
+            tracemalloc.reset_peak()  # pylint: disable=no-member
+            before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        yield
+        self.seconds += time.perf_counter() - start
+        if tracing:
+            self.peak_memory = max(self.peak_memory or 0, tracemalloc.get_traced_memory()[1] - before)
+
+    def add(self, rows: int) -> None:
+        self.rows += rows
+
+    def __repr__(self) -> str:
+        return (
+            f"StageStats(rows={self.rows}, seconds={self.seconds:.3f}, "
+            f"rows_per_second={self.rows_per_second:.0f}, peak_memory={self.peak_memory})"
+        )
+
+
+class ImportStats:
+    """Outcome of `import_file`, with the stats of each of its stages: reading, validation and writing."""
+
+    def __init__(self) -> None:
+        self.inserted = 0
+        self.rejected = 0
+        self.read = StageStats()
+        self.validate = StageStats()
+        self.write = StageStats()
+
+    def __repr__(self) -> str:
+        return (
+            f"ImportStats(inserted={self.inserted}, rejected={self.rejected}, "
+            f"read={self.read}, validate={self.validate}, write={self.write})"
+        )
+
+
+class _Chunk(NamedTuple):
+    lines: List[int]
+    records: List[Dict[str, Any]]
+    rejects: List[Dict[str, Any]]
+    """Records that could not even be parsed."""
+
+
+_Validated = Tuple[_Chunk, List[Dict[str, Any]], List[Dict[str, Any]]]
+"""A chunk with the rows to insert and the records that are invalid, with their errors."""
+
+
+def _file_lines(file: IO[bytes]) -> Iterator[bytes]:
+    if os.fstat(file.fileno()).st_size >= MMAP_THRESHOLD:
+        # the file is paged in by the OS as it is read, instead of being copied through a buffer
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield from iter(mapped.readline, b"")
+    else:
+        yield from file
+
+
+def _ndjson_records(lines: Iterator[bytes]) -> Iterator[Tuple[int, Any, Optional[str]]]:
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield number, json.loads(line), None
+        except ValueError as ex:
+            yield number, line.decode("utf-8", "replace").rstrip("\n"), str(ex)
+
+
+def _columns(row: Dict[str, Any]) -> List[str]:
+    return sorted(row)
+
+
+def _csv_records(lines: Iterator[bytes]) -> Iterator[Tuple[int, Any, Optional[str]]]:
+    reader = csv.reader(line.decode("utf-8") for line in lines)
+    header: List[str] = next(reader, [])
+    for row in reader:
+        if len(row) != len(header):
+            yield reader.line_num, row, f"Expected {len(header)} values, got {len(row)}"
+        else:
+            # as in `export`, empty values are `None`
+            yield reader.line_num, {key: value if value != "" else None for key, value in zip(header, row)}, None
+
+
+def _chunks(records: Iterator[Tuple[int, Any, Optional[str]]], chunk_size: int) -> Iterator[_Chunk]:
+    while True:
+        batch = list(itertools.islice(records, chunk_size))
+        if not batch:
+            return
+        chunk = _Chunk([], [], [])
+        for number, record, error in batch:
+            if error is None and isinstance(record, dict):
+                chunk.lines.append(number)
+                chunk.records.append(record)
+            else:
+                chunk.rejects.append({"line": number, "record": record, "errors": [{"msg": error or "Not an object"}]})
+        yield chunk
+
+
+def import_file(  # pylint: disable=too-many-arguments,too-many-locals
+    db_model: type,
+    path: Union[str, Path],
+    *,
+    engine: Engine,
+    format: Optional[str] = None,  # pylint: disable=redefined-builtin
+    chunk_size: int = 10_000,
+    rejects: Optional[Union[str, Path]] = None,
+    model: Optional[Type[BaseModel]] = None,
+) -> ImportStats:
+    """Import a CSV or NDJSON file (as written by `export`) to the table of `db_model`, in one transaction.
+
+    The file is read in chunks of `chunk_size` records, which are validated against `model`
+    (by default, `model_from(db_model)`) with a `BatchValidator` and inserted with `executemany`.
+    Only the fields present in a record are inserted, so that the other columns get their (server) defaults.
+    Invalid records are written to `rejects` (by default, `path` with a `.rejects.ndjson` suffix) with their errors,
+    replacing the rejects of a previous import.
+    """
+    path = Path(path)
+    format = format or path.suffix.lstrip(".")
+    if format not in ("csv", "ndjson"):
+        raise ValueError(f"Unsupported format `{format}`. Expected one of csv, ndjson")
+    model = model or model_from(db_model)
+    validator = BatchValidator(model)
+    mapper = inspect(db_model)
+    # joined-table inheritance spreads rows over several tables, which the ORM inserts with the keys they share
+    joined = len(mapper.tables) > 1
+    # the key of the column of each field, which can differ from the name of the attribute
+    columns = {name: name if joined else mapper.attrs[name].columns[0].key for name in _exported_types(db_model, model)}
+    # the discriminator of polymorphic mappers, which inserts outside of the unit of work don't set
+    identity: Dict[str, Any] = {}
+    if mapper.polymorphic_identity is not None and isinstance(mapper.polymorphic_on, Column):
+        key = mapper.get_property_by_column(mapper.polymorphic_on).key if joined else mapper.polymorphic_on.key
+        identity[key] = mapper.polymorphic_identity
+    statement = insert(mapper.local_table)
+    stats = ImportStats()
+    rejects_path = Path(rejects) if rejects is not None else path.with_suffix(".rejects.ndjson")
+    # rejects of a previous import would otherwise be left as they were if this one has none
+    rejects_path.unlink(missing_ok=True)
+
+    def validate(chunk: _Chunk) -> _Validated:
+        with stats.validate.measure():
+            result = validator.validate(chunk.records)
+            # only the fields that were given, so that columns left out get their (server) defaults
+            rows = [
+                {
+                    **{
+                        column: getattr(instance, name)
+                        for name, column in columns.items()
+                        if name in compat.fields_set(instance)
+                    },
+                    **identity,
+                }
+                for instance in result.instances
+                if instance is not None
+            ]
+            invalid = [
+                {"line": chunk.lines[index], "record": chunk.records[index], "errors": error.errors()}
+                for index, error in result.errors.items()
+            ]
+        stats.validate.add(len(chunk.records))
+        return chunk, rows, invalid
+
+    with ExitStack() as stack:
+        file = stack.enter_context(open(path, "rb"))
+        connection = stack.enter_context(engine.begin())
+        session = stack.enter_context(Session(bind=connection))
+        rejects_file: Optional[IO[str]] = None
+        parse = _csv_records if format == "csv" else _ndjson_records
+        chunks = _chunks(parse(_file_lines(file)), chunk_size)
+
+        def read() -> Optional[_Chunk]:
+            with stats.read.measure():
+                chunk = next(chunks, None)
+            if chunk is not None:
+                stats.read.add(len(chunk.records) + len(chunk.rejects))
+            return chunk
+
+        def write(validated: _Validated) -> None:
+            nonlocal rejects_file
+            chunk, rows, invalid = validated
+            with stats.write.measure():
+                if joined:
+                    # with the generated primary keys, which the rows of the tables of the inheriting mappers need
+                    session.bulk_insert_mappings(mapper, rows, return_defaults=True, render_nulls=True)
+                else:
+                    # `executemany` needs the same columns in each row
+                    for _, group in itertools.groupby(sorted(rows, key=_columns), key=_columns):
+                        connection.execute(statement, list(group))
+                if (chunk.rejects or invalid) and rejects_file is None:
+                    rejects_file = stack.enter_context(open(rejects_path, "w", encoding="utf-8"))
+                for reject in chunk.rejects + invalid:
+                    rejects_file.write(json.dumps(reject, default=str) + "\n")  # type: ignore[union-attr]
+            stats.write.add(len(rows))
+            stats.inserted += len(rows)
+            stats.rejected += len(chunk.rejects) + len(invalid)
+
+        for chunk in iter(read, None):
+            write(validate(chunk))
+    return stats
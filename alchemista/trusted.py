@@ -0,0 +1,79 @@
+import datetime as dt
+import functools
+import os
+from decimal import Decimal
+from typing import Any, Callable, Dict, Optional, Type
+
+from pydantic import BaseModel
+from sqlalchemy import Column, inspect
+from sqlalchemy.orm import ColumnProperty
+
+from alchemista import compat
+from alchemista.binary import Buffer
+from alchemista.lazy import LazyJson
+from alchemista.typing import non_optional
+
+Converter = Callable[[Any], Any]
+
+_validate = os.environ.get("ALCHEMISTA_VALIDATE_TRUSTED", "0") != "0"
+
+
+def set_validation(enabled: bool) -> None:
+    global _validate  # pylint: disable=global-statement,invalid-name
+    _validate = enabled
+
+
+def _to_decimal(value: Any) -> Any:
+    return Decimal(str(value)) if isinstance(value, float) else value
+
+
+def _to_float(value: Any) -> Any:
+    return float(value) if isinstance(value, Decimal) else value
+
+
+def _to_aware(value: Any) -> Any:
+    # some drivers (e.g. SQLite) don't store the timezone, which is UTC by convention
+    return value.replace(tzinfo=dt.timezone.utc) if isinstance(value, dt.datetime) and value.tzinfo is None else value
+
+
+# by the type of a field, where it doesn't depend on the column
+_CONVERTERS: Dict[type, Converter] = {Decimal: _to_decimal, float: _to_float, Buffer: memoryview}
+
+
+def _make_converter(python_type: Any, column: Optional[Column]) -> Optional[Converter]:  # type: ignore[type-arg]
+    python_type = non_optional(python_type)
+    if python_type is dt.datetime and column is not None and getattr(column.type, "timezone", False):
+        return _to_aware
+    if compat.lenient_issubclass(python_type, BaseModel):
+        return functools.partial(compat.from_orm, python_type)
+    if compat.lenient_issubclass(python_type, LazyJson):
+        return python_type  # type: ignore[no-any-return]
+    return _CONVERTERS.get(python_type) if isinstance(python_type, type) else None
+
+
+def make_trusted(model: Type[BaseModel], db_model: type) -> None:
+    """Replace `model.from_orm` with a version that doesn't validate the attributes of the `db_model` instance,
+    only coercing them where database drivers are known to return a different type from the one in the model.
+
+    Set the `ALCHEMISTA_VALIDATE_TRUSTED` environment variable to `1` (or call `set_validation(True)`)
+    to fully validate them instead, e.g. to verify in tests that skipping validation is safe."""
+    mapper = inspect(db_model)
+    converters: Dict[str, Optional[Converter]] = {}
+    for name, (python_type, _) in compat.model_fields(model).items():
+        prop = mapper.attrs.get(name)
+        column = prop.columns[0] if isinstance(prop, ColumnProperty) else None
+        converters[name] = _make_converter(python_type, column if isinstance(column, Column) else None)
+    validating_from_orm = None if compat.PYDANTIC_V2 else model.from_orm
+
+    def from_orm(cls: Type[BaseModel], obj: Any) -> BaseModel:
+        if _validate or cls is not model:
+            if validating_from_orm is None:
+                return cls.model_validate(obj, from_attributes=True)  # type: ignore[attr-defined,no-any-return]
+            return validating_from_orm.__func__(cls, obj)  # type: ignore[attr-defined,no-any-return]
+        values = {}
+        for name, convert in converters.items():
+            value = getattr(obj, name)
+            values[name] = value if convert is None or value is None else convert(value)
+        return compat.construct_all(cls, values)
+
+    setattr(model, "from_orm", classmethod(from_orm))
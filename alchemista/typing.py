@@ -1,5 +1,24 @@
-from typing import Union, get_args, get_origin
+import sys
+from typing import Any, Union, get_args, get_origin
+
+# the `Literal` that Pydantic recognizes, which is only the same as `typing.Literal` from Python 3.10.1 on
+from typing_extensions import Literal
+
+if sys.version_info >= (3, 9):
+    from typing import Annotated  # pylint: disable=no-name-in-module
+else:
+    from typing_extensions import Annotated
+
+__all__ = ["Annotated", "Literal", "is_optional", "non_optional"]
 
 
 def is_optional(python_type: type) -> bool:
     return get_origin(python_type) is Union and type(None) in get_args(python_type)
+
+
+def non_optional(python_type: Any) -> Any:
+    """`python_type` without `None`, if it is `Optional`."""
+    if not is_optional(python_type):
+        return python_type
+    args = tuple(arg for arg in get_args(python_type) if arg is not type(None))
+    return args[0] if len(args) == 1 else Union[args]
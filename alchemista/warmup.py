@@ -0,0 +1,89 @@
+"""Building models (and what they cache) before forking worker processes, so that the workers share them."""
+
+import gc
+import time
+from typing import Dict, NamedTuple, Optional
+
+from alchemista.model import generated_models
+from alchemista.registry import Registry
+from alchemista.schema import schema_of
+
+SMAPS_ROLLUP = "/proc/self/smaps_rollup"
+
+
+class WarmupReport(NamedTuple):
+    models: int
+    """Number of models that were warmed up."""
+    built: int
+    """Number of those that were built by `warmup`, i.e. that tracked models of the registries had not built yet."""
+    schemas: int
+    seconds: float
+    frozen: int
+    """Number of objects moved to the permanent generation by `gc.freeze()` (0 if not frozen)."""
+    rss: Optional[int]
+    """Resident memory of the process in bytes after warming up, i.e. what forked workers start sharing with it,
+    or `None` where it is unknown (it is read from `/proc`)."""
+    shared: Optional[int]
+    """Bytes of `rss` that were already shared with other processes (e.g. shared libraries)."""
+    private: Optional[int]
+    """Bytes of `rss` that were private to the process, e.g. the models built by `warmup`."""
+
+
+def memory_usage() -> Optional[Dict[str, int]]:
+    """Memory of the current process in bytes by kind (e.g. `Rss`, `Shared_Clean` and `Private_Dirty`),
+    from `/proc/self/smaps_rollup`, or `None` where it is not available (e.g. outside Linux)."""
+    try:
+        with open(SMAPS_ROLLUP, encoding="ascii") as smaps:
+            lines = smaps.readlines()
+    except OSError:
+        return None
+    usage = {}
+    for line in lines[1:]:
+        key, _, value = line.partition(":")
+        if value.strip().endswith("kB"):
+            usage[key] = int(value.split()[0]) * 1024
+    return usage
+
+
+def _total(usage: Optional[Dict[str, int]], *kinds: str) -> Optional[int]:
+    return None if usage is None else sum(usage.get(kind, 0) for kind in kinds)
+
+
+def shared_memory() -> Optional[int]:
+    """Bytes of memory of the current process that are shared with others, e.g. those of a forked worker that are
+    still shared with its parent, or `None` where it is not available."""
+    return _total(memory_usage(), "Shared_Clean", "Shared_Dirty")
+
+
+def warmup(*registries: Registry, schemas: bool = True, freeze: bool = True) -> WarmupReport:
+    """Build, in the parent process of a preforking server, the tracked models of `registries`
+    and the JSON schemas of all models generated by `model_from` (converters of trusted models are built with them).
+
+    Then, if `freeze`, collect garbage and `gc.freeze()` everything that is left, so that the garbage collector of
+    the workers doesn't write to (and thus copy) the pages of these objects. Call `gc.unfreeze()` to undo it."""
+    start = time.perf_counter()
+    built = 0
+    for registry in registries:
+        for tracked in registry.tracked():
+            built += tracked.stale
+            _ = tracked.model
+    models = generated_models()
+    if schemas:
+        for model in models:
+            schema_of(model)
+    frozen = 0
+    if freeze:
+        gc.collect()
+        gc.freeze()
+        frozen = gc.get_freeze_count()
+    usage = memory_usage()
+    return WarmupReport(
+        len(models),
+        built,
+        len(models) if schemas else 0,
+        time.perf_counter() - start,
+        frozen,
+        _total(usage, "Rss"),
+        _total(usage, "Shared_Clean", "Shared_Dirty"),
+        _total(usage, "Private_Clean", "Private_Dirty"),
+    )
@@ -0,0 +1,62 @@
+"""Memory allocated per instance of a Pydantic model and of the lightweight targets of `alchemista.targets`.
+
+python -m benchmarks.memory_per_instance
+"""
+
+import datetime as dt
+import gc
+import tracemalloc
+from typing import Any, Callable, Dict
+
+from sqlalchemy import Column, DateTime, Integer, String
+from sqlalchemy.orm import declarative_base
+
+from alchemista import compat, model_from
+from alchemista.targets import dataclass_from, from_orm, namedtuple_from, struct_from
+
+Base = declarative_base()
+
+
+class PersonDB(Base):
+    __tablename__ = "people"
+
+    id = Column(Integer, primary_key=True)
+    age = Column(Integer, default=0, nullable=False)
+    name = Column(String(128), nullable=False)
+    email = Column(String(256))
+    created_at = Column(DateTime, nullable=False)
+
+
+def _bytes_per_instance(make: Callable[[Any], Any], rows: Any) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [make(row) for row in rows]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / len(instances)
+
+
+def main(number: int = 100_000) -> None:
+    created_at = dt.datetime(2021, 6, 1)
+    # the attribute values are shared by all rows, so only the instances themselves are measured
+    rows = [PersonDB(id=1, age=30, name="Someone", email=None, created_at=created_at) for _ in range(number)]
+    person_model = model_from(PersonDB, trusted=True)
+    person_dataclass = dataclass_from(PersonDB)
+    person_namedtuple = namedtuple_from(PersonDB)
+    targets: Dict[str, Callable[[Any], Any]] = {
+        "pydantic (trusted)": lambda row: compat.from_orm(person_model, row),
+        "dataclass": lambda row: from_orm(person_dataclass, row),
+        "namedtuple": lambda row: from_orm(person_namedtuple, row),
+    }
+    try:
+        person_struct = struct_from(PersonDB)
+        targets["msgspec.Struct"] = lambda row: from_orm(person_struct, row)
+    except ImportError:
+        pass
+    for name, make in targets.items():
+        print(f"{name:>20}: {_bytes_per_instance(make, rows):8.1f} bytes/instance")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Throughput of models generated by `model_from` with the installed Pydantic version.
+
+Run it once in an environment with Pydantic v1 and once with v2 to compare them, e.g.:
+
+    python -m benchmarks.pydantic_versions
+"""
+
+import datetime as dt
+import timeit
+from decimal import Decimal
+
+import pydantic
+from sqlalchemy import Column, DateTime, Integer, Numeric, String
+from sqlalchemy.orm import declarative_base
+
+from alchemista import compat, model_from
+
+Base = declarative_base()
+
+
+class PersonDB(Base):
+    __tablename__ = "people"
+
+    id = Column(Integer, primary_key=True)
+    age = Column(Integer, default=0, nullable=False, info=dict(ge=0, le=150))
+    name = Column(String(128), nullable=False)
+    email = Column(String(256), info=dict(regex=r"^[^@]+@[^@]+$"))
+    balance = Column(Numeric(12, 2), nullable=False)
+    created_at = Column(DateTime, nullable=False)
+
+
+def main(number: int = 20_000) -> None:
+    build_time = timeit.timeit(lambda: model_from(PersonDB), number=100) / 100
+    person_model = model_from(PersonDB)
+    trusted_model = model_from(PersonDB, trusted=True)
+    data = dict(
+        id=1,
+        age=30,
+        name="Someone",
+        email="someone@example.com",
+        balance=Decimal("10.50"),
+        created_at=dt.datetime(2021, 6, 1),
+    )
+    person_db = PersonDB(**data)
+
+    results = {
+        "model_from": build_time,
+        "validate dict": timeit.timeit(lambda: person_model(**data), number=number) / number,
+        "from_orm": timeit.timeit(lambda: compat.from_orm(person_model, person_db), number=number) / number,
+        "from_orm (trusted)": timeit.timeit(lambda: compat.from_orm(trusted_model, person_db), number=number) / number,
+    }
+    print(f"Pydantic {pydantic.VERSION}")
+    for name, seconds in results.items():
+        print(f"{name:>20}: {seconds * 1e6:10.2f} us/op {1 / seconds:12.0f} op/s")
+
+
+if __name__ == "__main__":
+    main()
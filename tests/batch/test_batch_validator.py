@@ -0,0 +1,132 @@
+# pylint: disable=invalid-name
+import pytest
+from sqlalchemy import Column, Enum, Integer, String
+from sqlalchemy.orm import declarative_base
+
+from alchemista import compat, model_from
+from alchemista.batch import BatchValidator
+
+Base = declarative_base()
+
+
+class Person(Base):
+    __tablename__ = "person"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(8), nullable=False)
+    age = Column(Integer, default=0, nullable=False, info=dict(ge=0, le=150))
+    code = Column(String(4), info=dict(regex="^[A-Z]+$"))
+
+
+Model = model_from(Person)
+
+
+def test_check_returns_per_field_masks() -> None:
+    # Arrange
+    pytest.importorskip("numpy")
+    validator = BatchValidator(Model)
+    records = [
+        dict(id=1, name="ok", age=10, code="AB"),
+        dict(id=2, name="too long name"),
+        dict(id=3, name="ok", age=-1),
+        dict(id=4, name="ok", age=10, code="ab"),
+        dict(name="ok"),
+        dict(id=6, name=None, age=None),
+        dict(id="7", name="ok"),
+    ]
+
+    # Act
+    masks = validator.check(records)
+
+    # Assert
+    assert masks["id"].tolist() == [False, False, False, False, True, False, True]
+    assert masks["name"].tolist() == [False, True, False, False, False, True, False]
+    assert masks["age"].tolist() == [False, False, True, False, False, True, False]
+    assert masks["code"].tolist() == [False, False, False, True, False, False, False]
+
+
+def test_validate_only_falls_back_to_pydantic_for_flagged_records() -> None:
+    # Arrange
+    validator = BatchValidator(Model)
+    records = [
+        dict(id=1, name="ok", age=10, code="AB"),
+        dict(id=2, name="too long name"),
+        dict(id="3", name="ok"),
+        dict(id=4, name="ok", age=151),
+        dict(id=5, name="ok"),
+    ]
+
+    # Act
+    result = validator.validate(records)
+
+    # Assert
+    assert sorted(result.errors) == [1, 3]
+    assert result.instances[1] is None
+    assert result.instances[3] is None
+    assert compat.to_dict(result.instances[0]) == dict(id=1, name="ok", age=10, code="AB")  # type: ignore[arg-type]
+    assert compat.to_dict(result.instances[2]) == dict(id=3, name="ok", age=0, code=None)  # type: ignore[arg-type]
+    assert compat.to_dict(result.instances[4]) == dict(id=5, name="ok", age=0, code=None)  # type: ignore[arg-type]
+    assert [error["loc"] for error in result.errors[1].errors()] == [("name",)]
+    assert [error["loc"] for error in result.errors[3].errors()] == [("age",)]
+
+
+def test_validate_large_batches() -> None:
+    # Arrange
+    pytest.importorskip("numpy")
+    validator = BatchValidator(Model)
+    records = [dict(id=i, name=f"n{i % 1000}", age=i % 200) for i in range(10_000)]
+
+    # Act
+    result = validator.validate(records)
+
+    # Assert
+    assert len(result.errors) == len([i for i in range(10_000) if i % 200 > 150])
+    assert result.masks["age"].sum() == len(result.errors)
+    assert all(instance is not None for index, instance in enumerate(result.instances) if index not in result.errors)
+
+
+def test_check_literal_choices() -> None:
+    # Arrange
+    pytest.importorskip("numpy")
+
+    class Account(Base):
+        __tablename__ = "account"
+
+        id = Column(Integer, primary_key=True)
+        status = Column(Enum("active", "blocked", name="status"), nullable=False)
+
+    validator = BatchValidator(model_from(Account))
+    records = [dict(id=1, status="active"), dict(id=2, status="deleted"), dict(id=3, status=["active"])]
+
+    # Act
+    result = validator.validate(records)
+
+    # Assert
+    assert result.masks["status"].tolist() == [False, True, True]
+    assert sorted(result.errors) == [1, 2]
+
+
+def test_validate_const_fields_like_pydantic() -> None:
+    # Arrange
+    class Event(Base):
+        __tablename__ = "event"
+
+        id = Column(Integer, primary_key=True)
+        version = Column(Integer, default=2, nullable=False, info=dict(const=True))
+
+    model = model_from(Event)
+    validator = BatchValidator(model)
+    records = [dict(id=1, version=2), dict(id=2, version=1), dict(id=3)]
+
+    # Act
+    result = validator.validate(records)
+
+    # Assert
+    for index, record in enumerate(records):
+        try:
+            expected = compat.to_dict(model(**record))
+        except ValueError:
+            assert index in result.errors
+        else:
+            assert compat.to_dict(result.instances[index]) == expected  # type: ignore[arg-type]
+    assert sorted(result.errors) == [1]
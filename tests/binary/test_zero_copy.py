@@ -0,0 +1,213 @@
+import base64
+import json
+from typing import Iterator, List, Optional
+
+import pytest
+from sqlalchemy import Column, Integer, LargeBinary, String, create_engine, event, select
+from sqlalchemy.orm import Session, declarative_base, deferred
+
+from alchemista import compat, model_from
+from alchemista.binary import Buffer, Deferred, iter_base64, iter_json
+
+Base = declarative_base()
+
+
+class File(Base):
+    __tablename__ = "file"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(32), nullable=False)
+    thumbnail = Column(LargeBinary)
+    content = deferred(Column(LargeBinary, nullable=False))
+
+
+class Document(Base):
+    __tablename__ = "document"
+
+    id = Column(Integer, primary_key=True)
+    signature = Column(LargeBinary(4))
+    summary = deferred(Column(String(8)))
+    scan = deferred(Column(LargeBinary(4)))
+
+
+PAYLOAD = bytes(range(256)) * 4096
+
+
+@pytest.fixture(name="session")
+def fixture_session() -> Iterator[Session]:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(File(id=1, name="a.bin", thumbnail=b"thumb", content=PAYLOAD))
+        session.commit()
+        session.expunge_all()
+        yield session
+    engine.dispose()
+
+
+def _statements(session: Session) -> List[str]:
+    statements: List[str] = []
+    event.listen(session.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+
+def test_iter_base64() -> None:
+    # Act
+    chunks = list(iter_base64(memoryview(PAYLOAD), chunk_size=3 * 1000))
+
+    # Assert
+    assert len(chunks) == len(PAYLOAD) // 3000 + 1
+    assert "".join(chunks) == base64.b64encode(PAYLOAD).decode()
+    with pytest.raises(ValueError):
+        next(iter_base64(PAYLOAD, chunk_size=1000))
+
+
+def test_binary_fields_are_not_copied() -> None:
+    # Arrange
+    model = model_from(File, zero_copy=True)
+    data = bytes(PAYLOAD)
+
+    # Act
+    instance = model(id=1, name="a.bin", thumbnail=None, content=data)
+
+    # Assert
+    assert compat.model_fields(model)["thumbnail"][0] == Optional[Buffer]
+    assert compat.model_fields(model)["content"][0] is Deferred[Buffer]
+    assert isinstance(instance.content, memoryview)  # type: ignore[attr-defined]
+    assert instance.content.obj is data  # type: ignore[attr-defined]
+    assert compat.to_dict(instance)["content"].obj is data
+    with pytest.raises(ValueError):
+        model(id=1, name="a.bin", content=1)
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_deferred_columns_become_handles(session: Session, trusted: bool) -> None:
+    # Arrange
+    model = model_from(File, zero_copy=True, trusted=trusted)
+    file = session.execute(select(File)).scalar_one()
+    statements = _statements(session)
+
+    # Act
+    instance = compat.from_orm(model, file)
+    handle = instance.content  # type: ignore[attr-defined]
+    loads = len(statements)
+    content = handle.load()
+
+    # Assert
+    assert loads == 0
+    assert isinstance(handle, Deferred)
+    assert len(statements) == 1
+    assert bytes(content) == PAYLOAD
+    assert handle.loaded
+    assert bytes(instance.thumbnail) == b"thumb"  # type: ignore[attr-defined]
+
+
+def test_loaded_deferred_columns_are_values(session: Session) -> None:
+    # Arrange
+    model = model_from(File, zero_copy=True)
+    file = session.execute(select(File)).scalar_one()
+    file.content  # pylint: disable=pointless-statement
+
+    # Act
+    instance = compat.from_orm(model, file)
+
+    # Assert
+    assert isinstance(instance.content, memoryview)  # type: ignore[attr-defined]
+
+
+def test_iter_json(session: Session) -> None:
+    # Arrange
+    model = model_from(File, zero_copy=True)
+    instance = compat.from_orm(model, session.execute(select(File)).scalar_one())
+
+    # Act
+    chunks = list(iter_json(instance, chunk_size=3 * 4096))
+
+    # Assert
+    assert len(chunks) > len(PAYLOAD) // (3 * 4096)
+    assert json.loads("".join(chunks)) == dict(
+        id=1,
+        name="a.bin",
+        thumbnail=base64.b64encode(b"thumb").decode(),
+        content=base64.b64encode(PAYLOAD).decode(),
+    )
+
+
+def test_json_output_is_base64() -> None:
+    # Arrange
+    model = model_from(File, zero_copy=True)
+    instance = model(id=1, name="a", thumbnail=b"\x00\x01", content=b"abc")
+
+    # Act
+    dumped = json.loads(instance.model_dump_json() if compat.PYDANTIC_V2 else instance.json())
+    schema = compat.json_schema(model, by_alias=True, ref_template=compat.DEFAULT_REF_TEMPLATE)
+
+    # Assert
+    assert dumped["thumbnail"] == "AAE="
+    assert dumped["content"] == "YWJj"
+    assert "binary" in json.dumps(schema["properties"]["thumbnail"])
+    assert schema["properties"]["content"]["format"] == "binary"
+    assert sorted(schema["required"]) == ["content", "id", "name"]
+
+
+def test_base64_input_is_decoded() -> None:
+    # Arrange
+    model = model_from(File, zero_copy=True)
+
+    # Act
+    instance = model(id=1, name="a", thumbnail="AAE=", content=b"abc")
+
+    # Assert
+    assert bytes(instance.thumbnail) == b"\x00\x01"  # type: ignore[attr-defined]
+    with pytest.raises(ValueError):
+        model(id=1, name="a", thumbnail="not base64!", content=b"abc")
+
+
+def test_sized_columns_are_enforced() -> None:
+    # Arrange
+    model = model_from(Document, zero_copy=True)
+    fields = compat.model_fields(model)
+
+    # Act
+    instance = model(id=1, signature=b"1234", summary="12345678", scan=b"1234")
+
+    # Assert
+    assert fields["signature"][0] == Optional[Buffer.sized(4)]
+    assert not compat.field_constraints(fields["signature"][1])
+    assert not compat.field_constraints(fields["summary"][1])
+    assert bytes(instance.signature) == b"1234"  # type: ignore[attr-defined]
+    assert instance.summary == "12345678"  # type: ignore[attr-defined]
+    for values in (dict(signature=b"12345"), dict(summary="123456789"), dict(scan=b"12345")):
+        with pytest.raises(ValueError):
+            model(id=1, **values)
+
+
+def test_sized_deferred_columns_become_handles(session: Session) -> None:
+    # Arrange
+    model = model_from(Document, zero_copy=True)
+    session.add(Document(id=1, signature=b"1234", summary="12345678", scan=b"1234"))
+    session.commit()
+    session.expunge_all()
+    document = session.execute(select(Document)).scalar_one()
+
+    # Act
+    instance = compat.from_orm(model, document)
+
+    # Assert
+    assert isinstance(instance.summary, Deferred)  # type: ignore[attr-defined]
+    assert instance.summary.load() == "12345678"  # type: ignore[attr-defined]
+    assert isinstance(instance.scan, Deferred)  # type: ignore[attr-defined]
+
+
+@pytest.mark.skipif(compat.PYDANTIC_V2, reason="v2 types serialize themselves")
+def test_json_encoders_are_set_per_model() -> None:
+    # Arrange
+    from pydantic.json import ENCODERS_BY_TYPE  # pylint: disable=import-outside-toplevel
+
+    # Act
+    model = model_from(File, zero_copy=True)
+
+    # Assert
+    assert memoryview in compat.model_config(model).json_encoders
+    assert memoryview not in ENCODERS_BY_TYPE
+    assert Deferred not in ENCODERS_BY_TYPE
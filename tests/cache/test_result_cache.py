@@ -0,0 +1,250 @@
+import json
+from pathlib import Path
+from typing import Any, Iterator, List
+
+import pytest
+from pydantic import BaseModel
+from sqlalchemy import Column, ForeignKey, Integer, String, create_engine, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, declarative_base
+
+from alchemista import model_from
+from alchemista.cache import ResultCache
+
+Base = declarative_base()
+
+
+class Person(Base):
+    __tablename__ = "person"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(32), nullable=False)
+
+
+class Pet(Base):
+    __tablename__ = "pet"
+
+    id = Column(Integer, primary_key=True)
+    owner_id = Column(Integer, ForeignKey("person.id"))
+    name = Column(String(32), nullable=False)
+
+
+PersonModel = model_from(Person, frozen=True)
+PetModel = model_from(Pet, frozen=True)
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture(name="engine")
+def fixture_engine() -> Iterator[Engine]:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all([Person(id=1, name="Alice"), Person(id=2, name="Bob"), Pet(id=1, owner_id=1, name="Rex")])
+        session.commit()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(name="cache")
+def fixture_cache() -> Iterator[ResultCache]:
+    cache = ResultCache(max_size=2)
+    cache.listen()
+    yield cache
+    cache.close()
+
+
+def _names(instances: List[PersonModel]) -> List[str]:  # type: ignore[valid-type]
+    return [instance.name for instance in instances]  # type: ignore[attr-defined]
+
+
+def test_identical_queries_hit_the_cache(engine: Engine, cache: ResultCache) -> None:
+    # Arrange
+    statements: List[str] = []
+    with Session(engine) as session:
+        session.connection().connection.set_trace_callback(statements.append)  # type: ignore[union-attr]
+
+        # Act
+        first = cache.fetch(session, select(Person).order_by(Person.id), PersonModel)
+        second = cache.fetch(session, select(Person).order_by(Person.id), PersonModel)
+        other = cache.fetch(session, select(Person).where(Person.id == 2), PersonModel)
+        different_value = cache.fetch(session, select(Person).where(Person.id == 1), PersonModel)
+
+    # Assert
+    assert first is second
+    assert _names(first) == ["Alice", "Bob"]
+    assert _names(other) == ["Bob"]
+    assert _names(different_value) == ["Alice"]
+    assert len([statement for statement in statements if statement.startswith("SELECT")]) == 3
+    assert cache.stats == (1, 3, 2)
+
+
+def test_json_results(engine: Engine, cache: ResultCache) -> None:
+    # Arrange
+    with Session(engine) as session:
+        # Act
+        first = cache.fetch_json(session, select(Person).order_by(Person.id), PersonModel)
+        second = cache.fetch_json(session, select(Person).order_by(Person.id), PersonModel)
+
+    # Assert
+    assert first is second
+    assert json.loads(first) == [{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}]
+
+
+def test_least_recently_used_results_are_evicted(engine: Engine, cache: ResultCache) -> None:
+    # Arrange
+    statements = [select(Person).where(Person.id == index) for index in (1, 2)]
+    with Session(engine) as session:
+        first = cache.fetch(session, statements[0], PersonModel)
+        cache.fetch(session, statements[1], PersonModel)
+        cache.fetch(session, statements[0], PersonModel)
+
+        # Act
+        cache.fetch(session, select(Person), PersonModel)
+
+        # Assert
+        assert cache.fetch(session, statements[0], PersonModel) is first
+        assert cache.stats.misses == 3
+        cache.fetch(session, statements[1], PersonModel)
+        assert cache.stats.misses == 4
+
+
+def test_results_expire_after_ttl(engine: Engine) -> None:
+    # Arrange
+    clock = Clock()
+    cache = ResultCache(ttl=10, clock=clock)
+    with Session(engine) as session:
+        first = cache.fetch(session, select(Person), PersonModel)
+        clock.now = 10
+
+        # Act
+        fresh = cache.fetch(session, select(Person), PersonModel)
+        clock.now = 10.5
+        expired = cache.fetch(session, select(Person), PersonModel)
+
+    # Assert
+    assert fresh is first
+    assert expired is not first
+    assert expired == first
+
+
+def test_flushes_invalidate_results_of_affected_tables(engine: Engine, cache: ResultCache) -> None:
+    # Arrange
+    with Session(engine) as session:
+        people = cache.fetch(session, select(Person).order_by(Person.id), PersonModel)
+        pets = cache.fetch(session, select(Pet), PetModel)
+
+        # Act
+        session.get(Person, 2).name = "Bobby"  # type: ignore[union-attr]
+        session.commit()
+
+        # Assert
+        assert _names(cache.fetch(session, select(Person).order_by(Person.id), PersonModel)) == ["Alice", "Bobby"]
+        assert cache.fetch(session, select(Pet), PetModel) is pets
+        assert people != cache.fetch(session, select(Person).order_by(Person.id), PersonModel)
+
+
+def test_results_read_before_a_rollback_are_invalidated(engine: Engine, cache: ResultCache) -> None:
+    # Arrange
+    with Session(engine) as session:
+        session.add(Person(id=3, name="Carol"))
+        session.flush()
+        uncommitted = cache.fetch(session, select(Person), PersonModel)
+
+        # Act
+        session.rollback()
+
+        # Assert
+        assert len(uncommitted) == 3
+        assert _names(cache.fetch(session, select(Person).order_by(Person.id), PersonModel)) == ["Alice", "Bob"]
+        assert len(cache.fetch(session, select(Person), PersonModel)) == 2
+
+
+def test_uncommitted_results_are_not_shared_with_other_sessions(tmp_path: Path, cache: ResultCache) -> None:
+    # Arrange
+    # a file, since sessions of an in-memory database share its connection and so see each other's writes
+    engine = create_engine(f"sqlite:///{tmp_path / 'cache.db'}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all([Person(id=1, name="Alice"), Person(id=2, name="Bob")])
+        session.commit()
+
+    with Session(engine) as writer, Session(engine) as reader:
+        writer.add(Person(id=3, name="Carol"))
+        writer.flush()
+
+        # Act
+        uncommitted = cache.fetch(writer, select(Person).order_by(Person.id), PersonModel)
+        committed = cache.fetch(reader, select(Person).order_by(Person.id), PersonModel)
+
+        # Assert
+        assert _names(uncommitted) == ["Alice", "Bob", "Carol"]
+        assert _names(committed) == ["Alice", "Bob"]
+    engine.dispose()
+
+
+def test_explicit_invalidation(engine: Engine, cache: ResultCache) -> None:
+    # Arrange
+    with Session(engine) as session:
+        first = cache.fetch(session, select(Person), PersonModel)
+
+        # Act
+        cache.invalidate(Person)
+
+        # Assert
+        assert cache.fetch(session, select(Person), PersonModel) is not first
+        assert cache.stats.size == 1
+
+
+def test_models_not_generated_by_model_from_are_rejected(engine: Engine, cache: ResultCache) -> None:
+    # Arrange
+    class Handwritten(BaseModel):
+        id: int
+
+    # Act / Assert
+    with Session(engine) as session, pytest.raises(ValueError, match="not generated by `model_from`"):
+        cache.fetch(session, select(Person), Handwritten)
+
+
+def test_results_invalidated_while_loading_are_not_cached(engine: Engine, cache: ResultCache) -> None:
+    # Arrange
+    load = cache._load  # pylint: disable=protected-access
+
+    def load_while_writing(*args: Any) -> List[BaseModel]:
+        instances = load(*args)
+        cache.invalidate(Person)
+        return instances
+
+    cache._load = load_while_writing  # type: ignore[method-assign]  # pylint: disable=protected-access
+
+    with Session(engine) as session:
+        # Act
+        first = cache.fetch(session, select(Person), PersonModel)
+        second = cache.fetch(session, select(Person), PersonModel)
+
+    # Assert
+    assert second is not first
+    assert cache.stats == (0, 2, 0)
+
+
+def test_results_are_cached_per_engine(engine: Engine, cache: ResultCache) -> None:
+    # Arrange
+    other_engine = create_engine("sqlite://")
+    Base.metadata.create_all(other_engine)
+
+    # Act
+    with Session(engine) as session:
+        people = cache.fetch(session, select(Person), PersonModel)
+    with Session(other_engine) as session:
+        other_people = cache.fetch(session, select(Person), PersonModel)
+    other_engine.dispose()
+
+    # Assert
+    assert len(people) == 2
+    assert other_people == []
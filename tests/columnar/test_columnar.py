@@ -0,0 +1,151 @@
+# pylint: disable=invalid-name
+import datetime as dt
+from typing import Iterator, Optional
+
+import pytest
+from sqlalchemy import Column, DateTime, Float, Integer, String, create_engine, insert, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.types import TypeDecorator
+
+from alchemista.columnar import to_arrow, to_numpy, types_from, types_of
+
+Base = declarative_base()
+
+
+class AwareDateTime(TypeDecorator):  # pylint: disable=abstract-method,too-many-ancestors
+    """SQLite has no timezones, so datetimes are stored in UTC and read back as aware."""
+
+    impl = DateTime
+    cache_ok = True
+
+    def process_result_value(self, value: Optional[dt.datetime], dialect: object) -> Optional[dt.datetime]:
+        return None if value is None else value.replace(tzinfo=dt.timezone.utc)
+
+
+class Measurement(Base):
+    __tablename__ = "measurement"
+
+    id = Column(Integer, primary_key=True)
+    sensor = Column(String(16), nullable=False)
+    value = Column(Float)
+    count = Column(Integer)
+    taken_at = Column(DateTime, nullable=False)
+    received_at = Column(AwareDateTime)
+
+
+@pytest.fixture(name="engine")
+def fixture_engine() -> Iterator[Engine]:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    rows = [
+        dict(
+            id=i,
+            sensor=f"s{i % 3}",
+            value=None if i % 4 == 0 else i / 2,
+            count=None if i % 5 == 0 else i,
+            taken_at=dt.datetime(2021, 1, 1) + dt.timedelta(minutes=i),
+            received_at=None if i <= 40 else dt.datetime(2021, 1, 1, 1) + dt.timedelta(minutes=i),
+        )
+        for i in range(1, 101)
+    ]
+    with engine.begin() as connection:
+        connection.execute(insert(Measurement), rows)
+    yield engine
+    engine.dispose()
+
+
+def test_types_from_and_types_of() -> None:
+    # Act
+    types = types_from(Measurement)
+    statement_types = types_of(select(Measurement.id, Measurement.value))
+
+    # Assert
+    assert types == {
+        "id": int,
+        "sensor": str,
+        "value": Optional[float],
+        "count": Optional[int],
+        "taken_at": dt.datetime,
+        "received_at": Optional[dt.datetime],
+    }
+    assert statement_types == {"id": int, "value": Optional[float]}
+
+
+def test_to_numpy(engine: Engine) -> None:
+    # Arrange
+    np = pytest.importorskip("numpy")
+    statement = select(Measurement.__table__).order_by(Measurement.id)
+
+    # Act
+    with engine.connect() as connection:
+        arrays = to_numpy(connection.execute(statement), types_from(Measurement), batch_size=7)
+
+    # Assert
+    assert arrays["id"].dtype == np.int64
+    assert arrays["id"].tolist() == list(range(1, 101))
+    assert arrays["sensor"].dtype == object
+    assert arrays["sensor"][:3].tolist() == ["s1", "s2", "s0"]
+    assert arrays["taken_at"].dtype == np.dtype("datetime64[us]")
+    assert arrays["taken_at"][0] == np.datetime64("2021-01-01T00:01")
+    assert isinstance(arrays["value"], np.ma.MaskedArray)
+    assert arrays["value"].dtype == np.float64
+    assert arrays["value"].mask.sum() == 25
+    assert arrays["value"].sum() == sum(i / 2 for i in range(1, 101) if i % 4 != 0)
+    assert isinstance(arrays["count"], np.ma.MaskedArray)
+    assert arrays["count"].dtype == np.int64
+    assert arrays["count"].count() == 80
+
+
+def test_to_numpy_with_empty_result(engine: Engine) -> None:
+    # Arrange
+    np = pytest.importorskip("numpy")
+    statement = select(Measurement.id, Measurement.value).where(Measurement.id < 0)
+
+    # Act
+    with engine.connect() as connection:
+        arrays = to_numpy(connection.execute(statement), types_of(statement))
+
+    # Assert
+    assert arrays["id"].dtype == np.int64
+    assert len(arrays["id"]) == 0
+    assert isinstance(arrays["value"], np.ma.MaskedArray)
+
+
+def test_to_arrow(engine: Engine) -> None:
+    # Arrange
+    pa = pytest.importorskip("pyarrow")
+    statement = select(Measurement.id, Measurement.sensor, Measurement.count).order_by(Measurement.id)
+
+    # Act
+    with engine.connect() as connection:
+        table = to_arrow(connection.execute(statement), types_of(statement), batch_size=30)
+
+    # Assert
+    assert table.num_rows == 100
+    assert table.schema.field("id").type == pa.int64()
+    assert not table.schema.field("id").nullable
+    assert table.schema.field("sensor").type == pa.string()
+    assert table.schema.field("count").nullable
+    assert table.column("count").null_count == 20
+    assert table.column("id").to_pylist() == list(range(1, 101))
+
+
+def test_aware_datetimes(engine: Engine) -> None:
+    # Arrange
+    np = pytest.importorskip("numpy")
+    pa = pytest.importorskip("pyarrow")
+    statement = select(Measurement.received_at).order_by(Measurement.id)
+
+    # Act
+    with engine.connect() as connection:
+        arrays = to_numpy(connection.execute(statement), types_of(statement))
+    with engine.connect() as connection:
+        table = to_arrow(connection.execute(statement), types_of(statement), batch_size=30)
+
+    # Assert
+    assert arrays["received_at"][40] == np.datetime64("2021-01-01T01:41")
+    assert table.schema.field("received_at").type == pa.timestamp("us", tz="UTC")
+    assert table.column("received_at").null_count == 40
+    received_at = dt.datetime(2021, 1, 1, 1, 41, tzinfo=dt.timezone.utc)
+    assert table.column("received_at")[40].value == received_at.timestamp() * 1_000_000
@@ -0,0 +1,79 @@
+# pylint: disable=invalid-name
+import pydantic
+import pytest
+from sqlalchemy import Column, Integer, String
+from sqlalchemy.orm import declarative_base
+
+from alchemista import compat, model_from
+from alchemista.field import Info, make_field
+from alchemista.func import nonify
+from alchemista.typing import is_optional
+
+
+def test_field_kwargs_are_translated_for_pydantic_v2() -> None:
+    # Arrange
+    info = Info(allow_mutation=False, example="ab", max_items=2, min_items=1, regex="^a", title="T")
+
+    # Act
+    kwargs = compat.field_kwargs(info)  # type: ignore[arg-type]
+
+    # Assert
+    if compat.PYDANTIC_V2:
+        assert kwargs == dict(frozen=True, examples=["ab"], max_length=2, min_length=1, pattern="^a", title="T")
+    else:
+        assert kwargs == info
+
+
+def test_field_constraints_use_info_names() -> None:
+    # Arrange
+    column = Column(String(8), info=Info(ge=1, lt=5, regex="^[a-z]+$"))
+
+    # Act
+    constraints = compat.field_constraints(make_field(column))
+
+    # Assert
+    assert constraints == {"ge": 1, "lt": 5, "max_length": 8, "regex": "^[a-z]+$"}
+
+
+def test_const_is_validated_and_cleared_by_nonify() -> None:
+    # Arrange
+    Base = declarative_base()
+
+    class Test(Base):
+        __tablename__ = "test"
+
+        id = Column(Integer, primary_key=True)
+        number = Column(Integer, default=1, nullable=False, info=Info(const=True))
+
+    # Act
+    TestPydantic = model_from(Test)
+    TestPydanticInput = model_from(Test, transform=nonify)
+
+    # Assert
+    with pytest.raises(pydantic.ValidationError):
+        TestPydantic(id=1, number=2)
+    assert compat.to_dict(TestPydantic(id=1, number=1)) == {"id": 1, "number": 1}
+    assert compat.to_dict(TestPydanticInput(number=2)) == {"id": None, "number": 2}
+
+
+def test_model_fields_and_from_orm() -> None:
+    # Arrange
+    Base = declarative_base()
+
+    class Test(Base):
+        __tablename__ = "test"
+
+        id = Column(Integer, primary_key=True)
+        name = Column(String(8))
+
+    # Act
+    TestPydantic = model_from(Test)
+    fields = compat.model_fields(TestPydantic)
+    test = compat.from_orm(TestPydantic, Test(id=1, name="name"))
+
+    # Assert
+    assert fields["id"][0] is int
+    assert is_optional(fields["name"][0])
+    assert compat.is_required(fields["id"][1])
+    assert not compat.is_required(fields["name"][1])
+    assert compat.to_dict(test) == {"id": 1, "name": "name"}
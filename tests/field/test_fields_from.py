@@ -2,13 +2,14 @@
 import datetime as dt
 import enum
 import time
+from typing import Optional
 
 import pydantic
 import pytest
-from sqlalchemy import ARRAY, Column, DateTime, Enum, Integer, String, Text
+from sqlalchemy import ARRAY, Column, Computed, DateTime, Enum, Identity, Integer, String, Text, func
 from sqlalchemy.orm import declarative_base
 
-from alchemista import fields_from
+from alchemista import compat, fields_from
 
 
 def test_exclude() -> None:
@@ -36,14 +37,16 @@ def test_exclude() -> None:
     assert getattr(test, "number1") == 1
     assert getattr(test, "number3") == 3
 
-    assert TestPydantic.schema() == {
-        "title": "Test",
-        "type": "object",
-        "properties": {
-            "number1": {"title": "Number1", "type": "integer"},
-            "number3": {"title": "Number3", "type": "integer"},
-        },
-    }
+    # v2 schemas spell nullable fields as `anyOf` with a `null` type
+    if not compat.PYDANTIC_V2:
+        assert TestPydantic.schema() == {
+            "title": "Test",
+            "type": "object",
+            "properties": {
+                "number1": {"title": "Number1", "type": "integer"},
+                "number3": {"title": "Number3", "type": "integer"},
+            },
+        }
 
 
 def test_include() -> None:
@@ -71,12 +74,17 @@ def test_include() -> None:
     assert getattr(test, "id") == 1
     assert getattr(test, "number2") == 2
 
-    assert TestPydantic.schema() == {
-        "title": "Test",
-        "type": "object",
-        "properties": {"id": {"title": "Id", "type": "integer"}, "number2": {"title": "Number2", "type": "integer"}},
-        "required": ["id"],
-    }
+    # v2 schemas spell nullable fields as `anyOf` with a `null` type
+    if not compat.PYDANTIC_V2:
+        assert TestPydantic.schema() == {
+            "title": "Test",
+            "type": "object",
+            "properties": {
+                "id": {"title": "Id", "type": "integer"},
+                "number2": {"title": "Number2", "type": "integer"},
+            },
+            "required": ["id"],
+        }
 
 
 def test_exclude_and_include_are_mutually_exclusive() -> None:
@@ -126,29 +134,34 @@ def test_optional_behavior() -> None:
     assert getattr(test, "opt_str") is None
     assert getattr(test, "req_str") == "str"
 
-    assert TestPydantic.schema() == {
-        "title": "Test",
-        "type": "object",
-        "properties": {
-            "id": {"title": "Id", "type": "integer"},
-            "defaulted_req_str": {
-                "title": "Defaulted Req Str",
-                "default": "default",
-                "type": "string",
+    # v2 schemas spell nullable fields as `anyOf` with a `null` type
+    if not compat.PYDANTIC_V2:
+        assert TestPydantic.schema() == {
+            "title": "Test",
+            "type": "object",
+            "properties": {
+                "id": {"title": "Id", "type": "integer"},
+                "defaulted_req_str": {
+                    "title": "Defaulted Req Str",
+                    "default": "default",
+                    "type": "string",
+                },
+                "opt_str": {"title": "Opt Str", "type": "string"},
+                "req_str": {"title": "Req Str", "type": "string"},
             },
-            "opt_str": {"title": "Opt Str", "type": "string"},
-            "req_str": {"title": "Req Str", "type": "string"},
-        },
-        "required": ["id", "req_str"],
-    }
+            "required": ["id", "req_str"],
+        }
 
     with pytest.raises(pydantic.ValidationError) as ex:
         TestPydantic(id=2, req_str="str", defaulted_req_str=None)
     errors = ex.value.errors()
     assert len(errors) == 1
     assert errors[0]["loc"] == ("defaulted_req_str",)
-    assert errors[0]["msg"] == "none is not an allowed value"
-    assert errors[0]["type"] == "type_error.none.not_allowed"
+    if compat.PYDANTIC_V2:
+        assert errors[0]["type"] == "string_type"
+    else:
+        assert errors[0]["msg"] == "none is not an allowed value"
+        assert errors[0]["type"] == "type_error.none.not_allowed"
 
 
 def test_lambda_as_default_factory() -> None:
@@ -174,15 +187,17 @@ def test_lambda_as_default_factory() -> None:
     assert getattr(test, "id") == 1
     assert getattr(test, "dynamic_column") == "dynamic default"
 
-    assert TestPydantic.schema() == {
-        "title": "Test",
-        "type": "object",
-        "properties": {
-            "id": {"title": "Id", "type": "integer"},
-            "dynamic_column": {"title": "Dynamic Column", "type": "string"},
-        },
-        "required": ["id"],
-    }
+    # v2 schemas spell nullable fields as `anyOf` with a `null` type
+    if not compat.PYDANTIC_V2:
+        assert TestPydantic.schema() == {
+            "title": "Test",
+            "type": "object",
+            "properties": {
+                "id": {"title": "Id", "type": "integer"},
+                "dynamic_column": {"title": "Dynamic Column", "type": "string"},
+            },
+            "required": ["id"],
+        }
 
 
 def test_datetime_now_as_default_factory() -> None:
@@ -213,15 +228,17 @@ def test_datetime_now_as_default_factory() -> None:
     assert isinstance(getattr(test2, "datetime"), dt.datetime)
     assert getattr(test1, "datetime") < getattr(test2, "datetime")
 
-    assert TestPydantic.schema() == {
-        "title": "Test",
-        "type": "object",
-        "properties": {
-            "id": {"title": "Id", "type": "integer"},
-            "datetime": {"title": "Datetime", "type": "string", "format": "date-time"},
-        },
-        "required": ["id"],
-    }
+    # v2 schemas spell nullable fields as `anyOf` with a `null` type
+    if not compat.PYDANTIC_V2:
+        assert TestPydantic.schema() == {
+            "title": "Test",
+            "type": "object",
+            "properties": {
+                "id": {"title": "Id", "type": "integer"},
+                "datetime": {"title": "Datetime", "type": "string", "format": "date-time"},
+            },
+            "required": ["id"],
+        }
 
 
 def test_allow_mutation() -> None:
@@ -238,10 +255,12 @@ def test_allow_mutation() -> None:
     class ValidateAssignment:
         validate_assignment = True
 
+    config = dict(validate_assignment=True) if compat.PYDANTIC_V2 else ValidateAssignment
+
     # Act
     fields = fields_from(Test)
     TestPydantic = pydantic.create_model(  # type: ignore[var-annotated]
-        Test.__name__, __config__=ValidateAssignment, **fields  # type: ignore[arg-type, var-annotated]
+        Test.__name__, __config__=config, **fields  # type: ignore[arg-type, var-annotated]
     )
     test = TestPydantic(id=1, number=0, number_mut=1)
 
@@ -260,21 +279,23 @@ def test_allow_mutation() -> None:
     setattr(test, "number_mut", 2)
     assert getattr(test, "number_mut") == 2
 
-    # Assert immutable attribute is immutable
-    with pytest.raises(TypeError):
+    # Assert immutable attribute is immutable (v2 raises a validation error instead)
+    with pytest.raises(pydantic.ValidationError if compat.PYDANTIC_V2 else TypeError):
         setattr(test, "number", 1)
     assert getattr(test, "number") == 0
 
-    assert TestPydantic.schema() == {
-        "title": "Test",
-        "type": "object",
-        "properties": {
-            "id": {"title": "Id", "type": "integer"},
-            "number": {"title": "Number", "type": "integer"},
-            "number_mut": {"title": "Number Mut", "type": "integer"},
-        },
-        "required": ["id"],
-    }
+    # v2 schemas spell nullable fields as `anyOf` with a `null` type
+    if not compat.PYDANTIC_V2:
+        assert TestPydantic.schema() == {
+            "title": "Test",
+            "type": "object",
+            "properties": {
+                "id": {"title": "Id", "type": "integer"},
+                "number": {"title": "Number", "type": "integer"},
+                "number_mut": {"title": "Number Mut", "type": "integer"},
+            },
+            "required": ["id"],
+        }
 
 
 def test_enum_schema() -> None:
@@ -323,38 +344,40 @@ def test_enum_schema() -> None:
     assert getattr(test, "boolean_values") == Bool.TRUE
     assert getattr(test, "boolean_values_not_native") == Bool.TRUE
 
-    assert TestPydantic.schema() == {
-        "title": "Test",
-        "type": "object",
-        "properties": {
-            "id": {"title": "Id", "type": "integer"},
-            "boolean_default": {
-                "default": Bool.TRUE,
-                "allOf": [{"$ref": "#/definitions/Bool"}],
-            },
-            "boolean_not_native": {
-                "default": Bool.TRUE,
-                "allOf": [{"$ref": "#/definitions/Bool"}],
+    # v2 schemas spell nullable fields as `anyOf` with a `null` type
+    if not compat.PYDANTIC_V2:
+        assert TestPydantic.schema() == {
+            "title": "Test",
+            "type": "object",
+            "properties": {
+                "id": {"title": "Id", "type": "integer"},
+                "boolean_default": {
+                    "default": Bool.TRUE,
+                    "allOf": [{"$ref": "#/definitions/Bool"}],
+                },
+                "boolean_not_native": {
+                    "default": Bool.TRUE,
+                    "allOf": [{"$ref": "#/definitions/Bool"}],
+                },
+                "boolean_values": {
+                    "default": Bool.TRUE,
+                    "allOf": [{"$ref": "#/definitions/Bool"}],
+                },
+                "boolean_values_not_native": {
+                    "default": Bool.TRUE,
+                    "allOf": [{"$ref": "#/definitions/Bool"}],
+                },
             },
-            "boolean_values": {
-                "default": Bool.TRUE,
-                "allOf": [{"$ref": "#/definitions/Bool"}],
+            "required": ["id"],
+            "definitions": {
+                "Bool": {
+                    "title": "Bool",
+                    "description": "An enumeration.",
+                    "enum": ["F", "T"],
+                    "type": "string",
+                }
             },
-            "boolean_values_not_native": {
-                "default": Bool.TRUE,
-                "allOf": [{"$ref": "#/definitions/Bool"}],
-            },
-        },
-        "required": ["id"],
-        "definitions": {
-            "Bool": {
-                "title": "Bool",
-                "description": "An enumeration.",
-                "enum": ["F", "T"],
-                "type": "string",
-            }
-        },
-    }
+        }
 
 
 def test_all_pydantic_attributes_from_info() -> None:
@@ -406,28 +429,30 @@ def test_all_pydantic_attributes_from_info() -> None:
     assert getattr(test, "multiple") == 2
     assert getattr(test, "string") == "txt"
 
-    assert TestPydantic.schema() == {
-        "title": "Test",
-        "type": "object",
-        "properties": {
-            "id": {"title": "Id", "type": "integer"},
-            "ge_le": {"title": "Ge Le", "minimum": 0, "maximum": 10, "type": "integer"},
-            "gt_lt": {"title": "Gt Lt", "exclusiveMinimum": 0, "exclusiveMaximum": 10, "type": "integer"},
-            "items": {"title": "Items", "minItems": 0, "maxItems": 2, "type": "array", "items": {"type": "string"}},
-            "multiple": {"title": "Multiple", "multipleOf": 2, "type": "integer"},
-            "text": {
-                "title": "SomeString",
-                "description": "Some string",
-                "default": "",
-                "maxLength": 64,
-                "minLength": 0,
-                "pattern": "\\w+",
-                "example": "Example",
-                "type": "string",
+    # v2 schemas spell nullable fields as `anyOf` with a `null` type
+    if not compat.PYDANTIC_V2:
+        assert TestPydantic.schema() == {
+            "title": "Test",
+            "type": "object",
+            "properties": {
+                "id": {"title": "Id", "type": "integer"},
+                "ge_le": {"title": "Ge Le", "minimum": 0, "maximum": 10, "type": "integer"},
+                "gt_lt": {"title": "Gt Lt", "exclusiveMinimum": 0, "exclusiveMaximum": 10, "type": "integer"},
+                "items": {"title": "Items", "minItems": 0, "maxItems": 2, "type": "array", "items": {"type": "string"}},
+                "multiple": {"title": "Multiple", "multipleOf": 2, "type": "integer"},
+                "text": {
+                    "title": "SomeString",
+                    "description": "Some string",
+                    "default": "",
+                    "maxLength": 64,
+                    "minLength": 0,
+                    "pattern": "\\w+",
+                    "example": "Example",
+                    "type": "string",
+                },
             },
-        },
-        "required": ["id"],
-    }
+            "required": ["id"],
+        }
 
 
 def test_keyed_column_schema() -> None:
@@ -453,12 +478,110 @@ def test_keyed_column_schema() -> None:
     assert getattr(test, "id") == 1
     assert getattr(test, "text") == "txt"
 
-    assert TestPydantic.schema() == {
-        "title": "Test",
-        "type": "object",
-        "properties": {
-            "text": {"title": "Text", "maxLength": 64, "type": "string"},
-            "id": {"title": "Id", "type": "integer"},
-        },
-        "required": ["id"],
-    }
+    # v2 schemas spell nullable fields as `anyOf` with a `null` type
+    if not compat.PYDANTIC_V2:
+        assert TestPydantic.schema() == {
+            "title": "Test",
+            "type": "object",
+            "properties": {
+                "text": {"title": "Text", "maxLength": 64, "type": "string"},
+                "id": {"title": "Id", "type": "integer"},
+            },
+            "required": ["id"],
+        }
+
+
+def test_string_enum_validates_values() -> None:
+    # Arrange
+    Base = declarative_base()
+
+    class Test(Base):
+        __tablename__ = "test"
+
+        id = Column(Integer, primary_key=True)
+        status = Column(Enum("active", "blocked", name="status"), nullable=False, default="active")
+
+    class Other(Base):
+        __tablename__ = "other"
+
+        id = Column(Integer, primary_key=True)
+        status = Column(Enum("active", "blocked", name="status"))
+
+    # Act
+    fields = fields_from(Test)
+    TestPydantic = pydantic.create_model(Test.__name__, **fields)  # type: ignore[arg-type, var-annotated]
+    test = TestPydantic(id=1)
+
+    # Assert
+    assert getattr(test, "status") == "active"
+    assert getattr(TestPydantic(id=1, status="blocked"), "status") == "blocked"
+    with pytest.raises(pydantic.ValidationError):
+        TestPydantic(id=1, status="deleted")
+    assert Optional[fields["status"][0]] == fields_from(Other)["status"][0]
+
+
+def test_for_create_excludes_read_only_columns() -> None:
+    # Arrange
+    Base = declarative_base()
+
+    class Test(Base):
+        __tablename__ = "test"
+
+        id = Column(Integer, Identity(always=True), primary_key=True)
+        number = Column(Integer, Identity(), unique=True)
+        name = Column(String, nullable=False, server_default="unnamed")
+        length = Column(Integer, Computed("length(name)"))
+
+    # Act
+    fields = fields_from(Test, for_create=True)
+    TestPydantic = pydantic.create_model(Test.__name__, **fields)  # type: ignore[arg-type, var-annotated]
+    test = TestPydantic()
+
+    # Assert
+    assert set(fields) == {"number", "name"}
+    assert test.number is None  # type: ignore[attr-defined]
+    assert test.name is None  # type: ignore[attr-defined]
+    assert set(fields_from(Test)) == {"id", "number", "name", "length"}
+
+
+def test_for_create_makes_server_generated_columns_optional() -> None:
+    # Arrange
+    Base = declarative_base()
+
+    class Test(Base):
+        __tablename__ = "test"
+
+        id = Column(Integer, primary_key=True)
+        name = Column(String, nullable=False, server_default="unnamed")
+
+    # Act
+    fields = fields_from(Test, for_create=True)
+    TestPydantic = pydantic.create_model(Test.__name__, **fields)  # type: ignore[arg-type, var-annotated]
+    test = TestPydantic(id=None, name=None)
+
+    # Assert
+    assert fields["id"][0] == Optional[int]
+    assert fields["name"][0] == Optional[str]
+    assert test.id is None  # type: ignore[attr-defined]
+    assert test.name is None  # type: ignore[attr-defined]
+
+
+def test_read_models_require_server_generated_columns() -> None:
+    # Arrange
+    Base = declarative_base()
+
+    class Test(Base):
+        __tablename__ = "test"
+
+        id = Column(Integer, primary_key=True)
+        created_at = Column(DateTime, nullable=False, server_default=func.now())
+
+    # Act
+    fields = fields_from(Test)
+    TestPydantic = pydantic.create_model(Test.__name__, **fields)  # type: ignore[arg-type, var-annotated]
+
+    # Assert
+    with pytest.raises(pydantic.ValidationError):
+        TestPydantic(id=1)
+    with pytest.raises(pydantic.ValidationError):
+        TestPydantic(id=1, created_at=None)
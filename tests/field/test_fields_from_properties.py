@@ -0,0 +1,186 @@
+# pylint: disable=invalid-name
+from typing import Any, Optional
+
+from sqlalchemy import Column, ForeignKey, Integer, String, create_engine, func, select
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import Session, column_property, composite, declarative_base
+
+from alchemista import compat, fields_from, model_from
+from alchemista.func import nonify
+from alchemista.typing import is_optional
+
+
+class Point:
+    def __init__(self, x: int, y: int) -> None:
+        self.x = x
+        self.y = y
+
+    def __composite_values__(self) -> Any:
+        return self.x, self.y
+
+
+def test_column_property_expressions_are_typed_from_sql_type() -> None:
+    # Arrange
+    Base = declarative_base()
+
+    class Item(Base):
+        __tablename__ = "item"
+
+        id = Column(Integer, primary_key=True)
+        owner_id = Column(Integer, ForeignKey("owner.id"))
+
+    class Owner(Base):
+        __tablename__ = "owner"
+
+        id = Column(Integer, primary_key=True)
+        name = Column(String(64), nullable=False)
+        name_length = column_property(func.char_length(name), doc="Length of the name")
+        item_count = column_property(
+            select(func.count(Item.id)).where(Item.owner_id == id).scalar_subquery(), info=dict(ge=0)
+        )
+        shout = column_property(func.upper(name))
+
+    # Act
+    fields = fields_from(Owner)
+
+    # Assert
+    assert fields["name_length"][0] is Optional[int]
+    assert fields["name_length"][1].default is None
+    assert fields["name_length"][1].description == "Length of the name"
+    assert fields["item_count"][0] is Optional[int]
+    assert compat.field_constraints(fields["item_count"][1])["ge"] == 0
+    assert fields["shout"][0] is Any
+
+
+def test_column_property_values_come_from_the_database() -> None:
+    # Arrange
+    Base = declarative_base()
+
+    class Owner(Base):
+        __tablename__ = "owner"
+
+        id = Column(Integer, primary_key=True)
+        name = Column(String(64), nullable=False)
+        name_length = column_property(func.char_length(name))
+
+    OwnerPydantic = model_from(Owner)
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+
+    # Act
+    with Session(engine) as session:
+        session.add(Owner(id=1, name="someone"))
+        session.commit()
+        owner = compat.from_orm(OwnerPydantic, session.get(Owner, 1))
+
+    # Assert
+    assert getattr(owner, "name_length") == 7
+
+
+def test_hybrid_properties_with_return_annotation() -> None:
+    # Arrange
+    Base = declarative_base()
+
+    class Test(Base):
+        __tablename__ = "test"
+
+        id = Column(Integer, primary_key=True)
+        first = Column(String(32), nullable=False)
+        last = Column(String(32), nullable=False)
+
+        @hybrid_property
+        def full(self) -> str:
+            """Full name"""
+            return f"{self.first} {self.last}"
+
+        @hybrid_property
+        def unannotated(self):  # type: ignore[no-untyped-def]
+            return self.first
+
+    # Act
+    fields = fields_from(Test)
+    TestPydantic = model_from(Test)
+    test = compat.from_orm(TestPydantic, Test(id=1, first="A", last="B"))
+
+    # Assert
+    assert "unannotated" not in fields
+    assert fields["full"][0] is str
+    assert fields["full"][1].default is None
+    assert fields["full"][1].description == "Full name"
+    assert getattr(test, "full") == "A B"
+
+
+def test_hybrid_properties_respect_exclude() -> None:
+    # Arrange
+    Base = declarative_base()
+
+    class Test(Base):
+        __tablename__ = "test"
+
+        id = Column(Integer, primary_key=True)
+
+        @hybrid_property
+        def double(self) -> int:
+            return self.id * 2  # type: ignore[no-any-return]
+
+    # Act
+    fields = fields_from(Test, exclude={"double"})
+
+    # Assert
+    assert list(fields) == ["id"]
+
+
+def test_composites_become_nested_models() -> None:
+    # Arrange
+    Base = declarative_base()
+
+    class Test(Base):
+        __tablename__ = "test"
+
+        id = Column(Integer, primary_key=True)
+        x = Column(Integer, nullable=False)
+        y = Column(Integer, nullable=False)
+        point = composite(Point, x, y)
+
+    # Act
+    TestPydantic = model_from(Test, exclude={"x", "y"})
+    test = compat.from_orm(TestPydantic, Test(id=1, x=2, y=3))
+    schema = compat.json_schema(TestPydantic, by_alias=True, ref_template=compat.DEFAULT_REF_TEMPLATE)
+
+    # Assert
+    assert compat.to_dict(test) == {"id": 1, "point": {"x": 2, "y": 3}}
+    assert schema["properties"] == {
+        "id": {"title": "Id", "type": "integer"},
+        "point": {"$ref": compat.DEFAULT_REF_TEMPLATE.format(model="Point")},
+    }
+    assert set(schema["required"]) == {"id", "point"}
+    assert schema["$defs" if compat.PYDANTIC_V2 else "definitions"] == {
+        "Point": {
+            "title": "Point",
+            "type": "object",
+            "properties": {"x": {"title": "X", "type": "integer"}, "y": {"title": "Y", "type": "integer"}},
+            "required": ["x", "y"],
+        },
+    }
+
+
+def test_nullable_composites_become_optional() -> None:
+    # Arrange
+    Base = declarative_base()
+
+    class Test(Base):
+        __tablename__ = "test"
+
+        id = Column(Integer, primary_key=True)
+        x = Column(Integer)
+        y = Column(Integer)
+        point = composite(Point, x, y)
+
+    # Act
+    fields = fields_from(Test, include={"point"})
+    nonified = fields_from(Test, include={"point"}, transform=nonify)
+
+    # Assert
+    assert is_optional(fields["point"][0])
+    assert fields["point"][1].default is None
+    assert is_optional(nonified["point"][0])
@@ -1,7 +1,7 @@
 import datetime as dt
 import enum
 from decimal import Decimal
-from typing import List, Optional
+from typing import List, Literal, Optional, get_args
 
 import pytest
 from sqlalchemy import Column, Integer, types
@@ -202,3 +202,20 @@ def test_raises_exception_when_type_cannot_be_inferred() -> None:
     assert str(ex.value) == (
         "Could not infer the Python type for column. Check if the column type has a `python_type` in it or in `impl`"
     )
+
+
+def test_string_enums_are_shared_literals() -> None:
+    # Arrange
+    status = Column("status", types.Enum("active", "blocked", name="status"), nullable=False)
+    other = Column("other", types.Enum("active", "blocked", name="other_status"))
+    empty = Column("empty", types.Enum(name="empty"), nullable=False)
+
+    # Act
+    inferred_type = infer_python_type(status)
+    other_type = infer_python_type(other)
+
+    # Assert
+    assert inferred_type == Literal["active", "blocked"]
+    assert other_type == Optional[inferred_type]
+    assert get_args(other_type)[0] is inferred_type
+    assert infer_python_type(empty) is str
@@ -0,0 +1,44 @@
+from sqlalchemy import Column, ForeignKey, Index, Integer, String, UniqueConstraint, func
+from sqlalchemy.orm import column_property, declarative_base
+
+from alchemista.field import is_indexed
+
+Base = declarative_base()
+
+
+class Indexed(Base):
+    __tablename__ = "test"
+    __table_args__ = (Index("ix_test_a_b", "a", "b"), UniqueConstraint("c"))
+
+    id = Column(Integer, primary_key=True)
+    a = Column(Integer)
+    b = Column(Integer)
+    c = Column(String(8))
+    d = Column(String(8), index=True)
+    e = Column(String(8))
+    length = column_property(func.char_length(d))
+
+
+def test_is_indexed() -> None:
+    # Act
+    indexed = {name for name in ("id", "a", "b", "c", "d", "e") if is_indexed(Indexed.__table__.c[name])}
+
+    # Assert
+    assert indexed == {"id", "a", "c", "d"}
+    assert not is_indexed(Indexed.length.expression)
+
+
+def test_foreign_keys_are_not_indexed() -> None:
+    # Arrange
+    class Child(Base):
+        __tablename__ = "child"
+
+        id = Column(Integer, primary_key=True)
+        parent_id = Column(Integer, ForeignKey("test.id"))
+        indexed_parent_id = Column(Integer, ForeignKey("test.id"), index=True)
+
+    # Act
+    indexed = {name for name in ("parent_id", "indexed_parent_id") if is_indexed(Child.__table__.c[name])}
+
+    # Assert
+    assert indexed == {"indexed_parent_id"}
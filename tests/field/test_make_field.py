@@ -3,12 +3,18 @@ import time
 from typing import Any, Dict
 
 import pytest
-from pydantic.fields import Undefined
-from sqlalchemy import Column, Integer, String, Text
+from sqlalchemy import Column, Computed, ForeignKey, Identity, Integer, MetaData, String, Table, Text, func
 
-from alchemista.field import Info, make_field
+from alchemista import compat
+from alchemista.field import Info, is_server_generated, make_field
 
+if compat.PYDANTIC_V2:
+    from pydantic_core import PydanticUndefined as Undefined  # pylint: disable=import-error
+else:
+    from pydantic.fields import Undefined
 
+
+@pytest.mark.skipif(compat.PYDANTIC_V2, reason="asserts attributes of v1 `FieldInfo`")
 def test_info_type_used_as_info() -> None:
     # Arrange
     column = Column(
@@ -48,6 +54,7 @@ def test_info_type_used_as_info() -> None:
     assert field.title == "Multiple of Two"
 
 
+@pytest.mark.skipif(compat.PYDANTIC_V2, reason="asserts attributes of v1 `FieldInfo`")
 @pytest.mark.parametrize(
     "doc,info,expected",
     [
@@ -89,6 +96,7 @@ def test_description(doc: str, info: Dict[str, Any], expected: str) -> None:
     assert field.title is None
 
 
+@pytest.mark.skipif(compat.PYDANTIC_V2, reason="asserts attributes of v1 `FieldInfo`")
 def test_length_comes_from_column_definition() -> None:
     # Arrange
     column = Column(String(64))
@@ -118,6 +126,7 @@ def test_length_comes_from_column_definition() -> None:
     assert field.title is None
 
 
+@pytest.mark.skipif(compat.PYDANTIC_V2, reason="asserts attributes of v1 `FieldInfo`")
 def test_length_from_info_overrides_that_of_column() -> None:
     # Arrange
     max_length = 64
@@ -149,6 +158,7 @@ def test_length_from_info_overrides_that_of_column() -> None:
     assert field.title is None
 
 
+@pytest.mark.skipif(compat.PYDANTIC_V2, reason="asserts attributes of v1 `FieldInfo`")
 def test_default_comes_from_column_definition() -> None:
     # Arrange
     column = Column(Integer, default=2)
@@ -178,6 +188,7 @@ def test_default_comes_from_column_definition() -> None:
     assert field.title is None
 
 
+@pytest.mark.skipif(compat.PYDANTIC_V2, reason="asserts attributes of v1 `FieldInfo`")
 def test_default_from_info_overrides_that_of_column() -> None:
     # Arrange
     column = Column("column", Integer, default=0, info=dict(default=1))
@@ -207,6 +218,7 @@ def test_default_from_info_overrides_that_of_column() -> None:
     assert field.title is None
 
 
+@pytest.mark.skipif(compat.PYDANTIC_V2, reason="asserts attributes of v1 `FieldInfo`")
 def test_default_from_info_overrides_that_of_column_when_none_too() -> None:
     # Arrange
     column = Column("column", Integer, default=None, info=dict(default=1))
@@ -236,6 +248,7 @@ def test_default_from_info_overrides_that_of_column_when_none_too() -> None:
     assert field.title is None
 
 
+@pytest.mark.skipif(compat.PYDANTIC_V2, reason="asserts attributes of v1 `FieldInfo`")
 def test_lambda_as_default_factory() -> None:
     # Arrange
     default_factory = lambda: "dynamic default"
@@ -267,6 +280,7 @@ def test_lambda_as_default_factory() -> None:
     assert field.title is None
 
 
+@pytest.mark.skipif(compat.PYDANTIC_V2, reason="asserts attributes of v1 `FieldInfo`")
 def test_datetime_now_as_default_factory() -> None:
     # Arrange
     default_factory = dt.datetime.now
@@ -304,6 +318,7 @@ def test_datetime_now_as_default_factory() -> None:
     assert field.title is None
 
 
+@pytest.mark.skipif(compat.PYDANTIC_V2, reason="asserts attributes of v1 `FieldInfo`")
 def test_default_factory_from_info_overrides_default_of_column() -> None:
     # Arrange
     expected_factory = lambda: "info default factory"
@@ -351,3 +366,49 @@ def test_default_conflicts_with_default_factory() -> None:
         f"Both `default` and `default_factory` were specified in info of column `{column.name}`."
         " These two attributes are mutually-exclusive"
     )
+
+
+SERVER_GENERATED = [
+    Column(Integer, nullable=False, server_default="0"),
+    Column(Integer, Computed("1 + 1"), nullable=False),
+    Column(Integer, Identity(), nullable=False),
+    Column(String, nullable=False, default=lambda: "python", server_default=func.lower("SERVER")),
+]
+
+
+@pytest.mark.parametrize("column", SERVER_GENERATED)
+def test_server_generated_columns_are_optional_for_create(column: Column) -> None:  # type: ignore[type-arg]
+    # Act
+    field = make_field(column, for_create=True)
+
+    # Assert
+    assert field.default is None
+    assert field.default_factory is None
+
+
+@pytest.mark.parametrize("column", SERVER_GENERATED[:3])
+def test_server_generated_columns_are_required_by_default(column: Column) -> None:  # type: ignore[type-arg]
+    # Act
+    field = make_field(column)
+
+    # Assert
+    assert compat.is_required(field)
+
+
+def test_autoincrement_primary_key_is_optional_for_create() -> None:
+    # Arrange
+    metadata = MetaData()
+    column = Column("id", Integer, primary_key=True)
+    Table("parent", metadata, column)
+    child = Table("child", metadata, Column("id", Integer, ForeignKey("parent.id"), primary_key=True))
+    pair = Table("pair", metadata, Column("a", Integer, primary_key=True), Column("b", Integer, primary_key=True))
+
+    # Act
+    field = make_field(column, for_create=True)
+
+    # Assert
+    assert field.default is None
+    assert compat.is_required(make_field(column))
+    assert is_server_generated(column)
+    assert not is_server_generated(child.c.id)
+    assert not is_server_generated(pair.c.a)
@@ -0,0 +1,126 @@
+import datetime as dt
+import warnings
+from typing import List, Optional
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import Boolean, Column, DateTime, Index, Integer, String, create_engine, insert, select
+from sqlalchemy.orm import declarative_base
+
+from alchemista import compat
+from alchemista.filtering import UnindexedFilterWarning, filter_model_from, index_report, where_from
+
+Base = declarative_base()
+
+
+class Person(Base):
+    __tablename__ = "person"
+    __table_args__ = (Index("ix_person_name_age", "name", "age"),)
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(32), nullable=False)
+    age = Column(Integer)
+    email = Column(String(64), unique=True)
+    active = Column(Boolean, nullable=False, default=True)
+    created_at = Column(DateTime, nullable=False, index=True)
+
+
+def test_filter_model_fields() -> None:
+    # Act
+    model = filter_model_from(Person, include={"id", "name", "active"})
+
+    # Assert
+    assert model.__name__ == "PersonFilter"
+    assert compat.field_names(model) == [
+        "id",
+        "id__in",
+        "id__gt",
+        "id__lt",
+        "name",
+        "name__in",
+        "name__gt",
+        "name__lt",
+        "name__like",
+        "active",
+        "active__in",
+    ]
+    fields = compat.model_fields(model)
+    assert fields["id__in"][0] == Optional[List[int]]
+    assert fields["name__like"][0] == Optional[str]
+    assert all(not compat.is_required(field) for _, field in fields.values())
+
+
+def test_filter_model_validates_values() -> None:
+    # Arrange
+    model = filter_model_from(Person)
+
+    # Act / Assert
+    assert compat.to_dict(model(created_at__gt="2021-01-01T00:00:00"), exclude_none=True) == dict(
+        created_at__gt=dt.datetime(2021, 1, 1)
+    )
+    with pytest.raises(ValidationError):
+        model(age__gt="old")
+    with pytest.raises(ValidationError):
+        model(unknown=1)
+
+
+def test_where_from() -> None:
+    # Arrange
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            insert(Person),
+            [
+                dict(id=i, name=f"n{i}", age=20 + i, email=f"{i}@x", created_at=dt.datetime(2021, 1, i))
+                for i in range(1, 11)
+            ],
+        )
+    model = filter_model_from(Person)
+    filters = model(id__in=[1, 2, 3, 4, 9], age__gt=21, name__like="n%", created_at__lt="2021-01-09T00:00:00")
+
+    # Act
+    with engine.connect() as connection:
+        ids = connection.execute(select(Person.id).where(where_from(filters)).order_by(Person.id)).scalars().all()
+        everyone = connection.execute(select(Person.id).where(where_from(model()))).scalars().all()
+
+    # Assert
+    assert ids == [2, 3, 4]
+    assert len(everyone) == 10
+
+
+def test_index_report() -> None:
+    # Arrange
+    model = filter_model_from(Person)
+
+    # Act
+    report = index_report(model)
+    used = index_report(model(name__like="%a", email="a@x", age__lt=3))
+
+    # Assert
+    assert {name for name, indexed in report.items() if "__" not in name and indexed} == {
+        "id",
+        "name",
+        "email",
+        "created_at",
+    }
+    assert used == dict(age__lt=False, email=True, name__like=False)
+
+
+def test_unindexed_policies() -> None:
+    # Act
+    forbidding = filter_model_from(Person, unindexed="forbid")
+    warning = filter_model_from(Person, unindexed="warn")
+
+    # Assert
+    assert "age" not in compat.field_names(forbidding)
+    assert "age__gt" not in compat.field_names(forbidding)
+    with pytest.raises(ValidationError):
+        forbidding(age=1)
+    with pytest.warns(UnindexedFilterWarning, match="`age__gt`"):
+        where_from(warning(age__gt=1))
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        where_from(warning(name="n"))
+    with pytest.raises(ValueError, match="Unsupported `unindexed` policy"):
+        filter_model_from(Person, unindexed="ignore")
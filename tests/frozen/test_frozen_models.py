@@ -0,0 +1,132 @@
+# pylint: disable=invalid-name
+import pytest
+from sqlalchemy import JSON, Column, Integer, String
+from sqlalchemy.orm import declarative_base
+
+from alchemista import compat, model_from
+from alchemista.frozen import key_of
+
+Base = declarative_base()
+
+
+class Person(Base):
+    __tablename__ = "person"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(32), nullable=False)
+    age = Column(Integer)
+
+
+class Membership(Base):
+    __tablename__ = "membership"
+
+    group = Column(String(16), primary_key=True)
+    person_id = Column("person", Integer, primary_key=True)
+    role = Column(String(16))
+
+
+Frozen = model_from(Person, frozen=True)
+
+
+def test_key_is_the_primary_key_if_included() -> None:
+    # Act / Assert
+    assert key_of(Person, ["id", "name", "age"]) == ("id",)
+    assert key_of(Membership, ["group", "person_id", "role"]) == ("group", "person_id")
+    assert key_of(Person, ["name", "age"]) == ("name", "age")
+
+
+def test_frozen_models_are_immutable() -> None:
+    # Arrange
+    person = Frozen(id=1, name="Alice")
+
+    # Act / Assert
+    with pytest.raises((TypeError, ValueError)):
+        person.name = "Bob"  # type: ignore[misc]
+    assert person.name == "Alice"  # type: ignore[attr-defined]
+
+
+def test_hash_is_that_of_the_primary_key_and_computed_once() -> None:
+    # Arrange
+    person = Frozen(id=1, name="Alice")
+
+    # Act
+    first = hash(person)
+    second = hash(person)
+
+    # Assert
+    assert first == second == hash(1)
+    assert person._hash == first  # type: ignore[attr-defined]  # pylint: disable=protected-access
+
+
+def test_equality_compares_all_fields() -> None:
+    # Arrange
+    person = Frozen(id=1, name="Alice", age=30)
+
+    # Act / Assert
+    assert person == Frozen(id=1, name="Alice", age=30)
+    assert person != Frozen(id=1, name="Alice", age=31)
+    assert person != Frozen(id=2, name="Alice", age=30)
+    assert person != model_from(Person, frozen=True)(id=1, name="Alice", age=30)
+
+
+def test_frozen_models_as_keys_and_set_members() -> None:
+    # Arrange
+    people = [Frozen(id=1, name="Alice"), Frozen(id=2, name="Bob"), Frozen(id=1, name="Alice")]
+
+    # Act
+    unique = set(people)
+    counts = {person: people.count(person) for person in people}
+
+    # Assert
+    assert len(unique) == 2
+    assert counts[Frozen(id=1, name="Alice")] == 2
+
+
+def test_composite_primary_key_and_fallback_to_all_fields() -> None:
+    # Arrange
+    FrozenMembership = model_from(Membership, frozen=True)
+    WithoutKey = model_from(Person, frozen=True, exclude={"id"})
+
+    # Act
+    membership = FrozenMembership(group="admins", person_id=1)
+    person = WithoutKey(name="Alice", age=30)
+
+    # Assert
+    assert hash(membership) == hash(("admins", 1))
+    assert hash(person) == hash(("Alice", 30))
+
+
+def test_unhashable_values_are_left_out_of_the_fallback_hash() -> None:
+    # Arrange
+    class Document(Base):
+        __tablename__ = "document"
+
+        id = Column(Integer, primary_key=True)
+        title = Column(String(32), nullable=False)
+        meta = Column(JSON, nullable=False)
+
+    WithoutKey = model_from(Document, frozen=True, exclude={"id"})
+
+    # Act
+    document = WithoutKey(title="a", meta={"x": 1})
+    same = WithoutKey(title="a", meta={"x": 1})
+    other = WithoutKey(title="a", meta={"x": 2})
+
+    # Assert
+    assert hash(document) == hash(same) == hash(other) == hash(("a",))
+    assert document == same
+    assert document != other
+    assert len({document, same, other}) == 2
+
+
+def test_frozen_trusted_models_from_orm() -> None:
+    # Arrange
+    FrozenTrusted = model_from(Person, frozen=True, trusted=True)
+
+    # Act
+    person = compat.from_orm(FrozenTrusted, Person(id=1, name="Alice", age=30))
+
+    # Assert
+    assert hash(person) == hash(1)
+    assert person == FrozenTrusted(id=1, name="Alice", age=30)
+    assert compat.to_dict(person) == {"id": 1, "name": "Alice", "age": 30}
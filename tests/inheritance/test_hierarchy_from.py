@@ -0,0 +1,143 @@
+# pylint: disable=invalid-name
+from sqlalchemy import Column, ForeignKey, Integer, String, create_engine, select
+from sqlalchemy.orm import Session, declarative_base
+
+from alchemista.inheritance import hierarchy_from
+from alchemista.model import db_model_of, generated_models
+
+
+def test_joined_table_inheritance() -> None:
+    # Arrange
+    Base = declarative_base()
+
+    class Employee(Base):
+        __tablename__ = "employee"
+
+        id = Column(Integer, primary_key=True)
+        kind = Column(String(16), nullable=False)
+        name = Column(String(64), nullable=False)
+        __mapper_args__ = {"polymorphic_on": kind, "polymorphic_identity": "employee"}
+
+    class Engineer(Employee):
+        __tablename__ = "engineer"
+
+        id = Column(Integer, ForeignKey("employee.id"), primary_key=True)
+        language = Column(String(32), nullable=False)
+        __mapper_args__ = {"polymorphic_identity": "engineer"}
+
+    class Manager(Employee):
+        __tablename__ = "manager"
+
+        id = Column(Integer, ForeignKey("employee.id"), primary_key=True)
+        reports = Column(Integer, nullable=False)
+        __mapper_args__ = {"polymorphic_identity": "manager"}
+
+    # Act
+    hierarchy = hierarchy_from(Employee)
+
+    # Assert
+    EmployeePydantic = hierarchy[Employee]
+    EngineerPydantic = hierarchy[Engineer]
+    ManagerPydantic = hierarchy[Manager]
+    assert EmployeePydantic.__name__ == "Employee"
+    assert issubclass(EngineerPydantic, EmployeePydantic)
+    assert issubclass(ManagerPydantic, EmployeePydantic)
+    assert list(EmployeePydantic.__fields__) == ["id", "kind", "name"]
+    assert list(EngineerPydantic.__fields__) == ["id", "kind", "name", "language"]
+    assert list(ManagerPydantic.__fields__) == ["id", "kind", "name", "reports"]
+    assert "language" in EngineerPydantic.__annotations__
+    assert "name" not in EngineerPydantic.__annotations__
+
+
+def test_single_table_inheritance_and_polymorphic_loading() -> None:
+    # Arrange
+    Base = declarative_base()
+
+    class Employee(Base):
+        __tablename__ = "employee"
+
+        id = Column(Integer, primary_key=True)
+        kind = Column(String(16), nullable=False)
+        name = Column(String(64), nullable=False)
+        __mapper_args__ = {"polymorphic_on": kind, "polymorphic_identity": "employee"}
+
+    class Engineer(Employee):
+        language = Column(String(32))
+        __mapper_args__ = {"polymorphic_identity": "engineer"}
+
+    class SeniorEngineer(Engineer):
+        mentees = Column(Integer)
+        __mapper_args__ = {"polymorphic_identity": "senior"}
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    hierarchy = hierarchy_from(Employee, exclude={"kind"})
+
+    # Act
+    with Session(engine) as session:
+        session.add_all(
+            [
+                Employee(id=1, name="A"),
+                Engineer(id=2, name="B", language="Python"),
+                SeniorEngineer(id=3, name="C", language="C++", mentees=2),
+            ]
+        )
+        session.commit()
+        employees = hierarchy.from_orm_all(session.execute(select(Employee).order_by(Employee.id)).scalars())
+
+    # Assert
+    assert [type(employee) for employee in employees] == [
+        hierarchy[Employee],
+        hierarchy[Engineer],
+        hierarchy[SeniorEngineer],
+    ]
+    assert issubclass(hierarchy[SeniorEngineer], hierarchy[Engineer])
+    assert [employee.dict() for employee in employees] == [
+        {"id": 1, "name": "A"},
+        {"id": 2, "name": "B", "language": "Python"},
+        {"id": 3, "name": "C", "language": "C++", "mentees": 2},
+    ]
+
+
+def test_models_without_discriminator_are_picked_by_class() -> None:
+    # Arrange
+    Base = declarative_base()
+
+    class Parent(Base):
+        __tablename__ = "parent"
+        id = Column(Integer, primary_key=True)
+
+    class Child(Parent):
+        __tablename__ = "child"
+        id = Column(Integer, ForeignKey("parent.id"), primary_key=True)
+        age = Column(Integer)
+
+    # Act
+    hierarchy = hierarchy_from(Parent)
+
+    # Assert
+    assert hierarchy.model_for(Child(id=1, age=2)) is hierarchy[Child]
+    assert hierarchy.from_orm(Child(id=1, age=2)).dict() == {"id": 1, "age": 2}
+    assert hierarchy.model_for(Parent(id=1)) is hierarchy[Parent]
+
+
+def test_models_of_subclasses_are_registered() -> None:
+    # Arrange
+    Base = declarative_base()
+
+    class Employee(Base):
+        __tablename__ = "employee"
+
+        id = Column(Integer, primary_key=True)
+        kind = Column(String(16), nullable=False)
+        __mapper_args__ = {"polymorphic_on": kind, "polymorphic_identity": "employee"}
+
+    class Engineer(Employee):
+        __mapper_args__ = {"polymorphic_identity": "engineer"}
+
+    # Act
+    hierarchy = hierarchy_from(Employee)
+
+    # Assert
+    assert db_model_of(hierarchy[Engineer]) is Engineer
+    assert generated_models(Engineer) == [hierarchy[Engineer]]
@@ -0,0 +1,125 @@
+import gc
+import json
+import weakref
+from typing import List, Optional, get_args
+
+import pytest
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import JSON, Column, Integer
+from sqlalchemy.orm import declarative_base
+
+from alchemista import compat, fields_from, model_from
+from alchemista.lazy import LazyJson
+
+Base = declarative_base()
+
+
+class Address(BaseModel):
+    street: str
+    number: int
+
+
+class Document(BaseModel):
+    addresses: List[Address]
+
+
+class Person(Base):
+    __tablename__ = "person"
+
+    id = Column(Integer, primary_key=True)
+    address = Column(JSON, nullable=False, info=dict(json_model=Address))
+    document = Column(JSON, info=dict(json_model=Document))
+    extra = Column(JSON)
+
+
+Model = model_from(Person)
+
+
+def test_json_model_types() -> None:
+    # Act
+    fields = fields_from(Person)
+
+    # Assert
+    assert fields["address"][0] is LazyJson[Address]
+    assert get_args(fields["document"][0]) == (LazyJson[Document], type(None))
+    assert fields["extra"][0] == Optional[dict]
+
+
+def test_documents_are_only_validated_on_access() -> None:
+    # Arrange
+    person = Person(id=1, address={"street": "Main", "number": "12"}, document={"addresses": [{"street": 1}]})
+
+    # Act
+    instance = compat.from_orm(Model, person)
+    address = instance.address  # type: ignore[attr-defined]
+
+    # Assert
+    assert not address.is_validated
+    assert address.value == Address(street="Main", number=12)
+    assert address.value is address.validate()
+    assert address.is_validated
+    with pytest.raises(ValidationError):
+        instance.document.value  # type: ignore[attr-defined]  # pylint: disable=pointless-statement
+
+
+def test_documents_are_serialized_as_they_are() -> None:
+    # Arrange
+    instance = Model(id=1, address='{"street": "Main", "number": "12"}', document=None)
+
+    # Act
+    dumped = json.loads(instance.model_dump_json() if compat.PYDANTIC_V2 else instance.json())
+
+    # Assert
+    assert dumped == dict(id=1, address={"street": "Main", "number": "12"}, document=None, extra=None)
+    assert not instance.address.is_validated  # type: ignore[attr-defined]
+
+
+def test_json_schema_of_documents() -> None:
+    # Act
+    schema = compat.json_schema(Model, by_alias=True, ref_template=compat.DEFAULT_REF_TEMPLATE)
+
+    # Assert
+    assert set(json.dumps(schema["properties"]["address"]).split('"')) >= {"street", "number"}
+
+
+def test_trusted_models_wrap_documents() -> None:
+    # Arrange
+    trusted = model_from(Person, trusted=True)
+    person = Person(id=1, address={"street": "Main", "number": 12})
+
+    # Act
+    instance = trusted.from_orm(person)
+
+    # Assert
+    assert isinstance(instance.address, LazyJson[Address])  # type: ignore[attr-defined]
+    assert instance.address.value.number == 12  # type: ignore[attr-defined]
+    assert LazyJson[Address] is LazyJson[Address]
+
+
+def test_parametrized_classes_are_freed_with_their_models() -> None:
+    # Arrange
+    class Ephemeral(BaseModel):
+        name: str
+
+    lazy_class = LazyJson[Ephemeral]
+    reference = weakref.ref(lazy_class)
+
+    # Act
+    del Ephemeral, lazy_class
+    gc.collect()
+
+    # Assert
+    assert reference() is None
+
+
+@pytest.mark.skipif(compat.PYDANTIC_V2, reason="v2 types serialize themselves")
+def test_json_encoders_are_set_per_model() -> None:
+    # Arrange
+    from pydantic.json import ENCODERS_BY_TYPE  # pylint: disable=import-outside-toplevel
+
+    # Act
+    config = compat.model_config(Model)
+
+    # Assert
+    assert LazyJson in config.json_encoders
+    assert LazyJson not in ENCODERS_BY_TYPE
@@ -0,0 +1,60 @@
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table
+
+from alchemista import compat, fields_from_table, model_from_table
+
+metadata = MetaData()
+
+person = Table(
+    "person_record",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String(8), nullable=False, doc="Name"),
+    Column("age", Integer, info=dict(ge=0)),
+    Column("nickname", String(16), key="alias"),
+)
+
+
+def test_fields_from_table_are_keyed_by_column_key() -> None:
+    # Act
+    fields = fields_from_table(person, exclude={"age"})
+
+    # Assert
+    assert list(fields) == ["id", "name", "alias"]
+
+
+def test_model_from_table() -> None:
+    # Act
+    model = model_from_table(person)
+    instance = model(id=1, name="Ann", age=3)
+
+    # Assert
+    assert model.__name__ == "PersonRecord"
+    assert compat.to_dict(instance) == dict(id=1, name="Ann", age=3, alias=None)
+    schema = compat.json_schema(model, by_alias=True, ref_template=compat.DEFAULT_REF_TEMPLATE)
+    assert schema["properties"]["name"] == {"title": "Name", "type": "string", "maxLength": 8, "description": "Name"}
+    assert schema["required"] == ["id", "name"]
+    with pytest.raises(ValueError):
+        model(id=1, name="Ann", age=-1)
+
+
+def test_model_from_table_with_name_and_include() -> None:
+    # Act
+    model = model_from_table(person, name="Person", include={"id"})
+
+    # Assert
+    assert model.__name__ == "Person"
+    assert compat.field_names(model) == ["id"]
+
+
+@pytest.mark.skipif(compat.PYDANTIC_V2, reason="v2 configurations are dictionaries")
+def test_model_from_table_with_any_class_as_configuration() -> None:
+    # Arrange
+    class Config:
+        title = "Plain"
+
+    # Act
+    model = model_from_table(person, __config__=Config)
+
+    # Assert
+    assert model.schema()["title"] == "Plain"
@@ -0,0 +1,90 @@
+# pylint: disable=invalid-name
+import gc
+import weakref
+from typing import List
+
+from sqlalchemy import Column, Integer, String
+from sqlalchemy.orm import declarative_base
+
+from alchemista import model_from, schema, subset
+from alchemista.model import generated_models
+
+CYCLES = 1000
+STEADY_CYCLES = 200
+
+
+def _create_and_dispose(index: int, generate: bool = True) -> List["weakref.ref[type]"]:
+    Base = declarative_base()
+    Tenant = type(
+        "Tenant",
+        (Base,),
+        dict(
+            __tablename__=f"tenant_{index}",
+            id=Column(Integer, primary_key=True),
+            name=Column(String(32), nullable=False),
+            # a different schema per tenant, so that schemas are not shared between cycles
+            **{f"column_{index}": Column(Integer)},
+        ),
+    )
+    if not generate:
+        Base.registry.dispose()
+        return [weakref.ref(Tenant)]
+    model = model_from(Tenant, trusted=True, precompute_schema=True)
+    model_subset = subset.subset(model, ["id", "name"]).model
+    Base.registry.dispose()
+    return [weakref.ref(Tenant), weakref.ref(model), weakref.ref(model_subset)]
+
+
+def _object_growth(start: int, generate: bool) -> int:
+    gc.collect()
+    before = len(gc.get_objects())
+    for index in range(start, start + STEADY_CYCLES):
+        _create_and_dispose(index, generate)
+    gc.collect()
+    gc.collect()
+    return len(gc.get_objects()) - before
+
+
+def test_generated_models_by_db_model() -> None:
+    # Arrange
+    Base = declarative_base()
+
+    class Test(Base):
+        __tablename__ = "test"
+        id = Column(Integer, primary_key=True)
+
+    # Act
+    models = [model_from(Test), model_from(Test, exclude={"id"})]
+
+    # Assert
+    assert set(generated_models(Test)) == set(models)
+
+
+def test_models_are_freed_over_create_dispose_cycles() -> None:
+    # Arrange
+    references = []
+
+    # Act
+    for index in range(CYCLES):
+        references.extend(_create_and_dispose(index))
+    # the registries only drop their references to the last models while collecting them, freeing them in a second pass
+    gc.collect()
+    gc.collect()
+
+    # Assert
+    assert [reference for reference in references if reference() is not None] == []
+    assert all(not generated.__name__.startswith("Tenant") for generated in generated_models())
+    assert not [key for key in schema._SCHEMAS if key[0] not in schema._REFERENCES]  # pylint: disable=protected-access
+
+
+def test_object_count_is_steady_over_create_dispose_cycles() -> None:
+    # Arrange
+    # SQLAlchemy keeps a few objects per declarative base for good, which the cycles without models account for
+    baseline = _object_growth(0, generate=False)
+
+    # Act
+    growth = _object_growth(STEADY_CYCLES, generate=True)
+
+    # Assert
+    # a single object kept per cycle would add `STEADY_CYCLES`
+    assert growth - baseline < STEADY_CYCLES // 10
@@ -0,0 +1,193 @@
+import datetime as dt
+from typing import Callable, Iterator, List
+
+import pytest
+from pydantic import BaseModel, create_model
+from sqlalchemy import Column, DateTime, Integer, String, create_engine, insert, select, text
+from sqlalchemy.orm import Session, declarative_base
+
+from alchemista import model_from
+from alchemista.pagination import Paginator
+
+Base = declarative_base()
+
+ROWS = 20_000
+
+
+class Event(Base):
+    __tablename__ = "event"
+
+    id = Column(Integer, primary_key=True)
+    kind = Column(String(8), nullable=False)
+    happened_at = Column(DateTime, nullable=False, index=True)
+    note = Column(String(32))
+
+
+class Reading(Base):
+    __tablename__ = "reading"
+
+    sensor = Column(String(8), primary_key=True)
+    number = Column(Integer, primary_key=True)
+    value = Column(Integer, nullable=False)
+
+
+EventModel = model_from(Event)
+ReadingModel = model_from(Reading)
+
+
+@pytest.fixture(name="session")
+def fixture_session() -> Iterator[Session]:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    start = dt.datetime(2021, 1, 1)
+    with engine.begin() as connection:
+        connection.execute(
+            insert(Event),
+            [
+                dict(id=i, kind=f"k{i % 5}", happened_at=start + dt.timedelta(minutes=(i * 7919) % ROWS // 2))
+                for i in range(1, ROWS + 1)
+            ],
+        )
+        connection.execute(
+            insert(Reading), [dict(sensor=f"s{s}", number=n, value=s * n) for s in range(3) for n in range(10)]
+        )
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+def _vm_steps(session: Session) -> Callable[[Callable[[], object]], int]:
+    # SQLite calls the progress handler every N virtual machine instructions, which is a deterministic measure of work
+    connection = session.connection().connection
+
+    def measure(run: Callable[[], object]) -> int:
+        steps = [0]
+
+        def count() -> int:
+            steps[0] += 1
+            return 0
+
+        connection.set_progress_handler(count, 100)
+        try:
+            run()
+        finally:
+            connection.set_progress_handler(None, 100)
+        return steps[0]
+
+    return measure
+
+
+def test_pages_cover_all_rows_in_order(session: Session) -> None:
+    # Arrange
+    paginator = Paginator(EventModel, ["-happened_at"])
+    seen: List[BaseModel] = []
+    cursor = None
+
+    # Act
+    while True:
+        page = paginator.page(session, cursor, limit=1000)
+        seen.extend(page.items)
+        cursor = page.cursor
+        if cursor is None:
+            break
+
+    # Assert
+    assert len(seen) == ROWS
+    keys = [(item.happened_at, item.id) for item in seen]  # type: ignore[attr-defined]
+    assert keys == sorted(keys, key=lambda key: (-key[0].timestamp(), key[1]))
+    assert len({item.id for item in seen}) == ROWS  # type: ignore[attr-defined]
+    assert isinstance(seen[0], EventModel)
+
+
+def test_composite_primary_key(session: Session) -> None:
+    # Arrange
+    paginator = Paginator(ReadingModel)
+
+    # Act
+    first = paginator.page(session, limit=12)
+    second = paginator.page(session, first.cursor, limit=12)
+    last = paginator.page(session, second.cursor, limit=12)
+
+    # Assert
+    assert [(item.sensor, item.number) for item in second.items][:3] == [  # type: ignore[attr-defined]
+        ("s1", 2),
+        ("s1", 3),
+        ("s1", 4),
+    ]
+    assert len(last.items) == 6
+    assert last.cursor is None
+
+
+def test_mixed_directions(session: Session) -> None:
+    # Arrange
+    paginator = Paginator(ReadingModel, ["-sensor"])
+
+    # Act
+    first = paginator.page(session, limit=15)
+    second = paginator.page(session, first.cursor, limit=15)
+
+    # Assert
+    items = [(item.sensor, item.number) for item in first.items + second.items]  # type: ignore[attr-defined]
+    assert items == sorted(items, key=lambda item: (-int(item[0][1:]), item[1]))
+    assert second.cursor is None
+
+
+def test_deep_pages_take_constant_work(session: Session) -> None:
+    # Arrange
+    paginator = Paginator(EventModel, ["happened_at"])
+    measure = _vm_steps(session)
+    cursors = {}
+    cursor = None
+    for number in range(20):
+        page = paginator.page(session, cursor, limit=1000)
+        cursor = cursors[number + 1] = page.cursor
+    offset = select(Event).order_by(Event.happened_at, Event.id).limit(1001)
+
+    # Act
+    shallow = measure(lambda: session.execute(paginator.statement(cursors[1], 1000)).all())
+    deep = measure(lambda: session.execute(paginator.statement(cursors[19], 1000)).all())
+    shallow_offset = measure(lambda: session.execute(offset.offset(1000)).all())
+    deep_offset = measure(lambda: session.execute(offset.offset(19_000)).all())
+
+    # Assert
+    assert deep < shallow * 1.5
+    assert deep_offset > shallow_offset * 5
+    plan = session.execute(
+        text(
+            "EXPLAIN QUERY PLAN "
+            + str(paginator.statement(cursors[19]).compile(compile_kwargs={"literal_binds": True}))
+        )
+    ).all()
+    assert any("USING INDEX" in row[-1] for row in plan)
+    assert not any(row[-1].startswith("SCAN") and "INDEX" not in row[-1] for row in plan)
+
+
+def test_invalid_orderings_and_cursors() -> None:
+    # Arrange
+    paginator = Paginator(EventModel)
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="not indexed"):
+        Paginator(EventModel, ["kind"])
+    with pytest.raises(ValueError, match="nullable"):
+        Paginator(EventModel, ["note"])
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        paginator.decode("not a cursor")
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        paginator.decode(Paginator(EventModel, ["happened_at"]).encode(Event(id=1, happened_at=dt.datetime.now())))
+    with pytest.raises(ValueError, match="Unknown SQLAlchemy model"):
+        Paginator(create_model("Plain", id=(int, ...)))
+    with pytest.raises(ValueError, match="Invalid limit"):
+        paginator.statement(limit=0)
+
+
+def test_cursor_round_trip() -> None:
+    # Arrange
+    paginator = Paginator(EventModel, ["happened_at"])
+    event = Event(id=7, kind="k", happened_at=dt.datetime(2021, 1, 2, 3, 4, 5))
+
+    # Act
+    values = paginator.decode(paginator.encode(event))
+
+    # Assert
+    assert values == [dt.datetime(2021, 1, 2, 3, 4, 5), 7]
@@ -0,0 +1,106 @@
+# pylint: disable=invalid-name
+import json
+
+import pytest
+from sqlalchemy import Column, ForeignKey, Integer, String, Text
+from sqlalchemy.orm import composite, declarative_base
+
+from alchemista import field, model
+from alchemista.__main__ import main
+from alchemista.profiling import STAGES, db_models_of, import_object, profile
+
+Base = declarative_base()
+
+
+class Point:
+    def __init__(self, x: int, y: int) -> None:
+        self.x = x
+        self.y = y
+
+    def __composite_values__(self) -> tuple:  # type: ignore[type-arg]
+        return self.x, self.y
+
+
+class Shop(Base):
+    __tablename__ = "shop"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(64), nullable=False)
+    x = Column(Integer)
+    y = Column(Integer)
+    location = composite(Point, x, y)
+
+
+class Product(Base):
+    __tablename__ = "product"
+
+    id = Column(Integer, primary_key=True)
+    shop_id = Column(Integer, ForeignKey("shop.id"))
+    description = Column(Text)
+
+
+def test_db_models_of_base() -> None:
+    # Act
+    db_models = db_models_of(import_object(f"{__name__}:Base"))
+
+    # Assert
+    assert db_models == [Product, Shop]
+
+
+def test_invalid_import_path() -> None:
+    # Act / Assert
+    with pytest.raises(ValueError, match="module:attribute"):
+        import_object(__name__)
+
+
+def test_profile_measures_each_model() -> None:
+    # Act
+    profiles = profile([Product, Shop])
+
+    # Assert
+    assert len(profiles) == 2
+    product, shop = profiles[0], profiles[1]
+    assert (product.name, product.fields) == ("Product", 3)
+    assert (shop.name, shop.fields) == ("Shop", 5)
+    for measured in profiles:
+        assert set(measured.stages) == set(STAGES)
+        assert all(seconds > 0 for seconds in measured.stages.values())
+        assert measured.seconds >= sum(measured.stages.values())
+        assert measured.peak > 0
+        assert measured.class_size > 0
+
+
+def test_profile_restores_functions() -> None:
+    # Arrange
+    functions = [(module, name, getattr(module, name)) for name, modules in STAGES.items() for module in modules]
+
+    # Act
+    profile([Product])
+
+    # Assert
+    assert all(getattr(module, name) is function for module, name, function in functions)
+    assert field.make_field.__module__ == "alchemista.field"
+    assert model.create_model.__module__.startswith("pydantic")
+
+
+def test_cli_outputs_sorted_table(capsys: pytest.CaptureFixture[str]) -> None:
+    # Act
+    code = main(["profile", f"{__name__}:Base", "--sort", "fields"])
+
+    # Assert
+    lines = capsys.readouterr().out.splitlines()
+    assert code == 0
+    assert lines[0].split()[:3] == ["model", "fields", "ms"]
+    assert [line.split()[0] for line in lines[2:4]] == ["Shop", "Product"]
+    assert set(lines[4]) == {"-", " "}
+    assert lines[-1].split()[1] == "8"
+
+
+def test_cli_outputs_json(capsys: pytest.CaptureFixture[str]) -> None:
+    # Act
+    main(["profile", f"{__name__}:Base", "--json", "--sort", "name"])
+
+    # Assert
+    profiles = json.loads(capsys.readouterr().out)
+    assert [measured["name"] for measured in profiles] == ["Product", "Shop"]
+    assert set(profiles[0]) == {"name", "fields", "seconds", "stages", "allocated", "peak", "class_size"}
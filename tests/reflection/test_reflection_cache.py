@@ -0,0 +1,99 @@
+from pathlib import Path
+from typing import Iterator, List
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, event
+from sqlalchemy.engine import Engine
+
+from alchemista import compat, model_from_table
+from alchemista.reflection import ReflectionCache
+
+
+@pytest.fixture(name="engine")
+def fixture_engine(tmp_path: Path) -> Iterator[Engine]:
+    engine = create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}")
+    metadata = MetaData()
+    Table("person", metadata, Column("id", Integer, primary_key=True), Column("name", String(8), nullable=False))
+    metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def _statements(engine: Engine) -> List[str]:
+    statements: List[str] = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+
+def test_tables_are_reflected_once(engine: Engine, tmp_path: Path) -> None:
+    # Arrange
+    directory = tmp_path / "cache"
+    statements = _statements(engine)
+
+    # Act
+    reflected = ReflectionCache(directory).table(engine, "person")
+    reflections = len(statements)
+    cached = ReflectionCache(directory).table(engine, "person")
+
+    # Assert
+    assert reflections > 0
+    assert len(statements) == reflections
+    assert len(list(directory.glob("*.pickle"))) == 1
+    assert [column.name for column in cached.columns] == ["id", "name"]
+    assert cached.c.name.type.length == 8
+    assert compat.json_schema(model_from_table(cached), by_alias=True, ref_template="{model}") == compat.json_schema(
+        model_from_table(reflected), by_alias=True, ref_template="{model}"
+    )
+
+
+def test_invalidate_and_clear(engine: Engine, tmp_path: Path) -> None:
+    # Arrange
+    cache = ReflectionCache(tmp_path)
+    cache.table(engine, "person")
+    statements = _statements(engine)
+
+    # Act
+    cache.invalidate(engine, "person")
+    cache.table(engine, "person")
+    reflections = len(statements)
+    cache.clear()
+
+    # Assert
+    assert reflections > 0
+    assert not list(tmp_path.glob("*.pickle"))
+
+
+def test_keys_include_the_database_url(engine: Engine, tmp_path: Path) -> None:
+    # Arrange
+    cache = ReflectionCache(tmp_path / "cache")
+    other = create_engine(f"sqlite:///{tmp_path / 'other.sqlite'}")
+    Table("person", MetaData(), Column("id", Integer, primary_key=True)).create(other)
+
+    # Act
+    tables = [cache.table(engine, "person"), cache.table(other, "person")]
+
+    # Assert
+    assert [len(table.columns) for table in tables] == [2, 1]
+    other.dispose()
+
+
+@pytest.mark.parametrize(
+    "content",
+    [b"", b"not a pickle", b"cmissing_module\nTable\n.", b"csqlalchemy\nMissingTable\n."],
+    ids=["empty", "invalid", "missing module", "missing class"],
+)
+def test_unreadable_files_are_reflected_again(engine: Engine, tmp_path: Path, content: bytes) -> None:
+    # Arrange
+    cache = ReflectionCache(tmp_path)
+    cache.table(engine, "person")
+    (path,) = tmp_path.glob("*.pickle")
+    path.write_bytes(content)
+    statements = _statements(engine)
+
+    # Act
+    table = cache.table(engine, "person")
+
+    # Assert
+    assert statements
+    assert [column.name for column in table.columns] == ["id", "name"]
+    assert path.read_bytes() != content
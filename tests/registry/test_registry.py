@@ -0,0 +1,179 @@
+# pylint: disable=invalid-name
+from typing import Iterator
+
+import pytest
+from sqlalchemy import Column, ForeignKey, Integer, String, Table, inspect
+from sqlalchemy.orm import configure_mappers, declarative_base, registry
+
+from alchemista.registry import Registry
+
+
+@pytest.fixture(name="models")
+def fixture_models() -> Iterator[Registry]:
+    models = Registry()
+    yield models
+    models.close()
+
+
+def test_models_are_built_lazily_and_reused(models: Registry) -> None:
+    # Arrange
+    Base = declarative_base()
+
+    class Test(Base):
+        __tablename__ = "test"
+        id = Column(Integer, primary_key=True)
+
+    # Act
+    tracked = models.track(Test, exclude={"id"})
+
+    # Assert
+    assert tracked.stale
+    assert tracked.model is tracked.model
+    assert not tracked.stale
+    assert list(tracked.model.__fields__) == []
+    assert models.tracked(Test) == [tracked]
+
+
+def test_appended_columns_invalidate_only_affected_models(models: Registry) -> None:
+    # Arrange
+    mapper_registry = registry()
+    table_a = Table("a", mapper_registry.metadata, Column("id", Integer, primary_key=True))
+    table_b = Table("b", mapper_registry.metadata, Column("id", Integer, primary_key=True))
+
+    class A:
+        pass
+
+    class B:
+        pass
+
+    mapper_registry.map_imperatively(A, table_a)
+    mapper_registry.map_imperatively(B, table_b)
+    configure_mappers()
+    tracked_a = models.track(A)
+    tracked_b = models.track(B)
+    model_a, model_b = tracked_a.model, tracked_b.model
+
+    # Act
+    table_a.append_column(Column("name", String(32)))
+    inspect(A).add_property("name", table_a.c.name)
+
+    # Assert
+    assert tracked_a.stale
+    assert tracked_a.model is not model_a
+    assert list(tracked_a.model.__fields__) == ["id", "name"]
+    assert tracked_b.model is model_b
+
+
+def test_configuring_new_subclass_mappers_keeps_parent_models(models: Registry) -> None:
+    # Arrange
+    Base = declarative_base()
+
+    class Parent(Base):
+        __tablename__ = "parent"
+        id = Column(Integer, primary_key=True)
+        kind = Column(String(16))
+        __mapper_args__ = {"polymorphic_on": kind, "polymorphic_identity": "parent"}
+
+    configure_mappers()
+    tracked_parent = models.track(Parent)
+    model_parent = tracked_parent.model
+
+    # Act
+    class Child(Parent):
+        __tablename__ = "child"
+        id = Column(Integer, ForeignKey("parent.id"), primary_key=True)
+        name = Column(String(16))
+        __mapper_args__ = {"polymorphic_identity": "child"}
+
+    configure_mappers()
+    tracked_child = models.track(Child)
+
+    # Assert
+    assert tracked_parent.model is model_parent
+    assert list(tracked_child.model.__fields__) == ["id", "kind", "name"]
+
+
+def test_invalidation_reaches_subclasses_and_dependents(models: Registry) -> None:
+    # Arrange
+    Base = declarative_base()
+
+    class Parent(Base):
+        __tablename__ = "parent"
+        id = Column(Integer, primary_key=True)
+        kind = Column(String(16))
+        __mapper_args__ = {"polymorphic_on": kind, "polymorphic_identity": "parent"}
+
+    class Child(Parent):
+        __mapper_args__ = {"polymorphic_identity": "child"}
+
+    class Other(Base):
+        __tablename__ = "other"
+        id = Column(Integer, primary_key=True)
+
+    configure_mappers()
+    tracked_parent = models.track(Parent)
+    tracked_child = models.track(Child)
+    tracked_other = models.track(Other)
+    tracked_dependent = models.track(Other, depends_on=[tracked_parent])
+    for tracked in models.tracked():
+        assert tracked.model
+
+    # Act
+    models.invalidate(Parent)
+
+    # Assert
+    assert tracked_parent.stale
+    assert tracked_child.stale
+    assert tracked_dependent.stale
+    assert not tracked_other.stale
+
+
+def test_close_stops_listening() -> None:
+    # Arrange
+    models = Registry()
+    mapper_registry = registry()
+    table = Table("a", mapper_registry.metadata, Column("id", Integer, primary_key=True))
+
+    class A:
+        pass
+
+    mapper_registry.map_imperatively(A, table)
+    tracked = models.track(A)
+    assert tracked.model
+
+    # Act
+    models.close()
+    table.append_column(Column("name", String(32)))
+
+    # Assert
+    assert not models.listening
+    assert not tracked.stale
+
+
+def test_disposed_mappers_are_no_longer_tracked(models: Registry) -> None:
+    # Arrange
+    Base = declarative_base()
+
+    class Test(Base):
+        __tablename__ = "test"
+        id = Column(Integer, primary_key=True)
+
+    class Other(Base):
+        __tablename__ = "other"
+        id = Column(Integer, primary_key=True)
+
+    other = declarative_base()
+
+    class Kept(other):  # type: ignore[valid-type,misc]
+        __tablename__ = "kept"
+        id = Column(Integer, primary_key=True)
+
+    models.track(Test)
+    models.track(Other)
+    kept = models.track(Kept)
+
+    # Act
+    Base.registry.dispose()
+
+    # Assert
+    assert models.tracked() == [kept]
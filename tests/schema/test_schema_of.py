@@ -0,0 +1,178 @@
+# pylint: disable=invalid-name
+import enum
+
+import pytest
+from sqlalchemy import Column, Enum, Integer, String
+from sqlalchemy.orm import declarative_base
+
+from alchemista import compat, model_from
+from alchemista.config import ForbidExtraConfig
+from alchemista.schema import definitions_of, fingerprint, schema_of
+
+
+def test_identical_models_share_fingerprint_and_schema() -> None:
+    # Arrange
+    Base = declarative_base()
+
+    class Test(Base):
+        __tablename__ = "test"
+
+        id = Column(Integer, primary_key=True)
+        name = Column(String(64), nullable=False)
+
+    # Act
+    TestPydantic1 = model_from(Test)
+    TestPydantic2 = model_from(Test)
+
+    # Assert
+    assert TestPydantic1 is not TestPydantic2
+    assert fingerprint(TestPydantic1) == fingerprint(TestPydantic2)
+    assert schema_of(TestPydantic1) is schema_of(TestPydantic2)
+    assert schema_of(TestPydantic1) == {
+        "title": "Test",
+        "type": "object",
+        "properties": {
+            "id": {"title": "Id", "type": "integer"},
+            "name": {"title": "Name", "type": "string", "maxLength": 64},
+        },
+        "required": ["id", "name"],
+    }
+
+
+@pytest.mark.skipif(compat.PYDANTIC_V2, reason="v2 models don't cache their schema")
+def test_schema_is_stored_in_the_model() -> None:
+    # Arrange
+    Base = declarative_base()
+
+    class Test(Base):
+        __tablename__ = "test"
+
+        id = Column(Integer, primary_key=True)
+
+    TestPydantic = model_from(Test)
+
+    # Act
+    schema = schema_of(TestPydantic)
+
+    # Assert
+    assert TestPydantic.schema() is schema
+
+
+def test_different_models_have_different_fingerprints() -> None:
+    # Arrange
+    Base = declarative_base()
+
+    class Test(Base):
+        __tablename__ = "test"
+
+        id = Column(Integer, primary_key=True)
+        name = Column(String(64), nullable=False)
+
+    # Act
+    TestPydantic = model_from(Test)
+    TestPydanticExclude = model_from(Test, exclude={"name"})
+
+    # Assert
+    assert fingerprint(TestPydantic) != fingerprint(TestPydanticExclude)
+    assert schema_of(TestPydantic) != schema_of(TestPydanticExclude)
+
+
+def test_models_with_different_configurations_have_different_fingerprints() -> None:
+    # Arrange
+    Base = declarative_base()
+
+    class Test(Base):
+        __tablename__ = "test"
+
+        id = Column(Integer, primary_key=True)
+
+    TestPydantic = model_from(Test)
+    TestPydanticForbid = model_from(Test, __config__=ForbidExtraConfig)
+
+    # Act
+    schema = schema_of(TestPydantic)
+    schema_forbid = schema_of(TestPydanticForbid)
+
+    # Assert
+    assert fingerprint(TestPydantic) != fingerprint(TestPydanticForbid)
+    assert "additionalProperties" not in schema
+    assert schema_forbid["additionalProperties"] is False
+    assert (
+        compat.json_schema(TestPydanticForbid, by_alias=True, ref_template=compat.DEFAULT_REF_TEMPLATE) == schema_forbid
+    )
+
+
+def test_enums_with_different_members_have_different_fingerprints() -> None:
+    # Arrange
+    class Color(enum.Enum):
+        RED = "red"
+
+    RedOnly = Color
+    Base1 = declarative_base()
+
+    class Test1(Base1):
+        __tablename__ = "test"
+        id = Column(Integer, primary_key=True)
+        color = Column(Enum(RedOnly))
+
+    class Color(enum.Enum):  # type: ignore[no-redef]  # pylint: disable=function-redefined
+        RED = "red"
+        BLUE = "blue"
+
+    Base2 = declarative_base()
+
+    class Test2(Base2):
+        __tablename__ = "test"
+        id = Column(Integer, primary_key=True)
+        color = Column(Enum(Color))
+
+    # Act / Assert
+    assert fingerprint(model_from(Test1)) != fingerprint(model_from(Test2))
+
+
+def test_precompute_schema(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Arrange
+    Base = declarative_base()
+
+    class Test(Base):
+        __tablename__ = "test"
+
+        id = Column(Integer, primary_key=True)
+
+    # Act
+    TestPydantic = model_from(Test, precompute_schema=True)
+    monkeypatch.setattr(compat, "json_schema", None)
+
+    # Assert
+    assert schema_of(TestPydantic)["title"] == "Test"
+
+
+def test_definitions_share_enums() -> None:
+    # Arrange
+    class Status(enum.Enum):
+        ACTIVE = "active"
+        INACTIVE = "inactive"
+
+    Base = declarative_base()
+
+    class ModelA(Base):
+        __tablename__ = "a"
+        id = Column(Integer, primary_key=True)
+        status = Column(Enum(Status), nullable=False)
+
+    class ModelB(Base):
+        __tablename__ = "b"
+        id = Column(Integer, primary_key=True)
+        status = Column(Enum(Status), nullable=False)
+
+    models = [model_from(ModelA), model_from(ModelB)]
+
+    # Act
+    definitions = definitions_of(models)
+
+    # Assert
+    assert definitions_of(models) is definitions
+    assert set(definitions) == {"ModelA", "ModelB", "Status"}
+    assert definitions["ModelA"]["properties"]["status"] == {"$ref": "#/components/schemas/Status"}
+    assert definitions["ModelB"]["properties"]["status"] == {"$ref": "#/components/schemas/Status"}
+    assert definitions["Status"]["enum"] == ["active", "inactive"]
@@ -0,0 +1,153 @@
+import gc
+from typing import List
+
+import pytest
+from sqlalchemy import Column, Integer, LargeBinary, String, create_engine, event, select
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import Session, declarative_base, deferred
+
+from alchemista import compat, model_from
+from alchemista.binary import Deferred
+from alchemista.subset import _SUBSETS, clear_cache, subset
+
+Base = declarative_base()
+
+
+class Person(Base):
+    __tablename__ = "person"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(8), nullable=False, doc="Name")
+    age = Column(Integer)
+    bio = Column(String(1000))
+
+    @hybrid_property
+    def adult(self) -> bool:
+        return bool(self.age and self.age >= 18)
+
+
+class Photo(Base):
+    __tablename__ = "photo"
+
+    id = Column(Integer, primary_key=True)
+    content = deferred(Column(LargeBinary, nullable=False))
+
+
+Model = model_from(Person)
+
+
+def test_subset_keeps_only_requested_fields() -> None:
+    # Act
+    sub = subset(Model, ["name", "id"])
+
+    # Assert
+    assert compat.field_names(sub.model) == ["id", "name"]
+    assert compat.json_schema(sub.model, by_alias=True, ref_template=compat.DEFAULT_REF_TEMPLATE)["properties"][
+        "name"
+    ] == {"title": "Name", "type": "string", "maxLength": 8, "description": "Name"}
+    with pytest.raises(ValueError):
+        sub.model(id=1, name="too long name")
+
+
+def test_subset_is_cached_by_set_of_names() -> None:
+    # Arrange
+    clear_cache()
+
+    # Act
+    first = subset(Model, ["id", "name"])
+    second = subset(Model, ("name", "id"))
+    other = subset(Model, ["id"])
+
+    # Assert
+    assert first is second
+    assert other.model is not first.model
+    assert list(_SUBSETS[Model]) == [frozenset({"id", "name"}), frozenset({"id"})]
+
+
+def test_subsets_are_freed_with_model() -> None:
+    # Arrange
+    model = model_from(Person)
+    subset(model, ["id"])
+    cached = len(_SUBSETS)
+
+    # Act
+    del model
+    gc.collect()
+
+    # Assert
+    assert len(_SUBSETS) == cached - 1
+
+
+def test_subset_unknown_fields() -> None:
+    # Act / Assert
+    with pytest.raises(ValueError, match="Unknown fields of Person: password"):
+        subset(Model, ["id", "password"])
+
+
+def test_subset_options_only_load_requested_columns() -> None:
+    # Arrange
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    statements: List[str] = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    sub = subset(Model, ["id", "age"])
+
+    # Act
+    with Session(engine) as session:
+        session.add(Person(id=1, name="Ann", age=30, bio="..."))
+        session.commit()
+        statements.clear()
+        person = session.execute(select(Person).options(*sub.options)).scalar_one()
+        instance = compat.from_orm(sub.model, person)
+
+    # Assert
+    assert len(statements) == 1
+    assert "name" not in statements[0] and "bio" not in statements[0]
+    assert compat.to_dict(instance) == dict(id=1, age=30)
+
+
+def test_subset_without_options() -> None:
+    # Act
+    with_hybrid = subset(Model, ["id", "adult"])
+    not_generated = subset(with_hybrid.model, ["id"])
+
+    # Assert
+    assert with_hybrid.options == ()
+    assert not_generated.options == ()
+
+
+def test_subsets_of_trusted_frozen_models_are_trusted_and_frozen() -> None:
+    # Arrange
+    model = model_from(Person, trusted=True, frozen=True)
+    sub = subset(model, ["id", "name"])
+
+    # Act
+    instance = compat.from_orm(sub.model, Person(id=1, name="too long name"))
+    other = compat.from_orm(sub.model, Person(id=1, name="Ann"))
+
+    # Assert
+    assert getattr(instance, "name") == "too long name"
+    assert hash(instance) == hash(other)
+    assert instance != other
+    with pytest.raises((TypeError, ValueError)):
+        setattr(instance, "name", "Ann")
+
+
+def test_subsets_of_zero_copy_models_defer_columns() -> None:
+    # Arrange
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    sub = subset(model_from(Photo, zero_copy=True), ["id", "content"])
+
+    # Act
+    with Session(engine) as session:
+        session.add(Photo(id=1, content=b"photo"))
+        session.commit()
+        session.expunge_all()
+        instance = compat.from_orm(sub.model, session.execute(select(Photo)).scalar_one())
+        handle = getattr(instance, "content")
+        content = handle.load()
+
+    # Assert
+    assert isinstance(handle, Deferred)
+    assert bytes(content) == b"photo"
@@ -0,0 +1,146 @@
+import datetime as dt
+import enum
+from typing import Iterator
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import Boolean, Column, Date, DateTime, Enum, Float, Integer, String, create_engine, func, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import declarative_base
+
+from alchemista.batch import BatchValidator
+from alchemista.synthetic import Synthesizer
+
+np = pytest.importorskip("numpy")
+
+Base = declarative_base()
+
+
+class Status(enum.Enum):
+    ACTIVE = "active"
+    BLOCKED = "blocked"
+
+
+class Account(Base):
+    __tablename__ = "account"
+
+    id = Column(Integer, primary_key=True)
+    username = Column(String(12), nullable=False, unique=True)
+    status = Column(Enum(Status), nullable=False, default=Status.ACTIVE)
+    age = Column(Integer, info=dict(ge=18, le=99))
+    score = Column(Float, nullable=False, info=dict(gt=0, lt=1))
+    verified = Column(Boolean, nullable=False)
+    born = Column(Date)
+    created_at = Column(DateTime, nullable=False)
+    bio = Column(String(200))
+    tier = Column(Enum("free", "pro", name="tier"), nullable=False)
+
+
+@pytest.fixture(name="engine")
+def fixture_engine() -> Iterator[Engine]:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def test_records_are_valid_and_respect_constraints() -> None:
+    # Arrange
+    synthesizer = Synthesizer(Account, seed=1)
+
+    # Act
+    records = synthesizer.records(2000)
+    instances = synthesizer.instances(10)
+
+    # Assert
+    assert len(records) == 2000
+    assert not BatchValidator(synthesizer.model).validate(records).errors
+    assert len({record["id"] for record in records}) == 2000
+    assert len({record["username"] for record in records}) == 2000
+    assert all(len(record["username"]) <= 12 for record in records)
+    ages = [record["age"] for record in records if record["age"] is not None]
+    assert min(ages) >= 18 and max(ages) <= 99
+    scores = [record["score"] for record in records]
+    assert min(scores) > 0 and max(scores) < 1
+    assert {record["status"] for record in records} == set(Status)
+    assert {record["tier"] for record in records} == {"free", "pro"}
+    assert 100 < sum(record["bio"] is None for record in records) < 300
+    assert all(isinstance(record["born"], (dt.date, type(None))) for record in records)
+    assert [instance.id for instance in instances] == list(range(2001, 2011))  # type: ignore[attr-defined]
+
+
+def test_records_are_reproducible() -> None:
+    # Act
+    first = Synthesizer(Account, seed=42).records(50)
+    second = Synthesizer(Account, seed=42).records(50)
+    other = Synthesizer(Account, seed=7).records(50)
+
+    # Assert
+    assert first == second
+    assert first != other
+
+
+def test_invalid_records() -> None:
+    # Arrange
+    synthesizer = Synthesizer(Account, seed=3)
+
+    # Act
+    records = synthesizer.invalid_records(500)
+
+    # Assert
+    for record in records:
+        with pytest.raises(ValidationError):
+            synthesizer.model(**record)
+    assert len(BatchValidator(synthesizer.model).validate(records).errors) == 500
+
+
+def test_invalid_records_of_fields_that_accept_none() -> None:
+    # Arrange
+    class Setting(Base):
+        __tablename__ = "setting"
+
+        id = Column(Integer, primary_key=True)
+        # Pydantic v1 accepts `None` for fields whose default is `None`, even if their type isn't `Optional`
+        value = Column(Integer, nullable=False, info=dict(default=None))
+        label = Column(String, nullable=False)
+
+    synthesizer = Synthesizer(Setting, seed=7)
+
+    # Act
+    records = synthesizer.invalid_records(100)
+
+    # Assert
+    for record in records:
+        with pytest.raises(ValidationError):
+            synthesizer.model(**record)
+
+
+def test_insert(engine: Engine) -> None:
+    # Arrange
+    synthesizer = Synthesizer(Account, seed=5)
+
+    # Act
+    inserted = synthesizer.insert(engine, 25_000, batch_size=4096)
+
+    # Assert
+    with engine.connect() as connection:
+        count = connection.execute(select(func.count()).select_from(Account)).scalar_one()
+        usernames = connection.execute(select(func.count(Account.username.distinct()))).scalar_one()
+    assert inserted == count == usernames == 25_000
+
+
+def test_overrides_and_underivable_fields() -> None:
+    # Arrange
+    class Coded(Base):
+        __tablename__ = "coded"
+
+        id = Column(Integer, primary_key=True)
+        code = Column(String(4), nullable=False, info=dict(regex="^[A-Z]{4}$"))
+
+    # Act
+    synthesizer = Synthesizer(Coded, overrides=dict(code=lambda rng, size: ["ABCD"] * size))
+
+    # Assert
+    assert synthesizer.records(2) == [dict(id=1, code="ABCD"), dict(id=2, code="ABCD")]
+    with pytest.raises(ValueError, match="`regex` of `code`"):
+        Synthesizer(Coded)
@@ -0,0 +1,88 @@
+# pylint: disable=invalid-name
+import dataclasses
+import sys
+from typing import Optional
+
+import pytest
+from sqlalchemy import Column, Integer, String
+from sqlalchemy.orm import declarative_base
+
+from alchemista.targets import dataclass_from, from_orm, namedtuple_from, struct_from
+
+Base = declarative_base()
+
+
+class Thing(Base):
+    __tablename__ = "thing"
+
+    id = Column(Integer, primary_key=True)
+    age = Column(Integer, default=0, nullable=False)
+    tags = Column(String(16), nullable=False, info=dict(default_factory=lambda: "none"))
+    name = Column(String(8), nullable=False)
+    nickname = Column(String(8))
+
+
+def test_dataclass_from() -> None:
+    # Act
+    TestDataclass = dataclass_from(Thing)
+    test = TestDataclass(id=1, name="name")
+
+    # Assert
+    assert [field.name for field in dataclasses.fields(TestDataclass)] == ["id", "name", "age", "tags", "nickname"]
+    assert {field.name: field.type for field in dataclasses.fields(TestDataclass)} == {
+        "id": int,
+        "name": str,
+        "age": int,
+        "tags": str,
+        "nickname": Optional[str],
+    }
+    assert dataclasses.asdict(test) == {"id": 1, "name": "name", "age": 0, "tags": "none", "nickname": None}
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        test.id = 2  # type: ignore[attr-defined]
+    if sys.version_info >= (3, 10):
+        assert not hasattr(test, "__dict__")
+
+
+def test_namedtuple_from() -> None:
+    # Act
+    TestNamedTuple = namedtuple_from(Thing, exclude={"id"})
+    test = TestNamedTuple(name="name", tags="a")  # type: ignore[call-arg]  # pylint: disable=not-callable
+
+    # Assert
+    assert TestNamedTuple._fields == ("name", "tags", "age", "nickname")  # type: ignore[attr-defined]  # pylint: disable=no-member
+    assert test == ("name", "a", 0, None)
+    with pytest.raises(TypeError):
+        TestNamedTuple(name="name")  # type: ignore[call-arg]  # pylint: disable=not-callable
+
+
+def test_struct_from() -> None:
+    # Arrange
+    msgspec = pytest.importorskip("msgspec")
+
+    # Act
+    TestStruct = struct_from(Thing)
+    test = TestStruct(id=1, name="name")
+
+    # Assert
+    assert TestStruct.__struct_fields__ == ("id", "name", "age", "tags", "nickname")  # type: ignore[attr-defined]
+    assert msgspec.structs.asdict(test) == {"id": 1, "name": "name", "age": 0, "tags": "none", "nickname": None}
+    assert msgspec.json.decode(b'{"id": 1, "name": "short"}', type=TestStruct) == TestStruct(id=1, name="short")
+    with pytest.raises(msgspec.ValidationError):
+        msgspec.json.decode(b'{"id": 1, "name": "too long name"}', type=TestStruct)
+
+
+def test_from_orm() -> None:
+    # Arrange
+    TestDataclass = dataclass_from(Thing)
+    TestNamedTuple = namedtuple_from(Thing)
+    test_db = Thing(id=1, age=2, tags="a", name="name", nickname=None)
+
+    # Act
+    test_dataclass = from_orm(TestDataclass, test_db)
+    test_namedtuple = from_orm(TestNamedTuple, test_db)
+
+    # Assert
+    assert test_dataclass == TestDataclass(id=1, age=2, tags="a", name="name", nickname=None)
+    assert test_namedtuple == TestNamedTuple(  # type: ignore  # pylint: disable=not-callable
+        id=1, age=2, tags="a", name="name", nickname=None
+    )
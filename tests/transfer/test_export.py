@@ -0,0 +1,130 @@
+# pylint: disable=invalid-name
+import csv
+import datetime as dt
+import json
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from sqlalchemy import Column, DateTime, Float, Integer, String, create_engine, insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import declarative_base
+
+from alchemista import model_from
+from alchemista.transfer import MANIFEST, export, partitions_of
+
+Base = declarative_base()
+
+
+class Order(Base):
+    __tablename__ = "order"
+
+    id = Column(Integer, primary_key=True)
+    customer = Column(String(16), nullable=False)
+    total = Column(Float)
+    placed_at = Column(DateTime, nullable=False)
+
+
+class Line(Base):
+    __tablename__ = "line"
+
+    order_id = Column(Integer, primary_key=True)
+    number = Column(Integer, primary_key=True)
+    product = Column(String(16))
+
+
+@pytest.fixture(name="engine")
+def fixture_engine(tmp_path: Path) -> Iterator[Engine]:
+    engine = create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}")
+    Base.metadata.create_all(engine)
+    orders = [
+        dict(
+            id=i,
+            customer=f"c{i % 7}",
+            total=None if i % 10 == 0 else i / 4,
+            placed_at=dt.datetime(2021, 1, 1) + dt.timedelta(hours=i),
+        )
+        for i in range(1, 1001)
+    ]
+    lines = [dict(order_id=i, number=n, product=f"p{n}") for i in range(1, 51) for n in range(1, 4)]
+    with engine.begin() as connection:
+        connection.execute(insert(Order), orders)
+        connection.execute(insert(Line), lines)
+    yield engine
+    engine.dispose()
+
+
+def test_partitions_of_splits_primary_key_ranges(engine: Engine) -> None:
+    # Act
+    partitions = partitions_of(Order, engine, 4)
+
+    # Assert
+    assert [(partition.lower, partition.upper) for partition in partitions] == [
+        (None, (251,)),
+        ((251,), (501,)),
+        ((501,), (751,)),
+        ((751,), None),
+    ]
+
+
+def test_export_ndjson(engine: Engine, tmp_path: Path) -> None:
+    # Arrange
+    path = tmp_path / "out"
+
+    # Act
+    manifest = export(Order, path, engine=engine, workers=3, batch_size=100)
+
+    # Assert
+    assert manifest["rows"] == 1000
+    assert manifest["fields"] == ["id", "customer", "total", "placed_at"]
+    assert json.loads((path / MANIFEST).read_text()) == manifest
+    assert [file["file"] for file in manifest["files"]] == [
+        "part-00000.ndjson",
+        "part-00001.ndjson",
+        "part-00002.ndjson",
+    ]
+    records = [
+        json.loads(line) for file in manifest["files"] for line in (path / file["file"]).read_text().splitlines()
+    ]
+    assert [record["id"] for record in records] == list(range(1, 1001))
+    assert records[0] == dict(id=1, customer="c1", total=0.25, placed_at="2021-01-01T01:00:00")
+    assert records[9]["total"] is None
+    assert sum(file["rows"] for file in manifest["files"]) == 1000
+
+
+def test_export_csv_with_composite_primary_key(engine: Engine, tmp_path: Path) -> None:
+    # Act
+    manifest = export(Line, tmp_path, engine=engine, format="csv", workers=4)
+
+    # Assert
+    rows = []
+    for file in manifest["files"]:
+        with open(tmp_path / file["file"], encoding="utf-8", newline="") as csv_file:
+            reader = csv.reader(csv_file)
+            assert next(reader) == ["order_id", "number", "product"]
+            rows.extend(reader)
+    assert manifest["primary_key"] == ["order_id", "number"]
+    assert len(rows) == 150
+    assert rows[:4] == [["1", "1", "p1"], ["1", "2", "p2"], ["1", "3", "p3"], ["2", "1", "p1"]]
+    assert len({(row[0], row[1]) for row in rows}) == 150
+
+
+def test_export_parquet_with_model_fields(engine: Engine, tmp_path: Path) -> None:
+    # Arrange
+    pq = pytest.importorskip("pyarrow.parquet")
+    model = model_from(Order, exclude={"total"})
+
+    # Act
+    manifest = export(Order, tmp_path, engine=engine, format="parquet", workers=2, model=model, batch_size=64)
+
+    # Assert
+    tables = [pq.read_table(tmp_path / file["file"]) for file in manifest["files"]]
+    assert [table.column_names for table in tables] == [["id", "customer", "placed_at"]] * 2
+    assert sum(table.num_rows for table in tables) == 1000
+    assert tables[1].column("id").to_pylist()[-1] == 1000
+
+
+def test_export_unsupported_format(engine: Engine, tmp_path: Path) -> None:
+    # Act / Assert
+    with pytest.raises(ValueError, match="Unsupported format `xml`"):
+        export(Order, tmp_path, engine=engine, format="xml")
@@ -0,0 +1,220 @@
+import datetime as dt
+import json
+import mmap
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Any, Iterator, List
+
+import pytest
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String, create_engine, insert, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import declarative_base
+
+from alchemista import model_from, transfer
+from alchemista.transfer import export, import_file
+
+Base = declarative_base()
+
+
+class Order(Base):
+    __tablename__ = "order"
+
+    id = Column(Integer, primary_key=True)
+    customer = Column(String(8), nullable=False)
+    total = Column(Float, info=dict(ge=0))
+    placed_at = Column(DateTime, nullable=False)
+
+
+class Ticket(Base):
+    __tablename__ = "ticket"
+
+    id = Column(Integer, primary_key=True)
+    title = Column(String(32), nullable=False)
+    status = Column(String(8), nullable=False, server_default="open")
+
+
+class Employee(Base):
+    __tablename__ = "employee"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(32), nullable=False)
+    kind = Column(String(16))
+
+    __mapper_args__ = {"polymorphic_on": kind, "polymorphic_identity": "employee"}
+
+
+class Manager(Employee):
+    __tablename__ = "manager"
+
+    id = Column(Integer, ForeignKey("employee.id"), primary_key=True)
+    reports = Column(Integer, nullable=False)
+
+    __mapper_args__ = {"polymorphic_identity": "manager"}
+
+
+@pytest.fixture(name="engine")
+def fixture_engine(tmp_path: Path) -> Iterator[Engine]:
+    engine = create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def _write_ndjson(path: Path) -> None:
+    lines = [
+        json.dumps(dict(id=i, customer=f"c{i % 7}", total=i / 4, placed_at=f"2021-01-01T{i % 24:02d}:00:00"))
+        for i in range(1, 101)
+    ]
+    lines[9] = json.dumps(dict(id=10, customer="too long name", placed_at="2021-01-01T00:00:00"))
+    lines[19] = json.dumps(dict(id=20, customer="c", total=-1, placed_at="2021-01-01T00:00:00"))
+    lines[29] = "{not json"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_import_ndjson(engine: Engine, tmp_path: Path) -> None:
+    # Arrange
+    path = tmp_path / "orders.ndjson"
+    _write_ndjson(path)
+
+    # Act
+    stats = import_file(Order, path, engine=engine, chunk_size=16)
+
+    # Assert
+    with engine.connect() as connection:
+        ids = connection.execute(select(Order.id).order_by(Order.id)).scalars().all()
+        first = connection.execute(select(Order.__table__).where(Order.id == 1)).one()
+    assert ids == [i for i in range(1, 101) if i not in (10, 20, 30)]
+    assert first.placed_at == dt.datetime(2021, 1, 1, 1)
+    assert stats.inserted == 97
+    assert stats.rejected == 3
+    assert stats.read.rows == 100
+    assert stats.validate.rows == 99
+    assert stats.write.rows == 97
+    rejects = [json.loads(line) for line in (tmp_path / "orders.rejects.ndjson").read_text().splitlines()]
+    assert sorted(reject["line"] for reject in rejects) == [10, 20, 30]
+    by_line = {reject["line"]: reject for reject in rejects}
+    assert [error["loc"] for error in by_line[10]["errors"]] == [["customer"]]
+    assert [error["loc"] for error in by_line[20]["errors"]] == [["total"]]
+    assert by_line[30]["record"] == "{not json"
+
+
+def test_import_csv_round_trip(engine: Engine, tmp_path: Path) -> None:
+    # Arrange
+    rows = [
+        dict(id=i, customer=f"c{i}", total=None if i % 3 == 0 else i * 1.5, placed_at=dt.datetime(2021, 1, i))
+        for i in range(1, 21)
+    ]
+    with engine.begin() as connection:
+        connection.execute(insert(Order), rows)
+    manifest = export(Order, tmp_path, engine=engine, format="csv", workers=1)
+    with engine.begin() as connection:
+        connection.execute(Order.__table__.delete())
+
+    # Act
+    stats = import_file(Order, tmp_path / manifest["files"][0]["file"], engine=engine)
+
+    # Assert
+    with engine.connect() as connection:
+        imported = [dict(row) for row in connection.execute(select(Order.__table__).order_by(Order.id)).mappings()]
+    assert imported == rows
+    assert stats.rejected == 0
+    assert not list(tmp_path.glob("*.rejects.ndjson"))
+
+
+def test_import_reads_large_files_through_mmap(engine: Engine, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Arrange
+    path = tmp_path / "orders.ndjson"
+    _write_ndjson(path)
+    monkeypatch.setattr(transfer, "MMAP_THRESHOLD", 1)
+    mapped: List[int] = []
+    mmap_class = mmap.mmap
+
+    def spy(fileno: int, length: int, **kwargs: Any) -> mmap.mmap:
+        mapped.append(fileno)
+        return mmap_class(fileno, length, **kwargs)
+
+    monkeypatch.setattr(mmap, "mmap", spy)
+
+    # Act
+    stats = import_file(Order, path, engine=engine, rejects=tmp_path / "rejects.ndjson")
+
+    # Assert
+    assert len(mapped) == 1
+    assert stats.inserted == 97
+    assert (tmp_path / "rejects.ndjson").exists()
+    assert stats.validate.rows_per_second > 0
+
+
+@pytest.mark.skipif(sys.version_info < (3, 9), reason="`tracemalloc.reset_peak` requires Python 3.9")
+def test_import_measures_peak_memory(engine: Engine, tmp_path: Path) -> None:
+    # Arrange
+    path = tmp_path / "orders.ndjson"
+    _write_ndjson(path)
+    tracemalloc.start()
+
+    # Act
+    try:
+        stats = import_file(Order, path, engine=engine)
+    finally:
+        tracemalloc.stop()
+
+    # Assert
+    assert stats.read.peak_memory is not None
+    assert stats.write.peak_memory is not None
+    assert stats.validate.peak_memory is not None
+
+
+def test_import_leaves_missing_columns_to_server_defaults(engine: Engine, tmp_path: Path) -> None:
+    # Arrange
+    path = tmp_path / "tickets.ndjson"
+    records = [dict(id=1, title="Broken"), dict(id=2, title="Closed", status="closed"), dict(id=3, title="Slow")]
+    path.write_text("\n".join(json.dumps(record) for record in records) + "\n", encoding="utf-8")
+
+    # Act
+    stats = import_file(Ticket, path, engine=engine, model=model_from(Ticket, for_create=True))
+
+    # Assert
+    with engine.connect() as connection:
+        imported = connection.execute(select(Ticket.id, Ticket.status).order_by(Ticket.id)).all()
+    assert stats.inserted == 3
+    assert [tuple(row) for row in imported] == [(1, "open"), (2, "closed"), (3, "open")]
+
+
+def test_import_unsupported_format(engine: Engine, tmp_path: Path) -> None:
+    # Act / Assert
+    with pytest.raises(ValueError, match="Unsupported format `txt`"):
+        import_file(Order, tmp_path / "orders.txt", engine=engine)
+
+
+def test_import_replaces_rejects_of_previous_imports(engine: Engine, tmp_path: Path) -> None:
+    # Arrange
+    path = tmp_path / "orders.ndjson"
+    _write_ndjson(path)
+    import_file(Order, path, engine=engine)
+    path.write_text(json.dumps(dict(id=101, customer="c", placed_at="2021-01-01T00:00:00")) + "\n", encoding="utf-8")
+
+    # Act
+    stats = import_file(Order, path, engine=engine)
+
+    # Assert
+    assert stats.rejected == 0
+    assert not (tmp_path / "orders.rejects.ndjson").exists()
+
+
+def test_import_to_joined_table_inheritance(engine: Engine, tmp_path: Path) -> None:
+    # Arrange
+    path = tmp_path / "managers.ndjson"
+    records = [dict(id=1, name="Alice", reports=3), dict(id=2, name="Bob", reports=1)]
+    path.write_text("\n".join(json.dumps(record) for record in records) + "\n", encoding="utf-8")
+
+    # Act
+    stats = import_file(Manager, path, engine=engine)
+
+    # Assert
+    with engine.connect() as connection:
+        employees = connection.execute(select(Employee.__table__).order_by(Employee.id)).all()
+        managers = connection.execute(select(Manager.__table__).order_by(Manager.id)).all()
+    assert stats.inserted == 2
+    assert [tuple(row) for row in employees] == [(1, "Alice", "manager"), (2, "Bob", "manager")]
+    assert [tuple(row) for row in managers] == [(1, 3), (2, 1)]
@@ -0,0 +1,111 @@
+# pylint: disable=invalid-name
+import datetime as dt
+from decimal import Decimal
+from typing import Iterator
+
+import pydantic
+import pytest
+from sqlalchemy import Column, DateTime, Float, Integer, Numeric, String, create_engine
+from sqlalchemy.orm import Session, declarative_base
+
+from alchemista import model_from
+from alchemista.trusted import set_validation
+
+Base = declarative_base()
+
+
+class Thing(Base):
+    __tablename__ = "thing"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(4), nullable=False)
+    price = Column(Numeric(asdecimal=False))
+    ratio = Column(Float(asdecimal=True))
+    created_at = Column(DateTime(timezone=True))
+    updated_at = Column(DateTime)
+
+
+@pytest.fixture(name="validation")
+def fixture_validation() -> Iterator[None]:
+    set_validation(True)
+    yield
+    set_validation(False)
+
+
+def test_trusted_from_orm_skips_constraint_checks() -> None:
+    # Arrange
+    ThingPydantic = model_from(Thing, trusted=True)
+
+    # Act
+    test = ThingPydantic.from_orm(Thing(id=1, name="too long"))
+
+    # Assert
+    assert test.dict() == {
+        "id": 1,
+        "name": "too long",
+        "price": None,
+        "ratio": None,
+        "created_at": None,
+        "updated_at": None,
+    }
+    assert test.__fields_set__ == {"id", "name", "price", "ratio", "created_at", "updated_at"}
+
+
+def test_trusted_from_orm_with_database_values() -> None:
+    # Arrange
+    ThingPydantic = model_from(Thing, trusted=True)
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    created_at = dt.datetime(2021, 6, 1, 12, 0, tzinfo=dt.timezone.utc)
+    updated_at = dt.datetime(2021, 6, 2, 12, 0)
+
+    # Act
+    with Session(engine) as session:
+        session.add(
+            Thing(id=1, name="test", price=Decimal("1.5"), ratio=0.25, created_at=created_at, updated_at=updated_at)
+        )
+        session.commit()
+        test = ThingPydantic.from_orm(session.get(Thing, 1))
+
+    # Assert
+    assert isinstance(getattr(test, "price"), float)
+    assert getattr(test, "price") == 1.5
+    assert isinstance(getattr(test, "ratio"), Decimal)
+    assert getattr(test, "ratio") == Decimal("0.25")
+    assert getattr(test, "created_at") == created_at
+    assert getattr(test, "updated_at") == updated_at
+    assert getattr(test, "updated_at").tzinfo is None
+
+
+def test_trusted_from_orm_coerces_mismatched_numbers() -> None:
+    # Arrange
+    ThingPydantic = model_from(Thing, trusted=True)
+
+    # Act
+    test = ThingPydantic.from_orm(Thing(id=1, name="test", price=Decimal("1.5"), ratio=0.25))
+
+    # Assert
+    assert isinstance(getattr(test, "price"), float)
+    assert getattr(test, "price") == 1.5
+    assert isinstance(getattr(test, "ratio"), Decimal)
+    assert getattr(test, "ratio") == Decimal("0.25")
+
+
+@pytest.mark.usefixtures("validation")
+def test_validation_toggle_falls_back_to_full_validation() -> None:
+    # Arrange
+    ThingPydantic = model_from(Thing, trusted=True)
+
+    # Act / Assert
+    with pytest.raises(pydantic.ValidationError):
+        ThingPydantic.from_orm(Thing(id=1, name="too long"))
+    assert getattr(ThingPydantic.from_orm(Thing(id=1, name="ok")), "name") == "ok"
+
+
+def test_untrusted_models_are_validated() -> None:
+    # Arrange
+    ThingPydantic = model_from(Thing)
+
+    # Act / Assert
+    with pytest.raises(pydantic.ValidationError):
+        ThingPydantic.from_orm(Thing(id=1, name="too long"))
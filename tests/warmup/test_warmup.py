@@ -0,0 +1,96 @@
+import gc
+import os
+from typing import Iterator
+
+import pytest
+from sqlalchemy import Column, Integer, String
+from sqlalchemy.orm import declarative_base
+
+from alchemista import compat, model_from
+from alchemista.registry import Registry
+from alchemista.warmup import SMAPS_ROLLUP, memory_usage, shared_memory, warmup
+
+Base = declarative_base()
+
+
+class Person(Base):
+    __tablename__ = "person"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(64), nullable=False)
+
+
+@pytest.fixture(name="registry")
+def fixture_registry() -> Iterator[Registry]:
+    registry = Registry(listen=False)
+    yield registry
+    gc.unfreeze()
+
+
+def test_warmup_builds_tracked_models(registry: Registry) -> None:
+    # Arrange
+    tracked = registry.track(Person, trusted=True)
+    generated = model_from(Person)
+
+    # Act
+    report = warmup(registry, freeze=False)
+
+    # Assert
+    assert not tracked.stale
+    assert report.built == 1
+    assert report.models >= 2
+    assert report.schemas == report.models
+    assert report.frozen == 0
+    if not compat.PYDANTIC_V2:
+        assert generated.__schema_cache__  # type: ignore[attr-defined]
+
+
+def test_warmup_does_not_rebuild_built_models(registry: Registry) -> None:
+    # Arrange
+    tracked = registry.track(Person)
+    model = tracked.model
+
+    # Act
+    report = warmup(registry, schemas=False, freeze=False)
+
+    # Assert
+    assert report.built == 0
+    assert report.schemas == 0
+    assert tracked.model is model
+
+
+def test_warmup_freezes_objects(registry: Registry) -> None:
+    # Arrange
+    registry.track(Person)
+
+    # Act
+    report = warmup(registry)
+
+    # Assert
+    assert report.frozen > 0
+    assert gc.get_freeze_count() > 0
+
+
+@pytest.mark.skipif(not os.path.exists(SMAPS_ROLLUP) or not hasattr(os, "fork"), reason="requires /proc and fork")
+def test_forked_worker_shares_memory(registry: Registry) -> None:
+    # Arrange
+    registry.track(Person)
+    report = warmup(registry)
+    read, write = os.pipe()
+
+    # Act
+    pid = os.fork()
+    if pid == 0:  # pragma: no cover
+        os.write(write, str(shared_memory()).encode())
+        os._exit(0)  # pylint: disable=protected-access
+    os.close(write)
+    with os.fdopen(read) as pipe:
+        shared = int(pipe.read())
+    os.waitpid(pid, 0)
+
+    # Assert
+    assert report.rss is not None and report.shared is not None and report.private is not None
+    assert report.private > 0
+    assert report.shared + report.private <= report.rss
+    assert memory_usage() is not None
+    assert shared > 0